@@ -0,0 +1,49 @@
+"""Compare `compile_path` against plain `dig` calls.
+
+Run it with ``poetry run python benchmarks/bench_compile_path.py``.
+"""
+
+import timeit
+
+from py_data_digger import compile_path, dig
+
+NASTY_DICT = {
+    "machines": [
+        {
+            "machine_id": "1234567890",
+            "engine": {
+                "id": "321abcde",
+                "name": "Motor XPTO",
+                "components": [
+                    {"id": "0942323", "name": "Cog"},
+                    {"id": "1642723", "name": "Piston"},
+                ],
+            },
+        }
+    ]
+}
+HIT = ("machines", 0, "engine", "components")
+MISS = ("machines", 0, "engine_2", "components")
+NUMBER = 200_000
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<28} {seconds / NUMBER * 1e9:8.1f} ns/call")
+
+
+def main() -> None:
+    """Time hits and misses with both APIs."""
+    for label, accessors in (("hit", HIT), ("miss", MISS)):
+        path = compile_path(*accessors)
+        _report(
+            f"dig ({label})",
+            timeit.timeit(lambda a=accessors: dig(NASTY_DICT, *a), number=NUMBER),
+        )
+        _report(
+            f"compiled dig ({label})",
+            timeit.timeit(lambda p=path: p.dig(NASTY_DICT), number=NUMBER),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Measure how `dig_many(..., workers=N)` scales with threads.
+
+On regular CPython the GIL keeps the speedup near 1x; on free-threaded builds
+(like 3.13t) it should grow with the number of threads.
+Run it with ``poetry run python benchmarks/bench_threads.py [max_threads]``.
+"""
+
+import os
+import sys
+import time
+
+from py_data_digger import dig_many
+
+RECORDS = [
+    {"machines": [{"engine": {"components": [{"id": number}]}}]} if number % 3 else {}
+    for number in range(300_000)
+]
+ACCESSORS = ("machines", 0, "engine", "components", 0, "id")
+
+
+def _run(workers: int) -> float:
+    began = time.perf_counter()
+    for _ in dig_many(RECORDS, *ACCESSORS, workers=workers):
+        pass
+    return time.perf_counter() - began
+
+
+def main() -> None:
+    """Time the same batch from one thread up to max_threads."""
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    baseline = _run(1)
+    workers = 1
+    while workers <= max_threads:
+        seconds = _run(workers)
+        print(f"{workers:>3} threads {seconds:8.3f}s  speedup {baseline / seconds:5.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
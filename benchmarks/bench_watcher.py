@@ -0,0 +1,125 @@
+"""Compare `PathWatcher` against digging every path and comparing it with its last value.
+
+A poller fetches the same large document over and over, and a single watched value changes
+between polls. Documents are either freshly parsed copies, like JSON fetched every few
+seconds, or the same document changed in place.
+Run it with ``poetry run python benchmarks/bench_watcher.py``.
+"""
+
+import json
+import time
+from typing import Callable, Iterator
+
+from py_data_digger import PathWatcher, compile_paths, dig
+
+MACHINES = 2000
+WATCHED_MACHINES = 20
+POLLS = 50
+
+
+def _document() -> dict:
+    return {
+        "machines": [
+            {
+                "machine_id": f"{number:010d}",
+                "engine": {
+                    "name": f"Motor {number}",
+                    "hours": number * 10,
+                    "components": [{"id": f"{number}-{part}", "weight": part * 1.5} for part in range(20)],
+                },
+            }
+            for number in range(MACHINES)
+        ],
+        "total": MACHINES,
+    }
+
+
+def _paths() -> dict:
+    paths = {"total": ("total",)}
+    for number in range(WATCHED_MACHINES):
+        engine = ("machines", number, "engine")
+        paths[f"engine_{number}"] = engine
+        paths[f"name_{number}"] = (*engine, "name")
+        paths[f"hours_{number}"] = (*engine, "hours")
+        paths[f"first_component_{number}"] = (*engine, "components", 0, "id")
+    return paths
+
+
+def _change(document: dict, poll: int) -> None:
+    document["machines"][poll % WATCHED_MACHINES]["engine"]["hours"] += poll
+
+
+def _fresh_copies() -> Callable[[], Iterator[dict]]:
+    text = json.dumps(_document())
+    documents = []
+    for poll in range(POLLS):
+        document = json.loads(text)
+        _change(document, poll)
+        documents.append(document)
+    return lambda: iter(documents)
+
+
+def _changed_in_place() -> Callable[[], Iterator[dict]]:
+    def polls() -> Iterator[dict]:
+        document = _document()
+
+        def changes() -> Iterator[dict]:
+            for poll in range(POLLS):
+                _change(document, poll)
+                yield document
+
+        return changes()
+
+    return polls
+
+
+def _dig_each(paths: dict, polls: Iterator[dict]) -> int:
+    first = next(polls)
+    last = {name: dig(first, *accessors) for name, accessors in paths.items()}
+    changed = 0
+    for document in polls:
+        for name, accessors in paths.items():
+            value = dig(document, *accessors)
+            if value != last[name]:
+                changed += 1
+            last[name] = value
+    return changed
+
+
+def _dig_paths(paths: dict, polls: Iterator[dict]) -> int:
+    trie = compile_paths(paths)
+    last = trie.dig(next(polls))
+    changed = 0
+    for document in polls:
+        values = trie.dig(document)
+        changed += sum(1 for name, value in values.items() if value != last[name])
+        last = values
+    return changed
+
+
+def _watch(paths: dict, polls: Iterator[dict]) -> int:
+    watcher = PathWatcher(paths)
+    watcher.update(next(polls))
+    return sum(len(watcher.update(document)) for document in polls)
+
+
+def main() -> None:
+    """Time each way of detecting changes over the same polls."""
+    paths = _paths()
+    print(f"{len(paths)} paths, {MACHINES} machines, {POLLS} polls")
+    scenarios = (("fresh copies", _fresh_copies()), ("changed in place", _changed_in_place()))
+    detections = (("dig each path", _dig_each), ("dig_paths", _dig_paths), ("PathWatcher", _watch))
+    for scenario, polls in scenarios:
+        print(scenario)
+        for name, detect in detections:
+            best = float("inf")
+            for _ in range(5):
+                documents = polls()
+                began = time.perf_counter()
+                changed = detect(paths, documents)
+                best = min(best, time.perf_counter() - began)
+            print(f"  {name:<14} {best / (POLLS - 1) * 1e6:9.1f} us/poll  ({changed} changes found)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Synthetic nested documents, with paths to dig in them."""
+
+import random
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+SUBSCRIPT_KINDS = ("dict", "list", "tuple")
+OBJECT_KINDS = ("dict", "list", "tuple", "object", "model")
+MISSING_KEY = "missing_key"
+
+
+class PlainObject:
+    """Object holding its children as attributes."""
+
+    def __init__(self, **attributes: object) -> None:
+        self.__dict__.update(attributes)
+
+
+@lru_cache(maxsize=None)
+def _model_class(fan_out: int) -> Optional[type]:
+    try:
+        from pydantic import create_model
+    except ImportError:
+        return None
+    return create_model(
+        f"SyntheticModel{fan_out}", **{f"attr_{i}": (Any, None) for i in range(fan_out)}
+    )
+
+
+def make_document(
+    depth: int = 5,
+    fan_out: int = 4,
+    kinds: Sequence[str] = SUBSCRIPT_KINDS,
+    seed: int = 0,
+) -> object:
+    """Build a tree of the given container kinds, with strings and ints as leaves.
+
+    Kinds may be 'dict', 'list', 'tuple', 'object' (plain objects) and 'model' (Pydantic
+    models, skipped when Pydantic isn't installed).
+    """
+    rng = random.Random(seed)
+    if "model" in kinds and _model_class(fan_out) is None:
+        kinds = [kind for kind in kinds if kind != "model"]
+
+    def node(level: int) -> object:
+        if level == depth:
+            return rng.choice((f"leaf string {rng.random()}", rng.randrange(1_000_000)))
+        children = [node(level + 1) for _ in range(fan_out)]
+        kind = rng.choice(kinds)
+        if kind == "dict":
+            return {f"key_{i}": child for i, child in enumerate(children)}
+        if kind == "list":
+            return children
+        if kind == "tuple":
+            return tuple(children)
+        attributes = {f"attr_{i}": child for i, child in enumerate(children)}
+        if kind == "object":
+            return PlainObject(**attributes)
+        return _model_class(fan_out)(**attributes)
+
+    return node(0)
+
+
+def _accessors_of(node: object) -> List[object]:
+    if isinstance(node, dict):
+        return list(node)
+    if isinstance(node, (list, tuple)):
+        return [*range(len(node)), -1]
+    if isinstance(node, str):
+        return [0, -1] if len(node) > 1 else []
+    if hasattr(node, "__dict__"):
+        return [name for name in vars(node) if name.startswith("attr_")]
+    return []
+
+
+def _step(node: object, accessor: object) -> object:
+    if isinstance(node, (dict, list, tuple, str)):
+        return node[accessor]
+    return getattr(node, accessor)
+
+
+def _missing_accessor(node: object, objects: bool) -> object:
+    # With objects, a missing index would be looked up as an attribute, and getattr only takes strings
+    if isinstance(node, (list, tuple, str)) and not objects:
+        return len(node) + 10
+    return MISSING_KEY
+
+
+def make_paths(
+    document: object,
+    count: int = 1000,
+    miss_ratio: float = 0.0,
+    seed: int = 0,
+    objects: bool = False,
+) -> List[Tuple[object, ...]]:
+    """Pick random paths down to the leaves, spoiling one accessor of miss_ratio of them.
+
+    Paths to be sought with objects=True are only spoiled with missing names.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(count):
+        node = document
+        path = []
+        nodes = []
+        while accessors := _accessors_of(node):
+            accessor = rng.choice(accessors)
+            nodes.append(node)
+            path.append(accessor)
+            node = _step(node, accessor)
+        if path and rng.random() < miss_ratio:
+            position = rng.randrange(len(path))
+            path[position] = _missing_accessor(nodes[position], objects)
+        paths.append(tuple(path))
+    return paths
@@ -0,0 +1,163 @@
+"""Benchmark suite for seek and dig over synthetic nested documents.
+
+Run it from the repository root:
+
+    poetry run python -m benchmarks.suite --output results.json
+    poetry run python -m benchmarks.suite --compare before.json after.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Sequence
+
+from benchmarks.generator import OBJECT_KINDS, SUBSCRIPT_KINDS, make_document, make_paths
+from py_data_digger import SeekError, compile_path, dig, seek
+
+
+def _chained_subscripts(path: Sequence[object]) -> Callable[[object], object]:
+    """Build the hand written equivalent of seek, like data['a'][0]['b']."""
+    code = "lambda data: data" + "".join(f"[{accessor!r}]" for accessor in path)
+    return eval(code)  # noqa: S307
+
+
+def _seek_all(document: object, paths: List[tuple], objects: bool) -> Callable[[], None]:
+    def run() -> None:
+        for path in paths:
+            try:  # noqa: SIM105 - contextlib.suppress would add its own cost
+                seek(document, *path, seek_objects=objects)
+            except SeekError:
+                pass
+
+    return run
+
+
+def _dig_all(document: object, paths: List[tuple], objects: bool) -> Callable[[], None]:
+    def run() -> None:
+        for path in paths:
+            dig(document, *path, dig_objects=objects)
+
+    return run
+
+
+def _compiled_dig_all(document: object, paths: List[tuple], objects: bool) -> Callable[[], None]:
+    compiled = [compile_path(*path, objects=objects).dig for path in paths]
+
+    def run() -> None:
+        for compiled_dig in compiled:
+            compiled_dig(document)
+
+    return run
+
+
+def _baseline_all(document: object, paths: List[tuple]) -> Callable[[], None]:
+    getters = [_chained_subscripts(path) for path in paths]
+
+    def run() -> None:
+        for getter in getters:
+            try:  # noqa: SIM105 - contextlib.suppress would add its own cost
+                getter(document)
+            except (TypeError, IndexError, KeyError, ValueError):
+                pass
+
+    return run
+
+
+def build_cases(args: argparse.Namespace) -> Dict[str, Callable[[], None]]:
+    """Create every benchmarked case, named after the function and the kind of lookups."""
+    cases = {}
+    documents = {
+        "subscripts": make_document(args.depth, args.fan_out, SUBSCRIPT_KINDS, args.seed),
+        "objects": make_document(args.depth, args.fan_out, OBJECT_KINDS, args.seed),
+    }
+    for label, miss_ratio in (("hit", 0.0), ("miss", 1.0), ("mixed", args.miss_ratio)):
+        for data_kind, document in documents.items():
+            objects = data_kind == "objects"
+            paths = make_paths(document, args.paths, miss_ratio, args.seed, objects)
+            suffix = f"{data_kind}/{label}"
+            cases[f"seek/{suffix}"] = _seek_all(document, paths, objects)
+            cases[f"dig/{suffix}"] = _dig_all(document, paths, objects)
+            cases[f"compiled_dig/{suffix}"] = _compiled_dig_all(document, paths, objects)
+            if not objects:
+                cases[f"baseline/{suffix}"] = _baseline_all(document, paths)
+    return cases
+
+
+def run_suite(args: argparse.Namespace) -> dict:
+    """Time every case and gather the results with the environment they ran in."""
+    results = []
+    for name, case in build_cases(args).items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=args.repeat))
+        ns_per_lookup = seconds / (args.number * args.paths) * 1e9
+        results.append({"name": name, "ns_per_lookup": round(ns_per_lookup, 2)})
+        print(f"{name:<36} {ns_per_lookup:10.1f} ns/lookup")
+
+    try:
+        from importlib.metadata import version
+
+        package_version = version("py-data-digger")
+    except Exception:
+        package_version = "unknown"
+
+    return {
+        "environment": {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "py_data_digger": package_version,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "parameters": {
+            "depth": args.depth,
+            "fan_out": args.fan_out,
+            "paths": args.paths,
+            "miss_ratio": args.miss_ratio,
+            "number": args.number,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print how each case changed between two saved result files."""
+    with open(before_path, encoding="utf-8") as file:
+        before = {r["name"]: r["ns_per_lookup"] for r in json.load(file)["results"]}
+    with open(after_path, encoding="utf-8") as file:
+        after = {r["name"]: r["ns_per_lookup"] for r in json.load(file)["results"]}
+
+    for name in (name for name in before if name in after):
+        ratio = after[name] / before[name]
+        print(f"{name:<36} {before[name]:10.1f} -> {after[name]:10.1f} ns ({ratio:5.2f}x)")
+
+
+def main() -> None:
+    """Parse the command line and run or compare benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fan-out", type=int, default=4)
+    parser.add_argument("--paths", type=int, default=500)
+    parser.add_argument("--miss-ratio", type=float, default=0.3)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Where to save the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = run_suite(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,158 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, List
 
 from py_data_digger.main import SeekError, dig, seek
 
-__all__ = ["SeekError", "dig", "seek"]
+if TYPE_CHECKING:
+    from py_data_digger.aio import adig, adig_paths, aseek
+    from py_data_digger.batch import dig_many, seek_many
+    from py_data_digger.bury import BuryError, bury, bury_paths
+    from py_data_digger.column import Column, dig_array, dig_column
+    from py_data_digger.compiled import CompiledPath, compile_path
+    from py_data_digger.etree import clear_xml_index, dig_xml, seek_xml
+    from py_data_digger.index import DigIndex
+    from py_data_digger.json_stream import dig_json, seek_json
+    from py_data_digger.jsonl import ChunkReport, dig_jsonl
+    from py_data_digger.memo import DigMemo, MemoStats
+    from py_data_digger.metrics import MetricsRegistry, disable_metrics, enable_metrics, get_metrics
+    from py_data_digger.msgpack_buffer import MsgpackExt, dig_msgpack, seek_msgpack
+    from py_data_digger.paths import PathTrie, compile_paths, dig_paths
+    from py_data_digger.profiling import DigProfile, PathProfile, profile
+    from py_data_digger.schema import CompiledSchema, SchemaRecord, compile_schema
+    from py_data_digger.search import find_paths
+    from py_data_digger.syntax import (
+        PathCacheInfo,
+        PathSyntaxError,
+        clear_path_cache,
+        dig_path,
+        parse_path,
+        path_cache_info,
+        seek_path,
+    )
+    from py_data_digger.view import DigView
+    from py_data_digger.watch import PathChange, PathWatcher
+
+# Only seek and dig are imported with the package. Everything else is imported from its
+# module the first time it's used, so `import py_data_digger` stays as fast as seek and dig
+# alone, whatever the other modules import.
+_LAZY_NAMES = {
+    "BuryError": "bury",
+    "ChunkReport": "jsonl",
+    "Column": "column",
+    "CompiledPath": "compiled",
+    "CompiledSchema": "schema",
+    "DigIndex": "index",
+    "DigMemo": "memo",
+    "DigProfile": "profiling",
+    "DigView": "view",
+    "MemoStats": "memo",
+    "MetricsRegistry": "metrics",
+    "MsgpackExt": "msgpack_buffer",
+    "PathCacheInfo": "syntax",
+    "PathChange": "watch",
+    "PathProfile": "profiling",
+    "PathSyntaxError": "syntax",
+    "PathTrie": "paths",
+    "PathWatcher": "watch",
+    "SchemaRecord": "schema",
+    "adig": "aio",
+    "adig_paths": "aio",
+    "aseek": "aio",
+    "bury": "bury",
+    "bury_paths": "bury",
+    "clear_path_cache": "syntax",
+    "clear_xml_index": "etree",
+    "compile_path": "compiled",
+    "compile_paths": "paths",
+    "compile_schema": "schema",
+    "dig_array": "column",
+    "dig_column": "column",
+    "dig_json": "json_stream",
+    "dig_jsonl": "jsonl",
+    "dig_many": "batch",
+    "dig_msgpack": "msgpack_buffer",
+    "dig_path": "syntax",
+    "dig_paths": "paths",
+    "dig_xml": "etree",
+    "disable_metrics": "metrics",
+    "enable_metrics": "metrics",
+    "find_paths": "search",
+    "get_metrics": "metrics",
+    "parse_path": "syntax",
+    "path_cache_info": "syntax",
+    "profile": "profiling",
+    "seek_json": "json_stream",
+    "seek_many": "batch",
+    "seek_msgpack": "msgpack_buffer",
+    "seek_path": "syntax",
+    "seek_xml": "etree",
+}
+
+__all__ = [
+    "BuryError",
+    "ChunkReport",
+    "Column",
+    "CompiledPath",
+    "CompiledSchema",
+    "DigIndex",
+    "DigMemo",
+    "DigProfile",
+    "DigView",
+    "MemoStats",
+    "MetricsRegistry",
+    "MsgpackExt",
+    "PathCacheInfo",
+    "PathChange",
+    "PathProfile",
+    "PathSyntaxError",
+    "PathTrie",
+    "PathWatcher",
+    "SchemaRecord",
+    "SeekError",
+    "adig",
+    "adig_paths",
+    "aseek",
+    "bury",
+    "bury_paths",
+    "clear_path_cache",
+    "clear_xml_index",
+    "compile_path",
+    "compile_paths",
+    "compile_schema",
+    "dig",
+    "dig_array",
+    "dig_column",
+    "dig_json",
+    "dig_jsonl",
+    "dig_many",
+    "dig_msgpack",
+    "dig_path",
+    "dig_paths",
+    "dig_xml",
+    "disable_metrics",
+    "enable_metrics",
+    "find_paths",
+    "get_metrics",
+    "parse_path",
+    "path_cache_info",
+    "profile",
+    "seek",
+    "seek_json",
+    "seek_many",
+    "seek_msgpack",
+    "seek_path",
+    "seek_xml",
+]
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
+    value = getattr(import_module(f"py_data_digger.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,182 @@
+from inspect import isawaitable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from py_data_digger.main import (
+    _LOOKUP_ERRORS,
+    _MISSING,
+    SeekError,
+    _access,
+    _look_for_object_attribute,
+)
+from py_data_digger.paths import PathTrie, _Node, _trie_root
+
+# asyncio is imported when adig_paths runs rather than with the package: it takes longer
+# to import than all of py_data_digger, and seeking awaitables never needs it otherwise.
+if TYPE_CHECKING:
+    import asyncio
+
+
+async def _resolve(value: object, semaphore: "Optional[asyncio.Semaphore]" = None) -> object:
+    while isawaitable(value):
+        if semaphore is None:
+            value = await value
+        else:
+            async with semaphore:
+                value = await value
+    return value
+
+
+async def aseek(
+    data: Union[Sequence, Mapping],
+    *accessors: List[Any],
+    seek_objects: bool = False,
+) -> object:
+    """Navigate through the data, awaiting every awaitable found along the way.
+
+    Works like `seek`, but coroutines, tasks and futures (the data itself, the values
+    in the middle of the path and the value found) are awaited before going further.
+    Keep in mind that a coroutine can only be awaited once: prefer tasks or futures for
+    values that will be sought more than once.
+
+    Parameters:
+      data: The list, tuple, dict to be searched, or an awaitable giving it
+      accessors: The keys, indexes or attribute names (only if seek_objects is True) to be accessed
+      seek_objects: If seek_objects is True, also tries to get an attribute of an object
+      with the given name
+
+    Raises:
+      SeekError: if there is no key, index or attribute with a given accessor. The exception message
+      will provide details on where it could not access.
+
+    Examples:
+    .. code-block:: python
+      my_dict = {
+      'item_a': asyncio.ensure_future(fetch_fruits()),  # ['apple', 'pea']
+      }
+
+      await aseek(my_dict, 'item_a', 0)
+      >>> 'apple'
+    """
+    data = await _resolve(data)
+    result = data
+    for index, accessor in enumerate(accessors):
+        try:
+            result = result[accessor]
+        except _LOOKUP_ERRORS as e:
+            if seek_objects:
+                result = _look_for_object_attribute(result, data, accessors, index)
+            else:
+                raise SeekError(index, data, accessors, e) from e
+        result = await _resolve(result)
+    return result
+
+
+async def adig(
+    data: Union[Sequence, Mapping],
+    *accessors: List[Any],
+    dig_objects: bool = False,
+    default: object = None,
+) -> object:
+    """Safely navigate through the data, awaiting every awaitable found along the way.
+
+    Works like `dig`, but coroutines, tasks and futures are awaited before going further,
+    just like in `aseek`. Errors raised by the awaitables themselves are not caught.
+
+    Parameters:
+      data: The list, tuple, dict to be searched, or an awaitable giving it
+      accessors: The keys, indexes or attribute names (only if dig_objects is True) to be accessed
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      default: The value returned when the search fails. By default it's None.
+
+    Examples:
+    .. code-block:: python
+      await adig(my_dict, 'item_a', 0)
+      >>> 'apple'
+
+      await adig(my_dict, 'item_b', 0)
+      >>> None
+    """
+    result = await _resolve(data)
+    for accessor in accessors:
+        result = _access(result, accessor, dig_objects)
+        if result is _MISSING:
+            return default
+        result = await _resolve(result)
+    return result
+
+
+async def _walk(
+    node: _Node,
+    value: object,
+    results: dict,
+    objects: bool,
+    semaphore: "Optional[asyncio.Semaphore]",
+) -> None:
+    import asyncio
+
+    value = await _resolve(value, semaphore)
+    for name in node.names:
+        results[name] = value
+    branches = []
+    for accessor, child in node.children:
+        found = _access(value, accessor, objects)
+        if found is not _MISSING:
+            branches.append(_walk(child, found, results, objects, semaphore))
+    if branches:
+        await asyncio.gather(*branches)
+
+
+async def adig_paths(
+    data: Union[Sequence, Mapping],
+    paths: Union[Mapping[Hashable, Iterable[Any]], PathTrie],
+    dig_objects: bool = False,
+    default: object = None,
+    concurrency: Optional[int] = None,
+) -> Dict[Hashable, object]:
+    """Safely navigate through many paths of the data at once, awaiting awaitables concurrently.
+
+    Works like `dig_paths`: shared prefixes are walked (and awaited) only once. Independent
+    branches are resolved concurrently with asyncio.gather, so their I/O latency overlaps.
+
+    Parameters:
+      data: The list, tuple, dict to be searched, or an awaitable giving it
+      paths: A mapping of result names to their sequences of accessors, or a PathTrie built by
+      compile_paths
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      default: The value given to each path when its search fails. By default it's None.
+      concurrency: The most awaitables awaited at the same time. By default there is no limit.
+
+    Raises:
+      ValueError: if concurrency is given and lower than 1.
+
+    Examples:
+    .. code-block:: python
+      await adig_paths(document, {
+          'owner': ('owner', 'name'),          # document['owner'] is a pending future
+          'parts': ('inventory', 'parts', 0),  # and so is document['inventory']
+      }, concurrency=10)
+      >>> {'owner': 'John Doe', 'parts': 'Cog'}
+    """
+    import asyncio
+
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f"concurrency must be a positive integer, got {concurrency!r}")  # noqa: TRY003
+    if not isinstance(paths, PathTrie):
+        paths = PathTrie(paths)
+    semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+    results = dict.fromkeys(paths.names, default)
+    await _walk(_trie_root(paths), data, results, dig_objects, semaphore)
+    return results
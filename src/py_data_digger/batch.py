@@ -0,0 +1,185 @@
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from py_data_digger.compiled import CompiledPath, compile_path
+from py_data_digger.main import SeekError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+_THREAD_BATCH_SIZE = 1024
+
+
+def seek_many(
+    records: Iterable,
+    *accessors: List[Any],
+    seek_objects: bool = False,
+    chunk_size: Optional[int] = None,
+    with_index: bool = False,
+    workers: Optional[int] = None,
+) -> Iterator:
+    """Lazily navigate through every record of an iterable.
+
+    Records are consumed one at a time, so generators and file readers are streamed
+    with constant memory.
+
+    Parameters:
+      records: Any iterable of lists, tuples, dicts to be searched
+      accessors: The keys, indexes or attribute names (only if seek_objects is True) to be accessed
+      seek_objects: If seek_objects is True, also tries to get an attribute of an object
+      with the given name
+      chunk_size: If given, yields lists with up to chunk_size results instead of single results
+      with_index: If with_index is True, yields (index, value) pairs, where index is the position
+      of the record in the iterable
+      workers: If given, records are sought in batches by a pool of this many threads. Results
+      keep the order of the records. Worth it on free-threaded Python builds.
+
+    Raises:
+      SeekError: when the first record without the given path is reached.
+
+    Examples:
+    .. code-block:: python
+      records = [{'id': 1}, {'id': 2}, {'id': 3}]
+
+      list(seek_many(records, 'id'))
+      >>> [1, 2, 3]
+
+      list(seek_many(records, 'id', chunk_size=2, with_index=True))
+      >>> [[(0, 1), (1, 2)], [(2, 3)]]
+    """
+    _check_chunk_size(chunk_size)
+    path = compile_path(*accessors, objects=seek_objects)
+    if workers is None:
+        results = _seek_each(path, records)
+    else:
+        results = _in_threads(lambda batch: _seek_batch(path, batch), records, workers)
+    return _shape(results, chunk_size, with_index)
+
+
+def dig_many(
+    records: Iterable,
+    *accessors: List[Any],
+    dig_objects: bool = False,
+    default: object = None,
+    chunk_size: Optional[int] = None,
+    with_index: bool = False,
+    workers: Optional[int] = None,
+) -> Iterator:
+    """Lazily and safely navigate through every record of an iterable.
+
+    Records are consumed one at a time, so generators and file readers are streamed
+    with constant memory.
+
+    Parameters:
+      records: Any iterable of lists, tuples, dicts to be searched
+      accessors: The keys, indexes or attribute names (only if dig_objects is True) to be accessed
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      default: The value yielded when the search fails. By default it's None.
+      chunk_size: If given, yields lists with up to chunk_size results instead of single results
+      with_index: If with_index is True, yields (index, value) pairs, where index is the position
+      of the record in the iterable
+      workers: If given, records are dug in batches by a pool of this many threads. Results
+      keep the order of the records. Worth it on free-threaded Python builds.
+
+    Examples:
+    .. code-block:: python
+      records = [{'id': 1}, {'name': 'no id'}, {'id': 3}]
+
+      list(dig_many(records, 'id'))
+      >>> [1, None, 3]
+
+      list(dig_many(records, 'id', default=0, with_index=True))
+      >>> [(0, 1), (1, 0), (2, 3)]
+    """
+    _check_chunk_size(chunk_size)
+    path = compile_path(*accessors, objects=dig_objects)
+    if workers is None:
+        results = _dig_each(path, records, default)
+    else:
+        results = _in_threads(
+            lambda batch: (list(_dig_each(path, batch, default)), None), records, workers
+        )
+    return _shape(results, chunk_size, with_index)
+
+
+def _seek_each(path: CompiledPath, records: Iterable) -> Iterator:
+    seek = path.seek
+    for record in records:
+        yield seek(record)
+
+
+def _dig_each(path: CompiledPath, records: Iterable, default: object) -> Iterator:
+    dig = path.dig
+    for record in records:
+        yield dig(record, default=default)
+
+
+def _in_threads(
+    process_batch: Callable[[list], Tuple[list, Optional[Exception]]],
+    records: Iterable,
+    workers: int,
+) -> Iterator:
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers!r}")  # noqa: TRY003
+    return _run_in_threads(process_batch, records, workers)
+
+
+def _run_in_threads(
+    process_batch: Callable[[list], Tuple[list, Optional[Exception]]],
+    records: Iterable,
+    workers: int,
+) -> Iterator:
+    # Imported here, since concurrent.futures takes about as long to import as the package
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Only a few batches per thread are in flight, so memory stays bounded
+    window = workers * 2
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        queue: deque = deque()
+        for batch in _chunked(iter(records), _THREAD_BATCH_SIZE):
+            queue.append(pool.submit(process_batch, batch))
+            if len(queue) >= window:
+                yield from _batch_results(queue.popleft())
+        while queue:
+            yield from _batch_results(queue.popleft())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _batch_results(future: "Future") -> Iterator:
+    results, error = future.result()
+    yield from results
+    if error is not None:
+        raise error
+
+
+def _seek_batch(path: CompiledPath, batch: list) -> Tuple[list, Optional[SeekError]]:
+    # The error is handed back with the results before it, so they are still yielded in order
+    results = []
+    for record in batch:
+        try:
+            results.append(path.seek(record))
+        except SeekError as e:
+            return results, e
+    return results, None
+
+
+def _shape(results: Iterator, chunk_size: Optional[int], with_index: bool) -> Iterator:
+    if with_index:
+        results = enumerate(results)
+    if chunk_size is not None:
+        results = _chunked(results, chunk_size)
+    return results
+
+
+def _chunked(results: Iterator, chunk_size: int) -> Iterator[list]:
+    while chunk := list(islice(results, chunk_size)):
+        yield chunk
+
+
+def _check_chunk_size(chunk_size: Optional[int]) -> None:
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")  # noqa: TRY003
@@ -0,0 +1,184 @@
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, List, Mapping, Sequence, Union
+
+from py_data_digger.main import _LOOKUP_ERRORS, _MISSING, SeekError
+from py_data_digger.paths import PathTrie, _Node, _trie_root
+
+_WRITE_ERRORS = (*_LOOKUP_ERRORS, AttributeError)
+
+
+class BuryError(SeekError):
+    """Raised when bury fails to go further, or to write the value.
+
+    It has the same fields as SeekError, which it extends, so handlers of SeekError catch it too.
+    """
+
+    headline = "Data digger can't bury any further"
+
+
+def _descend(
+    result: object,
+    accessors: tuple,
+    index: int,
+    original_data: object,
+    create_missing: bool,
+    container_factory: Callable[[], object],
+    objects: bool,
+) -> object:
+    # Steps into the container at the accessor of the index, creating it if it's missing
+    accessor = accessors[index]
+    try:
+        return result[accessor]
+    except _LOOKUP_ERRORS as e:
+        error = e
+    if objects and type(accessor) is str:
+        found = getattr(result, accessor, _MISSING)
+        if found is not _MISSING:
+            return found
+    if create_missing and isinstance(error, KeyError) and isinstance(result, MutableMapping):
+        container = container_factory()
+        result[accessor] = container
+        return container
+    raise BuryError(index, original_data, accessors, error) from error
+
+
+def _write(
+    result: object, value: object, accessors: tuple, original_data: object, objects: bool
+) -> None:
+    # Writes the value at the last accessor
+    accessor = accessors[-1]
+    index = len(accessors) - 1
+    try:
+        result[accessor] = value
+    except _LOOKUP_ERRORS as e:
+        if not objects or type(accessor) is not str:
+            raise BuryError(index, original_data, accessors, e) from e
+        try:
+            setattr(result, accessor, value)
+        except _WRITE_ERRORS as attribute_error:
+            raise BuryError(index, original_data, accessors, attribute_error) from e
+
+
+def _first_path(node: _Node, path: tuple) -> tuple:
+    # The accessors of the first path going through the node
+    while not node.names:
+        accessor, node = node.children[0]
+        path = (*path, accessor)
+    return path
+
+
+def bury(
+    data: Union[Sequence, Mapping],
+    value: object,
+    *accessors: List[Any],
+    create_missing: bool = True,
+    container_factory: Callable[[], object] = dict,
+    bury_objects: bool = False,
+) -> None:
+    """Write a value deep into the data, the opposite of seek.
+
+    Navigates through the data like `seek` does, up to the last accessor, and sets the value
+    there. Missing keys along the way are filled with new containers, by default dicts.
+
+    Parameters:
+      data: The list, dict (or anything supporting item assignment) to be written
+      value: The value to be written
+      accessors: The keys, indexes or attribute names (only if bury_objects is True) to be accessed.
+      The last one is where the value is written.
+      create_missing: If create_missing is True, missing keys of dicts (or any mutable mapping)
+      along the way get a new container. Missing indexes of lists are never created.
+      container_factory: Called with no arguments to create each missing container.
+      By default it's dict.
+      bury_objects: If bury_objects is True, also gets and sets attributes of objects with the
+      given names.
+
+    Raises:
+      BuryError: if it can't go further or can't write the value. The exception message will
+      provide details on where it stopped. It's a SeekError too.
+
+    Examples:
+    .. code-block:: python
+      my_dict = {'item_a': ['apple', 'pea']}
+
+      bury(my_dict, 'banana', 'item_a', 1)
+      bury(my_dict, 3, 'counts', 'fruits')
+      my_dict
+      >>> {'item_a': ['apple', 'banana'], 'counts': {'fruits': 3}}
+
+      bury(my_dict, 'kiwi', 'item_a', 5)
+      >>> BuryError: Data digger can't bury any further: IndexError
+      >>> Path traveled: dict -> item_a -> 5
+    """
+    if not accessors:
+        raise ValueError("bury needs at least one accessor to write the value to")  # noqa: TRY003
+    result = data
+    for index in range(len(accessors) - 1):
+        result = _descend(
+            result, accessors, index, data, create_missing, container_factory, bury_objects
+        )
+    _write(result, value, accessors, data, bury_objects)
+
+
+def bury_paths(
+    data: Union[Sequence, Mapping],
+    paths: Mapping[Hashable, object],
+    create_missing: bool = True,
+    container_factory: Callable[[], object] = dict,
+    bury_objects: bool = False,
+) -> None:
+    """Write many values deep into the data, visiting each shared container only once.
+
+    The paths are merged by their shared prefixes like in `dig_paths`, so each container
+    along the way is reached (or created) a single time. When a path is the prefix of another,
+    the shorter one is written first, and the longer one is written into its new value.
+
+    Writes are not atomic: when one fails, the ones before it are kept.
+
+    Parameters:
+      data: The list, dict (or anything supporting item assignment) to be written
+      paths: A mapping of sequences of accessors to the values to be written there
+      create_missing: If create_missing is True, missing keys of dicts (or any mutable mapping)
+      along the way get a new container.
+      container_factory: Called with no arguments to create each missing container.
+      By default it's dict.
+      bury_objects: If bury_objects is True, also gets and sets attributes of objects with the
+      given names.
+
+    Raises:
+      BuryError: if it can't go further or can't write a value.
+
+    Examples:
+    .. code-block:: python
+      bury_paths(document, {
+          ('summary', 'machines'): 2,
+          ('summary', 'engines', 'total'): 1,
+          ('machines', 0, 'checked'): True,
+      })
+    """
+    root = _trie_root(PathTrie({path: path for path in paths}))
+    if root.names:
+        raise ValueError("bury_paths can't write a value to an empty path")  # noqa: TRY003
+
+    def bury_node(node: _Node, container: object, path: tuple) -> None:
+        for accessor, child in node.children:
+            child_path = (*path, accessor)
+            for name in child.names:
+                _write(container, paths[name], child_path, data, bury_objects)
+            if child.children:
+                try:
+                    found = _descend(
+                        container,
+                        child_path,
+                        len(path),
+                        data,
+                        create_missing,
+                        container_factory,
+                        bury_objects,
+                    )
+                except BuryError as e:
+                    # Reported with all the accessors of a path going through the child
+                    accessors = _first_path(child, child_path)
+                    raise BuryError(e.index, data, accessors, e.original_error) from e.original_error
+                bury_node(child, found, child_path)
+
+    bury_node(root, data, ())
@@ -0,0 +1,245 @@
+from array import array
+from dataclasses import dataclass
+from math import nan
+from types import ModuleType
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from py_data_digger.batch import dig_many
+from py_data_digger.main import _MISSING
+
+_INTEGER_TYPECODES = "bBhHiIlLqQ"
+_FLOAT_TYPECODES = "fd"
+_COERCION_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+@dataclass
+class Column:
+    """Values dug from many records, kept in a compact typed buffer.
+
+    Attributes:
+      values: An array.array (or a NumPy array) with one value per record
+      mask: One flag per record, true where the value is the default: either the path was
+      missing or the value couldn't be coerced to the column type
+      missing: How many records didn't have the path
+      errors: How many values couldn't be coerced to the column type
+    """
+
+    values: Any
+    mask: Any
+    missing: int = 0
+    errors: int = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _integer(value: object) -> int:
+    # int() truncates numbers like 1.9 or Decimal('1.9'), those are coercion errors instead
+    integer = int(value)
+    if not isinstance(value, (int, str, bytes)) and integer != value:
+        raise ValueError(f"{value!r} isn't a whole number")  # noqa: TRY003
+    return integer
+
+
+def _coercion(dtype: str) -> Callable[[object], object]:
+    if dtype in _FLOAT_TYPECODES:
+        return float
+    if dtype in _INTEGER_TYPECODES:
+        return _integer
+    raise ValueError(  # noqa: TRY003
+        f"dtype must be one of the numeric array typecodes "
+        f"{_INTEGER_TYPECODES + _FLOAT_TYPECODES!r}, got {dtype!r}"
+    )
+
+
+def dig_column(
+    records: Iterable,
+    *accessors: List[Any],
+    dtype: str = "d",
+    default: object = nan,
+    dig_objects: bool = False,
+    as_numpy: bool = False,
+    workers: Optional[int] = None,
+) -> Column:
+    """Safely dig a numeric field from every record straight into a typed array.
+
+    Instead of a list of Python objects, values are stored in an array.array of the given
+    typecode, along with a mask telling which records got the default value. Values that
+    can't be converted to the column type are counted and stored as the default, so a bad
+    record never stops the batch.
+
+    Parameters:
+      records: Any iterable of lists, tuples, dicts to be searched
+      accessors: The keys, indexes or attribute names (only if dig_objects is True) to be accessed
+      dtype: A numeric array.array typecode, like 'd' for floats or 'q' for 64 bit integers.
+      Values are converted with float() or int(), except that numbers which aren't whole,
+      like 1.9, are counted as errors in integer columns rather than truncated.
+      default: The value stored when the search or the conversion fails. By default it's nan,
+      so integer columns need another one.
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      as_numpy: If as_numpy is True, values and mask are NumPy arrays sharing the same memory.
+      Requires NumPy to be installed.
+      workers: If given, records are dug in batches by a pool of this many threads,
+      like in dig_many.
+
+    Raises:
+      ValueError: if dtype isn't a numeric typecode or the default can't be stored with it.
+
+    Examples:
+    .. code-block:: python
+      records = [{'price': 1.5}, {'price': 'n/a'}, {}]
+
+      column = dig_column(records, 'price')
+      column.values
+      >>> array('d', [1.5, nan, nan])
+      list(column.mask), column.missing, column.errors
+      >>> ([0, 1, 1], 1, 1)
+
+      dig_column(records, 'price', dtype='q', default=0).values
+      >>> array('q', [1, 0, 0])
+    """
+    coerce = _coercion(dtype)
+    native = float if dtype in _FLOAT_TYPECODES else int
+    values = array(dtype)
+    try:
+        default = coerce(default)
+        values.append(default)
+    except _COERCION_ERRORS as e:
+        raise ValueError(f"default {default!r} can't be stored with dtype {dtype!r}") from e  # noqa: TRY003
+    del values[0]
+
+    mask = bytearray()
+    missing = errors = 0
+    dug = dig_many(
+        records, *accessors, dig_objects=dig_objects, default=_MISSING, workers=workers
+    )
+    for value in dug:
+        if value is _MISSING:
+            missing += 1
+        else:
+            try:
+                # Values of the column type are stored as they are, sparing the conversion.
+                # Anything else is converted: before Python 3.10, arrays of integers would
+                # take floats and Decimals through their truncating __int__.
+                values.append(value if type(value) is native else coerce(value))
+            except _COERCION_ERRORS:
+                errors += 1
+            else:
+                mask.append(0)
+                continue
+        values.append(default)
+        mask.append(1)
+
+    column = Column(values, mask, missing, errors)
+    if as_numpy:
+        return _to_numpy(column)
+    return column
+
+
+def _numpy(feature: str) -> ModuleType:
+    # Imported only when used, so importing the package stays fast without NumPy
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{feature} requires NumPy to be installed") from e  # noqa: TRY003
+    return numpy
+
+
+def _to_numpy(column: Column) -> Column:
+    numpy = _numpy("as_numpy=True")
+    column.values = numpy.frombuffer(column.values, dtype=column.values.typecode)
+    column.mask = numpy.frombuffer(column.mask, dtype=numpy.bool_)
+    return column
+
+
+def _whole_array_view(values: object, accessors: tuple) -> Tuple[object, int]:
+    # Applies the leading accessors that work on every row at once, as views of the array:
+    # field names of structured arrays and indexes of subarrays. Returns the view and how many
+    # accessors were applied, or None when a field or index is missing from every row.
+    view = values
+    for applied, accessor in enumerate(accessors):
+        names = view.dtype.names
+        if names is not None and isinstance(accessor, str):
+            if accessor not in names:
+                return None, applied
+            view = view[accessor]
+        elif view.ndim > 1 and isinstance(accessor, int) and not isinstance(accessor, bool):
+            if not -view.shape[1] <= accessor < view.shape[1]:
+                return None, applied
+            view = view[:, accessor]
+        else:
+            return view, applied
+    return view, len(accessors)
+
+
+def dig_array(
+    values: object,
+    *accessors: List[Any],
+    default: object = None,
+    dtype: object = None,
+    dig_objects: bool = False,
+    workers: Optional[int] = None,
+) -> Column:
+    """Safely dig a path from every row of a NumPy array, as an array and a mask.
+
+    Gives for each row what `dig(row, *accessors, default=default)` would. Field names of
+    structured arrays, and indexes of their subarray fields, are applied to the whole array at
+    once: when the path is only made of those, the values are a view of the array, without
+    copying it. The rest of the path is dug from each row, like object arrays of dicts, through
+    a compiled path. NumPy is only imported when this function is called.
+
+    Parameters:
+      values: A NumPy array, whose first axis holds the rows
+      accessors: The field names, keys, indexes or attribute names (only if dig_objects is True)
+      to be accessed
+      default: The value stored when the search fails. By default it's None.
+      dtype: If given, values are converted to this NumPy dtype. Otherwise views keep the type
+      of the field, and values dug from each row are an object array.
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      workers: If given, rows are dug in batches by a pool of this many threads, like in dig_many.
+
+    Raises:
+      ImportError: if NumPy is not installed.
+      ValueError: if values isn't an array of at least one dimension.
+
+    Examples:
+    .. code-block:: python
+      readings = numpy.array([(1, (20.5, 3)), (2, (21.0, 4))], dtype=[('id', 'i8'), ('sensor', [('temp', 'f8'), ('hits', 'i4')])])
+      column = dig_array(readings, 'sensor', 'temp')
+      column.values, column.mask
+      >>> (array([20.5, 21. ]), array([False, False]))
+
+      events = numpy.array([{'user': {'id': 7}}, {'user': None}], dtype=object)
+      column = dig_array(events, 'user', 'id', default=-1, dtype='i8')
+      column.values, column.mask, column.missing
+      >>> (array([ 7, -1]), array([False,  True]), 1)
+    """
+    numpy = _numpy("dig_array")
+    if not isinstance(values, numpy.ndarray) or values.ndim < 1:
+        raise ValueError("dig_array needs a NumPy array of at least one dimension")  # noqa: TRY003
+    rows = len(values)
+    view, applied = _whole_array_view(values, accessors)
+
+    if view is None:
+        dug = numpy.empty(rows, dtype=object)
+        dug.fill(default)
+        mask = numpy.ones(rows, dtype=numpy.bool_)
+    elif applied == len(accessors):
+        dug = view
+        mask = numpy.zeros(rows, dtype=numpy.bool_)
+    else:
+        # Object arrays give their objects faster as a list, other rows are kept as NumPy rows
+        records = view.tolist() if view.dtype == object and view.ndim == 1 else view
+        found = dig_many(
+            records, *accessors[applied:], dig_objects=dig_objects, default=_MISSING, workers=workers
+        )
+        dug = numpy.fromiter(found, dtype=object, count=rows)
+        mask = numpy.fromiter((value is _MISSING for value in dug), dtype=numpy.bool_, count=rows)
+        for index in numpy.flatnonzero(mask):
+            dug[index] = default
+
+    if dtype is not None:
+        dug = dug.astype(dtype, copy=False)
+    return Column(dug, mask, int(mask.sum()))
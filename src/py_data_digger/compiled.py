@@ -0,0 +1,79 @@
+from typing import Any, List, Mapping, Sequence, Tuple, Union
+
+from py_data_digger import main
+from py_data_digger.main import dig, seek
+
+_LOOKUP_ERRORS = (TypeError, IndexError, KeyError, ValueError)
+
+
+class CompiledPath:
+    """A chain of accessors prepared once and reused to seek or dig many data objects.
+
+    Use `compile_path` to build it. The happy path subscripts straight through the
+    accessors; any failure falls back to `seek` or `dig`, so results and `SeekError` messages are
+    the same as the module level functions. While metrics or a profile are on, every call goes
+    through `seek` or `dig`, so it is recorded too.
+    """
+
+    __slots__ = ("accessors", "objects")
+
+    def __init__(self, accessors: Tuple[Any, ...], objects: bool = False) -> None:
+        self.accessors = tuple(accessors)
+        self.objects = objects
+
+    def seek(self, data: Union[Sequence, Mapping]) -> object:
+        """Navigate through the data, just like `seek(data, *accessors)`.
+
+        Raises:
+          SeekError: if there is no key, index or attribute with a given accessor.
+        """
+        if main._observer is not None:
+            return seek(data, *self.accessors, seek_objects=self.objects)
+        result = data
+        try:
+            for accessor in self.accessors:
+                result = result[accessor]
+        except _LOOKUP_ERRORS:
+            return seek(data, *self.accessors, seek_objects=self.objects)
+        return result
+
+    def dig(self, data: Union[Sequence, Mapping], *, default: object = None) -> object:
+        """Safely navigate through the data, just like `dig(data, *accessors)`."""
+        if main._observer is not None:
+            return dig(data, *self.accessors, dig_objects=self.objects, default=default)
+        result = data
+        try:
+            for accessor in self.accessors:
+                result = result[accessor]
+        except _LOOKUP_ERRORS:
+            if not self.objects:
+                return default
+            return dig(data, *self.accessors, dig_objects=True, default=default)
+        return result
+
+    def __reduce__(self) -> tuple:
+        return (CompiledPath, (self.accessors, self.objects))
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.accessors!r}, objects={self.objects!r})"
+
+
+def compile_path(*accessors: List[Any], objects: bool = False) -> CompiledPath:
+    """Prepare a chain of accessors to be used several times.
+
+    Parameters:
+      accessors: The keys, indexes or attribute names (only if objects is True) to be accessed
+      objects: If objects is True, also tries to get an attribute of an object
+      with the given name
+
+    Examples:
+    .. code-block:: python
+      components_path = compile_path('machines', 0, 'engine', 'components')
+
+      components_path.dig(nasty_dict)
+      >>> [{'id': '0942323', 'name': 'Cog'}, ...]
+
+      components_path.seek({'machines': []})
+      >>> SeekError
+    """
+    return CompiledPath(accessors, objects)
@@ -0,0 +1,140 @@
+import threading
+from typing import Any, Dict, List, Tuple, Union
+from weakref import WeakKeyDictionary
+from xml.etree.ElementTree import Element, ElementTree
+
+from py_data_digger.main import _LOOKUP_ERRORS, _MISSING, SeekError, _seek_from
+
+# The children of each element by tag, with the number of children when it was built to spot
+# appended or removed children. Entries go away with their elements.
+_tag_indexes: "WeakKeyDictionary[Element, Tuple[int, Dict[object, List[Element]]]]" = WeakKeyDictionary()
+_tag_indexes_lock = threading.Lock()
+
+
+def _children_by_tag(element: Element, rebuild: bool = False) -> Dict[object, List[Element]]:
+    cached = None if rebuild else _tag_indexes.get(element)
+    if cached is not None and cached[0] == len(element):
+        return cached[1]
+    children: Dict[object, List[Element]] = {}
+    for child in element:
+        children.setdefault(child.tag, []).append(child)
+    with _tag_indexes_lock:
+        _tag_indexes[element] = (len(element), children)
+    return children
+
+
+def _child_with_tag(element: Element, tag: str, position: int = 0) -> Element:
+    # A child whose tag changed leaves the index stale: it shows as the child found having
+    # another tag, or as a missing tag. Either way the index is built again before answering.
+    children = _children_by_tag(element).get(tag)
+    if children is not None:
+        child = children[position]
+        if child.tag == tag:
+            return child
+    children = _children_by_tag(element, rebuild=True).get(tag)
+    if children is None:
+        raise KeyError(tag)
+    return children[position]
+
+
+def _step(element: Element, accessor: object) -> object:
+    if type(accessor) is str:
+        if accessor.startswith("@"):
+            value = element.get(accessor[1:], _MISSING)
+            if value is _MISSING:
+                raise KeyError(accessor)
+            return value
+        return _child_with_tag(element, accessor)
+    if type(accessor) is tuple and len(accessor) == 2 and type(accessor[0]) is str:
+        tag, position = accessor
+        return _child_with_tag(element, tag, position)
+    return element[accessor]
+
+
+def clear_xml_index() -> None:
+    """Forget the cached children by tag of every element.
+
+    The index spots appended and removed children, and a sought child whose tag changed. It
+    doesn't spot a child replaced by another one, nor a sibling whose tag changed to or from
+    the tag sought, which moves the first or nth child with that tag. Call this after such
+    changes to a tree already sought.
+    """
+    with _tag_indexes_lock:
+        _tag_indexes.clear()
+
+
+def seek_xml(element: Union[Element, ElementTree], *accessors: List[Any]) -> object:
+    """Navigate through an ElementTree element.
+
+    On elements, accessors can be:
+      - a tag name, for the first child with that tag
+      - a (tag, n) pair, for the nth child with that tag (negative n counts from the last one)
+      - '@name', for the value of an attribute
+      - an int or slice, for children by position, like `element[0]`
+
+    Children are found through an index of each element's children by tag, built the first
+    time the element is sought and cached while the element lives, so repeated lookups on the
+    same tree don't scan the children again. Once an attribute value is reached, accessors
+    work like in `seek`. Namespaced tags are written as in ElementTree: '{uri}tag'.
+
+    Parameters:
+      element: The element, or the ElementTree whose root is sought
+      accessors: The tag names, (tag, n) pairs, '@attribute' names or indexes to be accessed
+
+    Raises:
+      SeekError: if there is no child, attribute or index with a given accessor. The exception
+      message will provide details on where it could not access.
+
+    Examples:
+    .. code-block:: python
+      root = ElementTree.fromstring(
+          '<machines><machine id="1"><engine>V8</engine></machine><machine id="2"/></machines>'
+      )
+
+      seek_xml(root, ('machine', 1), '@id')
+      >>> '2'
+
+      seek_xml(root, 'machine', 'engine').text
+      >>> 'V8'
+
+      seek_xml(root, 'machine', 'wheel')
+      >>> SeekError: Data digger can't go any further: KeyError
+      >>> Path traveled: Element -> machine -> wheel
+    """
+    if isinstance(element, ElementTree):
+        element = element.getroot()
+    result = element
+    for index, accessor in enumerate(accessors):
+        if not isinstance(result, Element):
+            return _seek_from(result, accessors, index, element)
+        try:
+            result = _step(result, accessor)
+        except _LOOKUP_ERRORS as e:
+            raise SeekError(index, element, accessors, e) from e
+    return result
+
+
+def dig_xml(
+    element: Union[Element, ElementTree], *accessors: List[Any], default: object = None
+) -> object:
+    """Safely navigate through an ElementTree element.
+
+    Works like `seek_xml`, but returns None or an user defined value when the path isn't there.
+
+    Parameters:
+      element: The element, or the ElementTree whose root is sought
+      accessors: The tag names, (tag, n) pairs, '@attribute' names or indexes to be accessed
+      default: The value returned when the search fails. By default it's None.
+
+    Examples:
+    .. code-block:: python
+      dig_xml(root, ('machine', 0), 'engine').text
+      >>> 'V8'
+
+      dig_xml(root, ('machine', 1), 'engine', default='')
+      >>> ''
+    """
+    try:
+        return seek_xml(element, *accessors)
+    except SeekError:
+        return default
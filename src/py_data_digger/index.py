@@ -0,0 +1,193 @@
+import sys
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Union
+
+from py_data_digger.main import _MISSING, _seek_from, dig, seek
+
+# Only str and int accessors are indexed: 1.0 == 1, but a list can't be indexed by 1.0
+_INDEXED_TYPES = frozenset((str, int))
+_CONTAINER_TYPES = frozenset((dict, list, tuple))
+
+
+class DigIndex:
+    """A flat index of every path of the data, built once for data sought over and over.
+
+    The data is walked once and each path of accessors (dict keys and list or tuple indexes,
+    as long as they are strings or integers) is mapped to the value it leads to. Seeking and
+    digging then take a single hash lookup. Anything that isn't in the index, like negative
+    indexes, characters of strings or object attributes, falls back to `seek` and `dig`, so
+    results and `SeekError` messages are the same as the module level functions.
+
+    The index is a snapshot: build a new one after changing the data.
+
+    Parameters:
+      data: The list, tuple, dict to be indexed
+      max_depth: Index paths up to this many accessors. Deeper paths are sought from the
+      deepest indexed value. By default there is no limit.
+      lazy: If lazy is True, only the first level is indexed at first, and each subtree of
+      the data is indexed when a path through it is first sought.
+
+    Examples:
+    .. code-block:: python
+      index = DigIndex(catalog, max_depth=4)
+
+      index.seek('products', 1042, 'price')
+      >>> 9.99
+      index.dig('products', 1042, 'discount', default=0)
+      >>> 0
+      index.memory_footprint()
+      >>> 1843200
+    """
+
+    def __init__(
+        self,
+        data: Union[Sequence, Mapping],
+        max_depth: Optional[int] = None,
+        lazy: bool = False,
+    ) -> None:
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth can't be negative")  # noqa: TRY003
+        self.data = data
+        self.max_depth = max_depth
+        self.lazy = lazy
+        self._paths: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        self._expanded: Set[Any] = set()
+        first_depth = 1 if max_depth is None else min(max_depth, 1)
+        self._index((), data, first_depth if lazy else max_depth, set())
+
+    def seek(self, *accessors: List[Any]) -> object:
+        """Navigate through the data, just like `seek(data, *accessors)`.
+
+        Raises:
+          SeekError: if there is no key, index or attribute with a given accessor.
+        """
+        try:
+            value = self._paths.get(accessors, _MISSING)
+        except TypeError:
+            value = _MISSING
+        if value is not _MISSING and _INDEXED_TYPES.issuperset(map(type, accessors)):
+            return value
+        value = self._lookup(accessors)
+        if value is not _MISSING:
+            return value
+        prefix_length, value = self._deepest_prefix(accessors)
+        if prefix_length:
+            return _seek_from(value, accessors, prefix_length, self.data)
+        return seek(self.data, *accessors)
+
+    def dig(self, *accessors: List[Any], default: object = None) -> object:
+        """Safely navigate through the data, just like `dig(data, *accessors)`."""
+        try:
+            value = self._paths.get(accessors, _MISSING)
+        except TypeError:
+            value = _MISSING
+        if value is not _MISSING and _INDEXED_TYPES.issuperset(map(type, accessors)):
+            return value
+        value = self._lookup(accessors)
+        if value is not _MISSING:
+            return value
+        prefix_length, value = self._deepest_prefix(accessors)
+        if prefix_length:
+            return dig(value, *accessors[prefix_length:], default=default)
+        return dig(self.data, *accessors, default=default)
+
+    def memory_footprint(self) -> int:
+        """The size in bytes of the index itself: its hash table and its accessor tuples.
+
+        Values are the objects of the data, shared rather than copied, so they aren't counted.
+        """
+        with self._lock:
+            paths = list(self._paths)
+            size = sys.getsizeof(self._paths) + sys.getsizeof(self._expanded)
+        return size + sum(map(sys.getsizeof, paths))
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, accessors: tuple) -> bool:
+        return self._lookup(tuple(accessors)) is not _MISSING
+
+    def __repr__(self) -> str:
+        return f"DigIndex(<{len(self._paths)} paths>, max_depth={self.max_depth!r}, lazy={self.lazy!r})"
+
+    def _lookup(self, accessors: tuple) -> object:
+        try:
+            value = self._paths.get(accessors, _MISSING)
+        except TypeError:
+            return _MISSING
+        if value is _MISSING and self.lazy and len(accessors) > 1 and self._expand(accessors[0]):
+            value = self._paths.get(accessors, _MISSING)
+        if value is not _MISSING and not _INDEXED_TYPES.issuperset(map(type, accessors)):
+            return _MISSING
+        return value
+
+    def _deepest_prefix(self, accessors: tuple) -> tuple:
+        # Only paths deeper than max_depth can start from an indexed value, anything else
+        # missing from the index is missing from the data
+        if self.max_depth is None or len(accessors) <= self.max_depth or not self.max_depth:
+            return 0, None
+        prefix = accessors[: self.max_depth]
+        value = self._lookup(prefix)
+        if value is _MISSING:
+            return 0, None
+        return self.max_depth, value
+
+    def _expand(self, first: object) -> bool:
+        if first in self._expanded:
+            return False
+        with self._lock:
+            if first in self._expanded:
+                return False
+            subtree = self._paths.get((first,), _MISSING)
+            if subtree is _MISSING or type(first) not in _INDEXED_TYPES:
+                return False
+            self._index((first,), subtree, self.max_depth, {id(self.data)})
+            self._expanded.add(first)
+        return True
+
+    def _index(
+        self, path: tuple, node: object, max_depth: Optional[int], ancestors: set
+    ) -> None:
+        # Walked with a stack rather than recursion, so data of any depth can be indexed
+        paths = self._paths
+        paths[path] = node
+        items = _children(node, len(path), max_depth, ancestors)
+        if items is None:
+            return
+        ancestors.add(id(node))
+        stack = [(path, id(node), items)]
+        while stack:
+            parent_path, node_id, items = stack[-1]
+            for accessor, found in items:
+                found_path = (*parent_path, accessor)
+                paths[found_path] = found
+                if type(found) in _CONTAINER_TYPES:
+                    found_items = _children(found, len(found_path), max_depth, ancestors)
+                    if found_items is not None:
+                        # The rest of the items are walked once the child is done
+                        ancestors.add(id(found))
+                        stack.append((found_path, id(found), found_items))
+                        break
+            else:
+                stack.pop()
+                ancestors.discard(node_id)
+
+
+def _children(
+    node: object, depth: int, max_depth: Optional[int], ancestors: set
+) -> Optional[Iterator]:
+    # The (accessor, child) pairs to index below the node, or None when it isn't walked into
+    if max_depth is not None and depth >= max_depth:
+        return None
+    node_type = type(node)
+    if node_type is dict:
+        items = iter([(k, v) for k, v in node.items() if type(k) is str or type(k) is int])
+    elif node_type is list or node_type is tuple:
+        items = enumerate(node)
+    else:
+        return None
+    # Containers holding themselves would give endless paths, those are left to seek
+    if id(node) in ancestors:
+        return None
+    return items
@@ -0,0 +1,305 @@
+import codecs
+import json
+import os
+import re
+from contextlib import contextmanager
+from json.decoder import scanstring
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from py_data_digger.main import SeekError, _seek_from
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Runs of string characters and escapes, stopping at the closing quote or a trailing backslash
+_STRING_CHARS = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_NUMBER_CHARS = re.compile(r"[-+.0-9eE]*")
+# Runs of scalars, separators and whole strings, stopping at brackets or at a truncated string
+_NON_STRUCTURAL = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+# NaN and Infinity aren't JSON, but json.load reads them and json.dump writes them
+_LITERALS = {"t": "true", "f": "false", "n": "null", "N": "NaN", "I": "Infinity"}
+_ROOT_PLACEHOLDERS = {"{": {}, "[": []}
+
+JsonSource = Union[str, bytes, "os.PathLike[str]", IO]
+
+
+class _JsonStream:
+    """Pull parser over a JSON text read in chunks.
+
+    Containers are entered one event at a time and unwanted values are skipped by
+    scanning their text, so only the values asked for are ever decoded.
+    """
+
+    def __init__(self, file: IO, chunk_size: int) -> None:
+        self._read = file.read
+        self._chunk_size = chunk_size
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0
+        self._mark: Optional[int] = None
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._read(self._chunk_size)
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            text = self._decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        self._eof = not chunk
+
+        # Text before the current position is no longer needed, unless a value is being captured
+        keep = self._pos if self._mark is None else self._mark
+        self._buffer = self._buffer[keep:] + text
+        self._offset += keep
+        self._pos -= keep
+        if self._mark is not None:
+            self._mark = 0
+        return not self._eof
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(
+            f"{message} (char {self._offset + self._pos} of the stream)", self._buffer, self._pos
+        )
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given structural character."""
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r} delimiter")
+        self._pos += 1
+
+    def _string_end(self, keep: bool = False) -> int:
+        # Scans the string opened at the current position, returning where it ends. Each fill
+        # only scans the new text, plus a backslash cut from its escaped character. Unless the
+        # string is kept, the text already scanned is let go by moving the position along.
+        end = self._pos + 1
+        while True:
+            end = _STRING_CHARS.match(self._buffer, end).end()
+            if end < len(self._buffer) and self._buffer[end] == '"':
+                return end + 1
+            if not keep:
+                self._pos = end
+            offset = self._offset
+            if not self._fill():
+                raise self._error("Unterminated string")
+            end -= self._offset - offset
+
+    def _scalar_end(self) -> int:
+        char = self._buffer[self._pos]
+        literal = _LITERALS.get(char)
+        if char == "-":
+            # -Infinity is the only literal starting like a number
+            while len(self._buffer) < self._pos + 2 and self._fill():
+                pass
+            if self._buffer.startswith("-I", self._pos):
+                literal = "-Infinity"
+        if literal is not None:
+            while len(self._buffer) < self._pos + len(literal) and self._fill():
+                pass
+            if not self._buffer.startswith(literal, self._pos):
+                raise self._error("Expecting value")
+            return self._pos + len(literal)
+
+        end = _NUMBER_CHARS.match(self._buffer, self._pos).end()
+        while end == len(self._buffer) and self._fill():
+            end = _NUMBER_CHARS.match(self._buffer, self._pos).end()
+        match = _NUMBER.match(self._buffer, self._pos, end)
+        if not match or match.end() != end:
+            raise self._error("Expecting value")
+        return end
+
+    def read_key(self) -> str:
+        """Decode the object key at the current position."""
+        if self.peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        self._string_end(keep=True)  # Makes sure the whole key is in the buffer
+        key, self._pos = scanstring(self._buffer, self._pos + 1)
+        return key
+
+    def skip_value(self) -> None:
+        """Move past the value at the current position without decoding it."""
+        char = self.peek()
+        if char == "":
+            raise self._error("Expecting value")
+        if char == '"':
+            self._pos = self._string_end()
+            return
+        if char not in "[{":
+            self._pos = self._scalar_end()
+            return
+
+        depth = 0
+        while True:
+            self._pos = _NON_STRUCTURAL.match(self._buffer, self._pos).end()
+            if self._pos == len(self._buffer):
+                if not self._fill():
+                    raise self._error("Unterminated container")
+                continue
+            char = self._buffer[self._pos]
+            if char == '"':
+                self._pos = self._string_end()
+                continue
+            self._pos += 1
+            depth += 1 if char in "[{" else -1
+            if depth == 0:
+                return
+
+    def read_value(self) -> object:
+        """Decode the value at the current position."""
+        self.peek()
+        self._mark = self._pos
+        try:
+            self.skip_value()
+            text = self._buffer[self._mark : self._pos]
+        finally:
+            self._mark = None
+        return json.loads(text)
+
+    def enter_key(self, key: object) -> Optional[Exception]:
+        """Move to the value of the given key of the object at the current position.
+
+        Returns the error a dict would raise when the key isn't there.
+        """
+        if not isinstance(key, str):
+            try:
+                hash(key)
+            except TypeError as e:
+                return e
+            return KeyError(key)
+
+        self.expect("{")
+        if self.peek() == "}":
+            return KeyError(key)
+        while True:
+            name = self.read_key()
+            self.expect(":")
+            if name == key:
+                return None
+            self.skip_value()
+            if self.peek() == "}":
+                return KeyError(key)
+            self.expect(",")
+
+    def enter_index(self, index: int) -> Optional[Exception]:
+        """Move to the item at the given non negative index of the array at the current position.
+
+        Returns the error a list would raise when the index is out of range.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            return IndexError("list index out of range")
+        for _ in range(index):
+            self.skip_value()
+            if self.peek() == "]":
+                return IndexError("list index out of range")
+            self.expect(",")
+        return None
+
+
+@contextmanager
+def _open(source: JsonSource) -> Iterator[IO]:
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "rb") as file:
+            yield file
+    else:
+        yield source
+
+
+def _seek_stream(stream: _JsonStream, accessors: tuple) -> object:
+    original_data = _ROOT_PLACEHOLDERS.get(stream.peek())
+    if original_data is None:
+        value = stream.read_value()
+        return _seek_from(value, accessors, 0, value)
+
+    for index, accessor in enumerate(accessors):
+        char = stream.peek()
+        if char == "{":
+            error = stream.enter_key(accessor)
+        elif char == "[" and isinstance(accessor, int) and accessor >= 0:
+            error = stream.enter_index(accessor)
+        elif char == "[" and isinstance(accessor, str):
+            error = TypeError("list indices must be integers or slices, not str")
+        else:
+            # Strings, numbers, negative indexes and slices need the whole value anyway
+            return _seek_from(stream.read_value(), accessors, index, original_data)
+        if error is not None:
+            raise SeekError(index, original_data, accessors, error) from error
+    return stream.read_value()
+
+
+def seek_json(source: JsonSource, *accessors: List[Any], chunk_size: int = 65536) -> object:
+    """Navigate through a JSON document without loading all of it.
+
+    The document is read in chunks and parsed incrementally: values that are not in the
+    path are skipped without being decoded, and reading stops as soon as the value is found.
+    Results and errors are the same as `seek(json.load(source), *accessors)`, except that
+    for duplicated keys the first one is taken.
+
+    Negative indexes and slices need the whole array, so it is decoded in memory.
+
+    Parameters:
+      source: A path to a JSON file, or a file object opened in text or binary mode
+      accessors: The keys or indexes to be accessed
+      chunk_size: How much is read from the source at a time
+
+    Raises:
+      SeekError: if there is no key or index with a given accessor. The exception message
+      will provide details on where it could not access.
+      json.JSONDecodeError: if the document is not valid JSON along the path.
+
+    Examples:
+    .. code-block:: python
+      with open('machines.json') as file:
+          seek_json(file, 'machines', 0, 'engine', 'name')
+      >>> 'Motor XPTO'
+
+      seek_json('machines.json', 'machines', 0, 'engine_2')
+      >>> SeekError
+    """
+    with _open(source) as file:
+        return _seek_stream(_JsonStream(file, chunk_size), accessors)
+
+
+def dig_json(
+    source: JsonSource,
+    *accessors: List[Any],
+    default: object = None,
+    chunk_size: int = 65536,
+) -> object:
+    """Safely navigate through a JSON document without loading all of it.
+
+    Works like `seek_json`, but returns None or an user defined value when the path isn't there.
+
+    Parameters:
+      source: A path to a JSON file, or a file object opened in text or binary mode
+      accessors: The keys or indexes to be accessed
+      default: The value returned when the search fails. By default it's None.
+      chunk_size: How much is read from the source at a time
+
+    Raises:
+      json.JSONDecodeError: if the document is not valid JSON along the path.
+
+    Examples:
+    .. code-block:: python
+      dig_json('machines.json', 'machines', 0, 'engine', 'name')
+      >>> 'Motor XPTO'
+
+      dig_json('machines.json', 'machines', 0, 'engine_2', default='')
+      >>> ''
+    """
+    try:
+        return seek_json(source, *accessors, chunk_size=chunk_size)
+    except SeekError:
+        return default
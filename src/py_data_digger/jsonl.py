@@ -0,0 +1,167 @@
+import json
+import mmap
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import starmap
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from py_data_digger.compiled import compile_path
+
+
+@dataclass(frozen=True)
+class ChunkReport:
+    """How fast a byte range of a JSONL file was dug, and by which process."""
+
+    worker: int
+    start: int
+    end: int
+    records: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes of the range read and dug per second."""
+        return (self.end - self.start) / self.seconds if self.seconds else float("inf")
+
+    @property
+    def records_per_second(self) -> float:
+        """Records of the range dug per second."""
+        return self.records / self.seconds if self.seconds else float("inf")
+
+
+def _byte_ranges(
+    path: Union[str, "os.PathLike[str]"], chunk_bytes: int, parts: int
+) -> List[Tuple[int, int]]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return []
+        parts = max(parts, -(-size // chunk_bytes))
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            bounds = [0]
+            for part in range(1, parts):
+                newline = memory.find(b"\n", max(size * part // parts, bounds[-1]))
+                if newline == -1:
+                    break
+                bounds.append(newline + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _dig_range(
+    path: Union[str, "os.PathLike[str]"],
+    start: int,
+    end: int,
+    accessors: tuple,
+    default: object,
+) -> Tuple[list, ChunkReport]:
+    began = time.perf_counter()
+    dig = compile_path(*accessors).dig
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as memory:
+        lines = memory[start:end].splitlines()
+    results = [dig(json.loads(line), default=default) for line in lines if line.strip()]
+    report = ChunkReport(os.getpid(), start, end, len(results), time.perf_counter() - began)
+    return results, report
+
+
+def _run_in_pool(
+    tasks: Iterable[tuple], workers: int, ordered: bool
+) -> Iterator[Tuple[list, ChunkReport]]:
+    # The process pool machinery is imported here, since it takes longer to import than the
+    # whole package and most calls never start a pool
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+    # Only a few ranges per worker are in flight, so finished results don't pile up in memory
+    window = workers * 2
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        if ordered:
+            queue: deque = deque()
+            for task in tasks:
+                queue.append(pool.submit(_dig_range, *task))
+                if len(queue) >= window:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        else:
+            running = set()
+            for task in tasks:
+                running.add(pool.submit(_dig_range, *task))
+                if len(running) >= window:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(running):
+                yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def dig_jsonl(
+    path: Union[str, "os.PathLike[str]"],
+    *accessors: List[Any],
+    default: object = None,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    chunk_bytes: int = 64 * 1024 * 1024,
+    min_parallel_bytes: int = 16 * 1024 * 1024,
+    report: Optional[Callable[[ChunkReport], None]] = None,
+) -> Iterator:
+    """Safely navigate through every record of a newline delimited JSON (JSONL) file.
+
+    The file is memory mapped and split into byte ranges aligned to line breaks, which are
+    decoded and dug in a pool of processes. Files smaller than min_parallel_bytes, or
+    workers=1, are handled in the current process. Blank lines are skipped.
+
+    Parameters:
+      path: The path to the JSONL file
+      accessors: The keys or indexes to be accessed in each record
+      default: The value yielded when the search fails. By default it's None.
+      workers: How many processes dig the file. By default, one per CPU.
+      ordered: If ordered is True, results follow the file order. Otherwise they are yielded
+      range by range as soon as each one is done.
+      chunk_bytes: The largest byte range given to a process at a time
+      min_parallel_bytes: Files smaller than this are dug by the current process only
+      report: Called with a ChunkReport for every range dug, to follow each worker's throughput
+
+    Raises:
+      json.JSONDecodeError: if a line is not valid JSON.
+
+    Examples:
+    .. code-block:: python
+      for engine_name in dig_jsonl('machines.jsonl', 'engine', 'name', workers=8):
+          ...
+
+      reports = []
+      names = list(dig_jsonl('machines.jsonl', 'engine', 'name', report=reports.append))
+      sum(r.records for r in reports) == len(names)
+      >>> True
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers!r}")  # noqa: TRY003
+
+    ranges = _byte_ranges(path, chunk_bytes, workers * 4)
+    tasks = ((path, start, end, accessors, default) for start, end in ranges)
+    size = ranges[-1][1] if ranges else 0
+    if workers == 1 or len(ranges) < 2 or size < min_parallel_bytes:
+        chunks = starmap(_dig_range, tasks)
+    else:
+        chunks = _run_in_pool(tasks, workers, ordered)
+
+    return _flatten(chunks, report)
+
+
+def _flatten(
+    chunks: Iterator[Tuple[list, ChunkReport]], report: Optional[Callable[[ChunkReport], None]]
+) -> Iterator:
+    for results, chunk_report in chunks:
+        if report is not None:
+            report(chunk_report)
+        yield from results
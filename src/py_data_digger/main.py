@@ -1,8 +1,40 @@
-from typing import Any, List, Mapping, Sequence, Union
+import copyreg
+import sys
+import threading
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+_MISSING = object()
+_LOOKUP_ERRORS = (TypeError, IndexError, KeyError, ValueError)
+_SEQUENCE_TYPES = (list, tuple, str)
+
+# Set while metrics or profiles are enabled; seek and dig only pay for a None check otherwise.
+# It is the only observer, or an _ObserverGroup when there are several.
+_observer = None
+_observers: tuple = ()
+_observers_lock = threading.Lock()
+
+# How objects of each type are searched when looking for attributes, found once per type.
+# Each entry is (subscriptable, getattr_names), see _find_strategy.
+_STRATEGY_CACHE_SIZE = 512
+_strategies: Dict[type, Tuple[bool, Optional[FrozenSet[str]]]] = {}
+_strategies_lock = threading.Lock()
 
 
 class SeekError(ValueError):
-    """Raised when the seek method fails to go further."""
+    """Raised when the seek method fails to go further.
+
+    The failure is kept as structured fields and the message is only formatted when it is
+    read, so catching and discarding the error stays cheap.
+
+    Attributes:
+      index: The position of the accessor that could not be accessed
+      data_type: The type of the data where the search started
+      accessors: All the accessors given to the search
+      original_error: The error raised when accessing, also set as the cause
+    """
+
+    headline = "Data digger can't go any further"
 
     def __init__(
         self,
@@ -11,16 +43,70 @@ class SeekError(ValueError):
         accessors: List[Any],
         original_error: Exception,
     ) -> None:
-        error_name = type(original_error).__name__
-        original_data_name = type(original_data).__name__
-        path_items = [original_data_name] + [
-            str(a) for a in accessors[: current_accessor_index + 1]
-        ]
-        self.message = (
-            f"Data digger can't go any further: {error_name}\n"
+        super().__init__()
+        self.index = current_accessor_index
+        self.data_type = type(original_data)
+        self.accessors = tuple(accessors)
+        self.original_error = original_error
+
+    @property
+    def path(self) -> tuple:
+        """The accessors traveled, up to the one that failed."""
+        return self.accessors[: self.index + 1]
+
+    @property
+    def message(self) -> str:
+        """The human readable description of where the search stopped."""
+        message = self.__dict__.get("_message")
+        if message is not None:
+            return message
+        path_items = [self.data_type.__name__] + [str(a) for a in self.path]
+        return (
+            f"{self.headline}: {type(self.original_error).__name__}\n"
             f"Path traveled: {' -> '.join(path_items)}"
         )
-        super().__init__(self.message)
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message = message
+
+    @property
+    def args(self) -> tuple:
+        """The formatted message, as the only argument of the error, unless args were set."""
+        args = self.__dict__.get("_args")
+        if args is not None:
+            return args
+        return (self.message,)
+
+    @args.setter
+    def args(self, args: tuple) -> None:
+        # Assignable like the args of any exception, to re-raise it with more context
+        self._args = tuple(args)
+
+    def to_dict(self) -> dict:
+        """Describe the failure as plain data, handy for structured logging."""
+        return {
+            "error": type(self.original_error).__name__,
+            "data_type": self.data_type.__name__,
+            "index": self.index,
+            "path": list(self.path),
+            "accessors": list(self.accessors),
+        }
+
+    def __str__(self) -> str:
+        args = self.args
+        if len(args) == 1:
+            return str(args[0])
+        return str(args) if args else ""
+
+    def __repr__(self) -> str:
+        args = self.args
+        if len(args) == 1:
+            return f"{type(self).__name__}({args[0]!r})"
+        return f"{type(self).__name__}{args!r}"
+
+    def __reduce__(self) -> tuple:
+        return (copyreg.__newobj__, (type(self),), self.__dict__)
 
 
 def seek(
@@ -70,16 +156,10 @@ def seek(
       seek(my_dict, 'item_with_object', 'age', seek_objects=True)
       >>> SeekError
     """
-    result = data
-    for index, accessor in enumerate(accessors):
-        try:
-            result = result[accessor]
-        except (TypeError, IndexError, KeyError, ValueError) as e:
-            if seek_objects:
-                result = _look_for_object_attribute(result, data, accessors, index)
-            else:
-                raise SeekError(index, data, accessors, e) from e
-    return result
+    observer = _observer
+    if observer is None:
+        return _seek_from(data, accessors, 0, data, seek_objects)
+    return _observed_seek(observer, "seek", data, accessors, seek_objects)
 
 
 def dig(
@@ -136,16 +216,318 @@ def dig(
       dig(my_dict, 'item_b', 'item_c', default={})
       >>> {}
     """
+    observer = _observer
+    if observer is not None:
+        return _observed_dig(observer, data, accessors, dig_objects, default)
+
+    result = data
+    for accessor in accessors:
+        # Same probes as _access, inlined for the built-in containers to spare a call per step
+        result_type = type(result)
+        accessor_type = type(accessor)
+        if result_type is dict and (accessor_type is str or accessor_type is int):
+            value = result.get(accessor, _MISSING)
+        elif result_type in _SEQUENCE_TYPES and accessor_type is int:
+            size = len(result)
+            value = result[accessor] if -size <= accessor < size else _MISSING
+        else:
+            value = _access(result, accessor, dig_objects)
+            if value is _MISSING:
+                return default
+            result = value
+            continue
+        if value is _MISSING:
+            if not dig_objects:
+                return default
+            value = getattr(result, accessor, _MISSING)
+            if value is _MISSING:
+                return default
+        result = value
+    return result
+
+
+def _seek_from(
+    result: object,
+    accessors: tuple,
+    start: int,
+    original_data: object,
+    seek_objects: bool = False,
+) -> object:
+    # Seeks accessors[start:] from an already reached node, reporting errors from the original data
+    for index in range(start, len(accessors)):
+        accessor = accessors[index]
+        if seek_objects and not _strategy(type(result))[0]:
+            # Subscripting would only raise TypeError before looking for the attribute
+            result = _look_for_object_attribute(result, original_data, accessors, index)
+            continue
+        try:
+            result = result[accessor]
+        except _LOOKUP_ERRORS as e:
+            if seek_objects:
+                result = _look_for_object_attribute(result, original_data, accessors, index)
+            else:
+                raise SeekError(index, original_data, accessors, e) from e
+    return result
+
+
+def _observed_seek(
+    observer: object, function: str, data: object, accessors: tuple, seek_objects: bool
+) -> object:
+    # Goes through seek's path, timing the whole call and the exceptions raised on the way
+    exception_times: List[float] = []
+    started = perf_counter()
     try:
-        return seek(data, *accessors, seek_objects=dig_objects)
-    except SeekError:
-        return default
+        result = _timed_seek_from(data, accessors, seek_objects, exception_times)
+    except SeekError as e:
+        observer.record_miss(
+            function,
+            e.index,
+            type(e.original_error).__name__,
+            accessors,
+            perf_counter() - started,
+            sum(exception_times),
+        )
+        raise
+    observer.record_hit(function, accessors, perf_counter() - started, sum(exception_times))
+    return result
+
+
+def _timed_seek_from(
+    data: object, accessors: tuple, seek_objects: bool, exception_times: List[float]
+) -> object:
+    # Same as _seek_from, also adding up the time from each failed access to its handling
+    result = data
+    for index in range(len(accessors)):
+        accessor = accessors[index]
+        raised = perf_counter()
+        if seek_objects and not _strategy(type(result))[0]:
+            try:
+                result = _look_for_object_attribute(result, data, accessors, index)
+            except SeekError:
+                exception_times.append(perf_counter() - raised)
+                raise
+            continue
+        try:
+            result = result[accessor]
+        except _LOOKUP_ERRORS as e:
+            try:
+                if not seek_objects:
+                    raise SeekError(index, data, accessors, e) from e
+                result = _look_for_object_attribute(result, data, accessors, index)
+            finally:
+                exception_times.append(perf_counter() - raised)
+    return result
+
+
+def _observed_dig(
+    observer: object,
+    data: object,
+    accessors: tuple,
+    dig_objects: bool,
+    default: object,
+) -> object:
+    # Times the same probing as dig, so misses cost what they cost unobserved. The error seek
+    # would report for a miss is only looked for after the timing.
+    exception_times: List[float] = []
+    started = perf_counter()
+    result = data
+    for index, accessor in enumerate(accessors):
+        value = _observed_access(observer, result, accessor, dig_objects, exception_times)
+        if value is _MISSING:
+            seconds = perf_counter() - started
+            error = _miss_error(result, accessor, dig_objects)
+            observer.record_miss("dig", index, error, accessors, seconds, sum(exception_times))
+            return default
+        result = value
+    observer.record_hit("dig", accessors, perf_counter() - started, sum(exception_times))
+    return result
+
+
+def _observed_access(
+    observer: object, result: object, accessor: object, objects: bool, exception_times: List[float]
+) -> object:
+    # Same as _access, also adding up the time of the failed subscripts it handles and
+    # recording the attribute lookups
+    result_type = type(result)
+    accessor_type = type(accessor)
+    if result_type is dict and (accessor_type is str or accessor_type is int):
+        value = result.get(accessor, _MISSING)
+    elif result_type in _SEQUENCE_TYPES and accessor_type is int:
+        size = len(result)
+        value = result[accessor] if -size <= accessor < size else _MISSING
+    elif result_type in _SEQUENCE_TYPES and accessor_type is str:
+        value = _MISSING
+    else:
+        if objects:
+            subscriptable, getattr_names = _strategy(result_type)
+            if not subscriptable:
+                value = _get_attribute(result, accessor, getattr_names)
+                observer.record_attribute_fallback(found=value is not _MISSING)
+                return value
+        raised = perf_counter()
+        try:
+            return result[accessor]
+        except _LOOKUP_ERRORS:
+            exception_times.append(perf_counter() - raised)
+            value = _MISSING
+
+    if value is _MISSING and objects:
+        value = getattr(result, accessor, _MISSING)
+        observer.record_attribute_fallback(found=value is not _MISSING)
+    return value
+
+
+def _miss_error(result: object, accessor: object, objects: bool) -> str:
+    # The name of the error seek would report where dig missed
+    if objects:
+        return "AttributeError"
+    try:
+        result[accessor]
+    except _LOOKUP_ERRORS as e:
+        return type(e).__name__
+    return KeyError.__name__
+
+
+class _ObserverGroup:
+    # Forwards every record to each observer, when metrics and profiles are enabled at once
+
+    __slots__ = ("observers",)
+
+    def __init__(self, observers: tuple) -> None:
+        self.observers = observers
+
+    def record_hit(self, *args: object) -> None:
+        for observer in self.observers:
+            observer.record_hit(*args)
+
+    def record_miss(self, *args: object) -> None:
+        for observer in self.observers:
+            observer.record_miss(*args)
+
+    def record_attribute_fallback(self, found: bool) -> None:
+        for observer in self.observers:
+            observer.record_attribute_fallback(found)
+
+
+def _set_observers(observers: tuple) -> None:
+    global _observer, _observers
+    _observers = observers
+    if not observers:
+        _observer = None
+    elif len(observers) == 1:
+        _observer = observers[0]
+    else:
+        _observer = _ObserverGroup(observers)
+
+
+def _add_observer(observer: object, replaced_type: Optional[type] = None) -> None:
+    # Observers of the replaced type are removed, like the registry of former enable_metrics
+    with _observers_lock:
+        observers = _observers
+        if replaced_type is not None:
+            observers = tuple(o for o in observers if not isinstance(o, replaced_type))
+        _set_observers((*observers, observer))
+
+
+def _remove_observer(observer: object = None, removed_type: Optional[type] = None) -> None:
+    # Removes the given observer, or every observer of the removed type
+    with _observers_lock:
+        _set_observers(
+            tuple(
+                o
+                for o in _observers
+                if o is not observer and (removed_type is None or not isinstance(o, removed_type))
+            )
+        )
 
 
 def _look_for_object_attribute(
     result: object, original_data: object, accessors: list[object], index: int
 ) -> object:
+    observer = _observer
     try:
-        return getattr(result, accessors[index])
+        value = getattr(result, accessors[index])
     except AttributeError as e:
+        if observer is not None:
+            observer.record_attribute_fallback(found=False)
         raise SeekError(index, original_data, accessors, e) from e
+    if observer is not None:
+        observer.record_attribute_fallback(found=True)
+    return value
+
+
+def _access(result: object, accessor: object, objects: bool) -> object:
+    # Built-in containers are probed without raising, which is much cheaper on misses.
+    # Anything else goes through the same subscript and except path as seek.
+    result_type = type(result)
+    accessor_type = type(accessor)
+    if result_type is dict and (accessor_type is str or accessor_type is int):
+        value = result.get(accessor, _MISSING)
+    elif result_type in _SEQUENCE_TYPES and accessor_type is int:
+        size = len(result)
+        value = result[accessor] if -size <= accessor < size else _MISSING
+    elif result_type in _SEQUENCE_TYPES and accessor_type is str:
+        value = _MISSING
+    else:
+        if objects:
+            subscriptable, getattr_names = _strategy(result_type)
+            if not subscriptable:
+                return _get_attribute(result, accessor, getattr_names)
+        try:
+            return result[accessor]
+        except _LOOKUP_ERRORS:
+            value = _MISSING
+
+    if value is _MISSING and objects:
+        return getattr(result, accessor, _MISSING)
+    return value
+
+
+def _strategy(result_type: type) -> Tuple[bool, Optional[FrozenSet[str]]]:
+    strategy = _strategies.get(result_type)
+    if strategy is None:
+        strategy = _find_strategy(result_type)
+        with _strategies_lock:
+            if len(_strategies) >= _STRATEGY_CACHE_SIZE:
+                # Forget the oldest type, the cache only has to be bounded
+                del _strategies[next(iter(_strategies))]
+            _strategies[result_type] = strategy
+    return strategy
+
+
+def _find_strategy(result_type: type) -> Tuple[bool, Optional[FrozenSet[str]]]:
+    # Classes themselves may be subscripted through __class_getitem__, like list[int].
+    # The MRO is checked rather than hasattr, which would also find a metaclass __getitem__.
+    if issubclass(result_type, type) or any(
+        "__getitem__" in vars(klass) for klass in result_type.__mro__
+    ):
+        return True, None
+    # Dataclasses, classes with __slots__ and plain objects can't be subscripted, and getattr
+    # is already their fastest way. Pydantic v2 models keep fields in the instance __dict__ and
+    # only reach their costly __getattr__ on misses, so names found on the class, private
+    # attributes and extra fields are the only ones needing getattr. Models overriding
+    # __getattribute__ or __getattr__ may answer other names, so they always use getattr.
+    # A model exists only once pydantic is imported, so it is never imported here.
+    pydantic = sys.modules.get("pydantic")
+    is_pydantic_model = (
+        pydantic is not None
+        and hasattr(result_type, "__pydantic_fields__")
+        and hasattr(result_type, "__pydantic_extra__")
+        and result_type.__getattribute__ is object.__getattribute__
+        and getattr(result_type, "__getattr__", None) is getattr(pydantic.BaseModel, "__getattr__", _MISSING)
+    )
+    if is_pydantic_model:
+        private_names = getattr(result_type, "__private_attributes__", None) or {}
+        return False, frozenset(dir(result_type)).union(private_names)
+    return False, None
+
+
+def _get_attribute(
+    result: object, accessor: object, getattr_names: Optional[FrozenSet[str]]
+) -> object:
+    if getattr_names is None or type(accessor) is not str or accessor in getattr_names:
+        return getattr(result, accessor, _MISSING)
+    value = result.__dict__.get(accessor, _MISSING)
+    if value is _MISSING and result.__pydantic_extra__:
+        return getattr(result, accessor, _MISSING)
+    return value
@@ -0,0 +1,219 @@
+import sys
+import threading
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Union
+
+from py_data_digger.main import _MISSING, dig
+
+
+@dataclass(frozen=True)
+class MemoStats:
+    """Counters of a DigMemo.
+
+    Attributes:
+      hits: Calls answered from the memo
+      misses: Calls that had to dig
+      evictions: Entries dropped to respect maxsize or max_bytes
+      invalidations: Entries dropped by invalidate, clear, or because their root was collected
+      entries: Entries currently kept
+      bytes: The accounted size of the memo, see DigMemo
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of calls answered from the memo, from 0 to 1."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class _Root:
+    __slots__ = ("keys", "ref", "size", "strong")
+
+    def __init__(self, ref: Optional[weakref.ref], strong: object, size: int) -> None:
+        self.keys: Set[tuple] = set()
+        self.ref = ref
+        self.strong = strong
+        self.size = size
+
+    def get(self) -> object:
+        return self.ref() if self.ref is not None else self.strong
+
+
+class DigMemo:
+    """Remembers dig results by data identity, for data dug over and over without changing.
+
+    Entries are keyed by the identity of the data (the root), the accessors and dig_objects.
+    Roots that can be weakly referenced (most objects, like Pydantic models) are not kept
+    alive by the memo: their entries go away with them. Roots that can't (dicts, lists,
+    tuples) are held by the memo until all of their entries are evicted.
+
+    The memo is bounded by maxsize entries and by max_bytes, accounted as the shallow size
+    (sys.getsizeof) of each entry's accessors and value plus the shallow size of each root held
+    alive. Values are the objects found in the data, not copies.
+
+    A memo is only right while the data doesn't change: call invalidate after changing it.
+    It is safe to share between threads. Remembering costs about as much as a few dict
+    lookups, so it pays off on long paths and on objects rather than on short dict paths.
+
+    Examples:
+    .. code-block:: python
+      memo = DigMemo(maxsize=10_000)
+
+      memo.dig(response, 'machines', 0, 'engine', 'name')  # digs
+      >>> 'V8'
+      memo.dig(response, 'machines', 0, 'engine', 'name')  # remembers
+      >>> 'V8'
+
+      response['machines'].clear()
+      memo.invalidate(response)
+    """
+
+    def __init__(self, maxsize: int = 4096, max_bytes: int = 16 * 1024 * 1024) -> None:
+        if maxsize < 1 or max_bytes < 1:
+            raise ValueError("maxsize and max_bytes must be positive")  # noqa: TRY003
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._roots: Dict[int, _Root] = {}
+        # Ids of collected roots, added by weakref callbacks and purged under the lock
+        self._collected: deque = deque()
+        self._bytes = 0
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def dig(
+        self,
+        data: Union[Sequence, Mapping],
+        *accessors: List[Any],
+        dig_objects: bool = False,
+        default: object = None,
+    ) -> object:
+        """Safely navigate through the data, just like `dig`, remembering the result.
+
+        Misses are remembered too, and give the default of each call. Paths with unhashable
+        accessors can't be remembered, and are just dug.
+        """
+        # Types are kept along with the accessors, since 1, 1.0 and True are equal keys
+        key = (id(data), accessors, tuple(map(type, accessors)), dig_objects)
+        with self._lock:
+            if self._collected:
+                self._purge_collected()
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                return dig(data, *accessors, dig_objects=dig_objects, default=default)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return default if entry[0] is _MISSING else entry[0]
+            self._misses += 1
+
+        value = dig(data, *accessors, dig_objects=dig_objects, default=_MISSING)
+
+        with self._lock:
+            if self._collected:
+                self._purge_collected()
+            self._store(key, data, accessors, value)
+        return default if value is _MISSING else value
+
+    def invalidate(self, data: object) -> None:
+        """Forget every result dug from the given data, after changing it."""
+        with self._lock:
+            root = self._roots.get(id(data))
+            if root is not None and root.get() is data:
+                self._drop_root(id(data), root)
+
+    def clear(self) -> None:
+        """Forget every result."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._roots.clear()
+            self._collected.clear()
+            self._bytes = 0
+
+    def stats(self) -> MemoStats:
+        """Copy the counters of the memo."""
+        with self._lock:
+            if self._collected:
+                self._purge_collected()
+            return MemoStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._invalidations,
+                len(self._entries),
+                self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"DigMemo(maxsize={self.maxsize!r}, max_bytes={self.max_bytes!r})"
+
+    def _store(self, key: tuple, data: object, accessors: tuple, value: object) -> None:
+        if key in self._entries:
+            return
+        root_id = key[0]
+        root = self._roots.get(root_id) or self._new_root(root_id, data)
+        size = sys.getsizeof(accessors) + (0 if value is _MISSING else sys.getsizeof(value))
+        if size + root.size > self.max_bytes:
+            if not root.keys:
+                self._forget_root(root_id, root)
+            return
+        self._entries[key] = (value, size)
+        root.keys.add(key)
+        self._bytes += size
+        self._evict()
+
+    def _new_root(self, root_id: int, data: object) -> _Root:
+        collected = self._collected
+        try:
+            ref = weakref.ref(data, lambda _, root_id=root_id: collected.append(root_id))
+        except TypeError:
+            root = _Root(None, data, sys.getsizeof(data))
+        else:
+            root = _Root(ref, None, 0)
+        self._roots[root_id] = root
+        self._bytes += root.size
+        return root
+
+    def _evict(self) -> None:
+        # The least recently used entries go first, so the one just stored goes last
+        entries = self._entries
+        while entries and (len(entries) > self.maxsize or self._bytes > self.max_bytes):
+            key, (_, size) = entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            root = self._roots[key[0]]
+            root.keys.discard(key)
+            if not root.keys:
+                self._forget_root(key[0], root)
+
+    def _forget_root(self, root_id: int, root: _Root) -> None:
+        del self._roots[root_id]
+        self._bytes -= root.size
+
+    def _drop_root(self, root_id: int, root: _Root) -> None:
+        for key in root.keys:
+            _, size = self._entries.pop(key)
+            self._bytes -= size
+        self._invalidations += len(root.keys)
+        self._forget_root(root_id, root)
+
+    def _purge_collected(self) -> None:
+        while self._collected:
+            root_id = self._collected.popleft()
+            root = self._roots.get(root_id)
+            if root is not None and root.ref is not None and root.ref() is None:
+                self._drop_root(root_id, root)
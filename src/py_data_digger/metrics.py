@@ -0,0 +1,187 @@
+import os
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple, Union
+
+from py_data_digger import main
+
+_PREFIX = "py_data_digger"
+
+
+class MetricsRegistry:
+    """Counters of seek and dig calls, filled while metrics are enabled.
+
+    Counts calls, hits, misses by failure depth (how many accessors were applied before
+    the failing one) and error type, and how often looking for an object attribute
+    found something. It is safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._attribute_fallbacks: Counter = Counter()
+
+    def record_hit(
+        self,
+        function: str,
+        accessors: tuple = (),  # noqa: ARG002
+        seconds: float = 0.0,  # noqa: ARG002
+        exception_seconds: float = 0.0,  # noqa: ARG002
+    ) -> None:
+        """Count a search that found its value. Its path and timings aren't counted."""
+        with self._lock:
+            self._hits[function] += 1
+
+    def record_miss(
+        self,
+        function: str,
+        depth: int,
+        error: str,
+        accessors: tuple = (),  # noqa: ARG002
+        seconds: float = 0.0,  # noqa: ARG002
+        exception_seconds: float = 0.0,  # noqa: ARG002
+    ) -> None:
+        """Count a search that failed at the given depth, because of the given error type.
+
+        Its path and timings aren't counted.
+        """
+        with self._lock:
+            self._misses[function, depth, error] += 1
+
+    def record_attribute_fallback(self, found: bool) -> None:
+        """Count a lookup for an object attribute, after accessing by key or index failed."""
+        with self._lock:
+            self._attribute_fallbacks[found] += 1
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._attribute_fallbacks.clear()
+
+    def snapshot(self) -> Dict[str, Dict[Union[str, Tuple], int]]:
+        """Copy the counters as plain dicts.
+
+        Examples:
+        .. code-block:: python
+          registry.snapshot()
+          >>> {
+          ...     'calls': {'dig': 3},
+          ...     'hits': {'dig': 2},
+          ...     'misses': {('dig', 1, 'KeyError'): 1},
+          ...     'attribute_fallbacks': {'hit': 0, 'miss': 0},
+          ... }
+        """
+        with self._lock:
+            hits = dict(self._hits)
+            misses = dict(self._misses)
+            attribute_fallbacks = {
+                "hit": self._attribute_fallbacks[True],
+                "miss": self._attribute_fallbacks[False],
+            }
+        calls = Counter(hits)
+        for (function, _depth, _error), count in misses.items():
+            calls[function] += count
+        return {
+            "calls": dict(calls),
+            "hits": hits,
+            "misses": misses,
+            "attribute_fallbacks": attribute_fallbacks,
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        _add_counter(
+            lines,
+            "calls_total",
+            "Calls to seek and dig.",
+            [({"function": f}, count) for f, count in snapshot["calls"].items()],
+        )
+        _add_counter(
+            lines,
+            "hits_total",
+            "Calls to seek and dig that found their value.",
+            [({"function": f}, count) for f, count in snapshot["hits"].items()],
+        )
+        _add_counter(
+            lines,
+            "misses_total",
+            "Calls to seek and dig that failed, by failure depth and error type.",
+            [
+                ({"function": f, "depth": str(depth), "error": error}, count)
+                for (f, depth, error), count in snapshot["misses"].items()
+            ],
+        )
+        _add_counter(
+            lines,
+            "attribute_fallbacks_total",
+            "Object attribute lookups made after a key or index access failed.",
+            [({"result": r}, count) for r, count in snapshot["attribute_fallbacks"].items()],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the counters in the Prometheus text exposition format to a file.
+
+        The file is replaced at once, so a scraper never reads it half written.
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:  # noqa: FURB103
+            file.write(self.to_prometheus())
+        os.replace(temporary_path, path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _add_counter(lines: list, name: str, description: str, samples: list) -> None:
+    full_name = f"{_PREFIX}_{name}"
+    lines.extend((f"# HELP {full_name} {description}", f"# TYPE {full_name} counter"))
+    for labels, count in sorted(samples, key=lambda sample: sorted(sample[0].items())):
+        label_text = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+        lines.append(f"{full_name}{{{label_text}}} {count}")
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Start counting seek and dig calls.
+
+    While metrics are disabled (the default), seek and dig only pay for a None check.
+    Once enabled, dig still probes the data like it does unobserved, and only works out
+    the error seek would have raised once it misses, to count where and why it failed.
+
+    Parameters:
+      registry: Where to count. By default a new MetricsRegistry is created.
+
+    Examples:
+    .. code-block:: python
+      registry = enable_metrics()
+
+      dig(my_dict, 'item_b', 0)
+      print(registry.to_prometheus())
+      >>> # HELP py_data_digger_calls_total Calls to seek and dig.
+      >>> # TYPE py_data_digger_calls_total counter
+      >>> py_data_digger_calls_total{function="dig"} 1
+      >>> ...
+    """
+    if registry is None:
+        registry = MetricsRegistry()
+    main._add_observer(registry, replaced_type=MetricsRegistry)
+    return registry
+
+
+def disable_metrics() -> None:
+    """Stop counting seek and dig calls."""
+    main._remove_observer(removed_type=MetricsRegistry)
+
+
+def get_metrics() -> Optional[MetricsRegistry]:
+    """The registry counting seek and dig calls, or None if metrics are disabled."""
+    for observer in main._observers:
+        if isinstance(observer, MetricsRegistry):
+            return observer
+    return None
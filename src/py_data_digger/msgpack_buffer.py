@@ -0,0 +1,266 @@
+import struct
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+
+from py_data_digger.main import SeekError, _seek_from
+
+_SCALAR, _STR, _BIN, _EXT, _ARRAY, _MAP = range(6)
+_ROOT_PLACEHOLDERS = {_MAP: {}, _ARRAY: []}
+
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_INT8 = struct.Struct(">b")
+_NUMBERS = {
+    0xCA: struct.Struct(">f"),
+    0xCB: struct.Struct(">d"),
+    0xCC: _UINT8,
+    0xCD: _UINT16,
+    0xCE: _UINT32,
+    0xCF: struct.Struct(">Q"),
+    0xD0: _INT8,
+    0xD1: struct.Struct(">h"),
+    0xD2: struct.Struct(">i"),
+    0xD3: struct.Struct(">q"),
+}
+_CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+
+MsgpackBuffer = Union[bytes, bytearray, memoryview]
+
+
+class MsgpackExt(NamedTuple):
+    """A MessagePack extension value, kept undecoded: its type code and its data."""
+
+    code: int
+    data: bytes
+
+
+def _layouts() -> List[Optional[Tuple[int, int, Optional[struct.Struct]]]]:
+    # For each first byte: the kind of value, then either its payload size (or item count)
+    # or the struct reading it after the first byte
+    layouts: List[Optional[Tuple[int, int, Optional[struct.Struct]]]] = [None] * 256
+    lengths = (_UINT8, _UINT16, _UINT32)
+    layouts[0x00:0x80] = [(_SCALAR, 0, None)] * 0x80
+    layouts[0x80:0x90] = [(_MAP, count, None) for count in range(16)]
+    layouts[0x90:0xA0] = [(_ARRAY, count, None) for count in range(16)]
+    layouts[0xA0:0xC0] = [(_STR, size, None) for size in range(32)]
+    layouts[0xC4:0xC7] = [(_BIN, 0, length) for length in lengths]
+    layouts[0xC7:0xCA] = [(_EXT, 0, length) for length in lengths]
+    layouts[0xD4:0xD9] = [(_EXT, size + 1, None) for size in (1, 2, 4, 8, 16)]
+    layouts[0xD9:0xDC] = [(_STR, 0, length) for length in lengths]
+    layouts[0xDC:0xDE] = [(_ARRAY, 0, length) for length in lengths[1:]]
+    layouts[0xDE:0xE0] = [(_MAP, 0, length) for length in lengths[1:]]
+    layouts[0xE0:0x100] = [(_SCALAR, 0, None)] * 0x20
+    for byte in _CONSTANTS:
+        layouts[byte] = (_SCALAR, 0, None)
+    for byte, number in _NUMBERS.items():
+        layouts[byte] = (_SCALAR, number.size, None)
+    return layouts
+
+
+_LAYOUTS = _layouts()
+
+
+def _truncated(position: int) -> ValueError:
+    return ValueError(f"MessagePack data is truncated at byte {position}")
+
+
+def _header(view: memoryview, position: int) -> Tuple[int, int, int]:
+    # The kind of the value at the position, its payload size (or item count) and where the
+    # payload (or the first item) starts
+    try:
+        layout = _LAYOUTS[view[position]]
+    except IndexError:
+        raise _truncated(position) from None
+    if layout is None:
+        raise ValueError(f"Invalid MessagePack byte 0xc1 at byte {position}")  # noqa: TRY003
+    kind, size, length = layout
+    start = position + 1
+    if length is not None:
+        try:
+            size = length.unpack_from(view, start)[0]
+        except struct.error:
+            raise _truncated(start) from None
+        start += length.size
+        if kind == _EXT:
+            size += 1
+    return kind, size, start
+
+
+def _skip(view: memoryview, position: int) -> int:
+    # Containers are skipped by counting the values left to skip, reading only headers.
+    # Values with no length field, the most common ones, spare the call to _header.
+    remaining = 1
+    while remaining:
+        layout = _LAYOUTS[view[position]] if position < len(view) else None
+        if layout is None or layout[2] is not None:
+            kind, size, position = _header(view, position)
+        else:
+            kind, size, _ = layout
+            position += 1
+        remaining -= 1
+        if kind == _ARRAY:
+            remaining += size
+        elif kind == _MAP:
+            remaining += 2 * size
+        else:
+            position += size
+    if position > len(view):
+        raise _truncated(len(view))
+    return position
+
+
+def _hashable(value: object) -> object:
+    # Arrays used as map keys become tuples, since lists can't be dict keys
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    return value
+
+
+def _decode(view: memoryview, position: int) -> Tuple[object, int]:
+    kind, size, start = _header(view, position)
+    if kind == _ARRAY:
+        items = []
+        for _ in range(size):
+            item, start = _decode(view, start)
+            items.append(item)
+        return items, start
+    if kind == _MAP:
+        mapping = {}
+        for _ in range(size):
+            key, start = _decode(view, start)
+            mapping[_hashable(key)], start = _decode(view, start)
+        return mapping, start
+
+    end = start + size
+    if end > len(view):
+        raise _truncated(len(view))
+    if kind == _STR:
+        return str(view[start:end], "utf-8"), end
+    if kind == _BIN:
+        return bytes(view[start:end]), end
+    if kind == _EXT:
+        return MsgpackExt(_INT8.unpack_from(view, start)[0], bytes(view[start + 1 : end])), end
+    return _decode_scalar(view, view[position], start), end
+
+
+def _decode_scalar(view: memoryview, byte: int, start: int) -> object:
+    if byte <= 0x7F:
+        return byte
+    if byte >= 0xE0:
+        return byte - 0x100
+    if byte in _CONSTANTS:
+        return _CONSTANTS[byte]
+    return _NUMBERS[byte].unpack_from(view, start)[0]
+
+
+def _enter_key(view: memoryview, size: int, position: int, key: object) -> Tuple[Optional[Exception], int]:
+    # Moves to the value of the key in the map whose first entry is at the position.
+    # Returns the error a dict would raise when the key isn't there.
+    try:
+        hash(key)
+    except TypeError as e:
+        return e, position
+    for _ in range(size):
+        found, position = _decode(view, position)
+        if _hashable(found) == key:
+            return None, position
+        position = _skip(view, position)
+    return KeyError(key), position
+
+
+def _enter_index(view: memoryview, size: int, position: int, index: int) -> Tuple[Optional[Exception], int]:
+    if index >= size:
+        return IndexError("list index out of range"), position
+    for _ in range(index):
+        position = _skip(view, position)
+    return None, position
+
+
+def _memoryview(buffer: MsgpackBuffer) -> memoryview:
+    view = memoryview(buffer)
+    if view.ndim != 1 or view.format not in {"B", "b", "c"}:
+        view = view.cast("B")
+    return view
+
+
+def seek_msgpack(buffer: MsgpackBuffer, *accessors: List[Any]) -> object:
+    """Navigate through MessagePack data without decoding all of it.
+
+    The encoded data is walked through a memoryview, without copying it: map entries and
+    array items that are not in the path are skipped by reading their headers, and only the
+    value found is decoded. Results and errors are the same as `seek(unpackb(buffer), *accessors)`,
+    except that for duplicated keys the first one is taken.
+
+    Values are decoded as dict, list, str, bytes, int, float, bool or None. Arrays used as
+    map keys become tuples, and extension values become MsgpackExt. Negative indexes and
+    slices need the whole array, so it is decoded.
+
+    Parameters:
+      buffer: The MessagePack data, as bytes, bytearray, memoryview or any buffer
+      accessors: The keys or indexes to be accessed
+
+    Raises:
+      SeekError: if there is no key or index with a given accessor. The exception message
+      will provide details on where it could not access.
+      ValueError: if the data is not valid MessagePack along the path.
+
+    Examples:
+    .. code-block:: python
+      payload = msgpack.packb({'machines': [{'engine': {'name': 'V8'}}]})
+
+      seek_msgpack(payload, 'machines', 0, 'engine', 'name')
+      >>> 'V8'
+
+      seek_msgpack(payload, 'machines', 0, 'engine_2')
+      >>> SeekError
+    """
+    view = _memoryview(buffer)
+    kind, size, position = _header(view, 0)
+    original_data = _ROOT_PLACEHOLDERS.get(kind)
+    if original_data is None:
+        value, _ = _decode(view, 0)
+        return _seek_from(value, accessors, 0, value)
+
+    start = 0
+    for index, accessor in enumerate(accessors):
+        if kind == _MAP:
+            error, position = _enter_key(view, size, position, accessor)
+        elif kind == _ARRAY and isinstance(accessor, int) and accessor >= 0:
+            error, position = _enter_index(view, size, position, accessor)
+        elif kind == _ARRAY and isinstance(accessor, str):
+            error = TypeError("list indices must be integers or slices, not str")
+        else:
+            # Strings, numbers, negative indexes and slices need the whole value anyway
+            return _seek_from(_decode(view, start)[0], accessors, index, original_data)
+        if error is not None:
+            raise SeekError(index, original_data, accessors, error) from error
+        start = position
+        kind, size, position = _header(view, start)
+    return _decode(view, start)[0]
+
+
+def dig_msgpack(buffer: MsgpackBuffer, *accessors: List[Any], default: object = None) -> object:
+    """Safely navigate through MessagePack data without decoding all of it.
+
+    Works like `seek_msgpack`, but returns None or an user defined value when the path isn't there.
+
+    Parameters:
+      buffer: The MessagePack data, as bytes, bytearray, memoryview or any buffer
+      accessors: The keys or indexes to be accessed
+      default: The value returned when the search fails. By default it's None.
+
+    Raises:
+      ValueError: if the data is not valid MessagePack along the path.
+
+    Examples:
+    .. code-block:: python
+      dig_msgpack(payload, 'machines', 0, 'engine', 'name')
+      >>> 'V8'
+
+      dig_msgpack(payload, 'machines', 5, 'engine', default='')
+      >>> ''
+    """
+    try:
+        return seek_msgpack(buffer, *accessors)
+    except SeekError:
+        return default
@@ -0,0 +1,143 @@
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from py_data_digger import main
+from py_data_digger.main import _MISSING, _access, dig
+
+
+class _Node:
+    __slots__ = ("children", "names")
+
+    def __init__(self) -> None:
+        self.children: List[Tuple[Any, _Node]] = []
+        self.names: List[Hashable] = []
+
+    def child(self, accessor: object) -> "_Node":
+        # Accessors are compared by type too, since 1, 1.0 and True don't index lists alike
+        for existing, node in self.children:
+            if type(existing) is type(accessor) and existing == accessor:
+                return node
+        node = _Node()
+        self.children.append((accessor, node))
+        return node
+
+
+class PathTrie:
+    """Many named paths merged by their shared prefixes, to be dug in a single traversal.
+
+    Use `compile_paths` to build it, then reuse it for every document. Each shared
+    prefix is walked only once per document, and when it is missing every path
+    under it takes the default value without further probing.
+
+    While metrics or a profile are on, each path is dug on its own through `dig`,
+    so it is recorded like any other call.
+    """
+
+    __slots__ = ("_paths", "_root", "names")
+
+    def __init__(self, paths: Mapping[Hashable, Iterable[Any]]) -> None:
+        self._root = _Node()
+        self.names = tuple(paths)
+        self._paths: List[Tuple[Hashable, tuple]] = []
+        for name, accessors in paths.items():
+            if isinstance(accessors, (str, bytes)):
+                raise TypeError(  # noqa: TRY003
+                    f"Path {name!r} must be a sequence of accessors, not {type(accessors).__name__}"
+                )
+            accessors = tuple(accessors)
+            self._paths.append((name, accessors))
+            node = self._root
+            for accessor in accessors:
+                node = node.child(accessor)
+            node.names.append(name)
+
+    def dig(
+        self,
+        data: Union[Sequence, Mapping],
+        *,
+        dig_objects: bool = False,
+        default: object = None,
+    ) -> Dict[Hashable, object]:
+        """Safely dig every path in the data, returning a dict of results by path name."""
+        if main._observer is not None:
+            return {
+                name: dig(data, *accessors, dig_objects=dig_objects, default=default)
+                for name, accessors in self._paths
+            }
+        results = dict.fromkeys(self.names, default)
+        _walk(self._root, data, results, dig_objects)
+        return results
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"PathTrie(names={self.names!r})"
+
+
+def _trie_root(trie: PathTrie) -> _Node:
+    # For the helpers of this package walking a trie their own way
+    return trie._root
+
+
+def _walk(node: _Node, value: object, results: dict, objects: bool) -> None:
+    for name in node.names:
+        results[name] = value
+    for accessor, child in node.children:
+        found = _access(value, accessor, objects)
+        if found is not _MISSING:
+            _walk(child, found, results, objects)
+
+
+def compile_paths(paths: Mapping[Hashable, Iterable[Any]]) -> PathTrie:
+    """Merge many named paths into a reusable prefix trie.
+
+    Parameters:
+      paths: A mapping of result names to their sequences of accessors
+
+    Examples:
+    .. code-block:: python
+      engine_fields = compile_paths({
+          'engine_name': ('machines', 0, 'engine', 'name'),
+          'components': ('machines', 0, 'engine', 'components'),
+      })
+
+      engine_fields.dig(nasty_dict)
+      >>> {'engine_name': 'Motor XPTO', 'components': [...]}
+    """
+    return PathTrie(paths)
+
+
+def dig_paths(
+    data: Union[Sequence, Mapping],
+    paths: Union[Mapping[Hashable, Iterable[Any]], PathTrie],
+    dig_objects: bool = False,
+    default: object = None,
+) -> Dict[Hashable, object]:
+    """Safely navigate through many paths of the nested data at once.
+
+    Paths sharing a prefix walk it only once. If the data under a shared prefix
+    is missing, every path depending on it gets the default value.
+
+    Parameters:
+      data: The list, tuple, dict to be searched. By default it can't access object attributes
+      paths: A mapping of result names to their sequences of accessors, or a PathTrie built by
+      compile_paths to skip building it again
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      default: The value given to each path when its search fails. By default it's None.
+
+    Examples:
+    .. code-block:: python
+      my_dict = {
+      'item_a': {'fruits': ['apple', 'pea'], 'color': 'red'},
+      }
+
+      dig_paths(my_dict, {'fruit': ('item_a', 'fruits', 0), 'color': ('item_a', 'color')})
+      >>> {'fruit': 'apple', 'color': 'red'}
+
+      dig_paths(my_dict, {'fruit': ('item_b', 'fruits', 0), 'color': ('item_b', 'color')})
+      >>> {'fruit': None, 'color': None}
+    """
+    if not isinstance(paths, PathTrie):
+        paths = PathTrie(paths)
+    return paths.dig(data, dig_objects=dig_objects, default=default)
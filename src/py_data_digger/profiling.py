@@ -0,0 +1,210 @@
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from itertools import starmap
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from py_data_digger import main
+
+_PACKAGE_DIRECTORY = str(Path(__file__).resolve().parent)
+_SORT_KEYS = ("seconds", "exception_seconds", "calls", "misses", "mean_seconds")
+
+
+@dataclass(frozen=True)
+class PathProfile:
+    """What the calls of seek or dig with one path (and call site, when recorded) cost.
+
+    Attributes:
+      function: 'seek' or 'dig'
+      path: The accessors given to the calls
+      call_site: 'file:line' of the calling code, if call sites were recorded, else None
+      calls: How many calls were made
+      misses: How many calls failed to find their value
+      seconds: The time spent in the calls
+      exception_seconds: The part of that time spent raising and handling exceptions,
+      from each failed access to its handling
+    """
+
+    function: str
+    path: tuple
+    call_site: Optional[str]
+    calls: int
+    misses: int
+    seconds: float
+    exception_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        """The time spent per call."""
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class DigProfile:
+    """Timings of seek and dig calls by path, filled while a `profile()` block is active.
+
+    It is safe to share between threads.
+    """
+
+    def __init__(self, call_sites: bool = False) -> None:
+        self.call_sites = call_sites
+        self._lock = threading.Lock()
+        # [function, path, call site, calls, misses, seconds, exception seconds] by key
+        self._entries: Dict[tuple, list] = {}
+        self._attribute_fallbacks = {True: 0, False: 0}
+
+    def record_hit(
+        self, function: str, accessors: tuple, seconds: float, exception_seconds: float
+    ) -> None:
+        """Add a call that found its value."""
+        self._record(function, accessors, seconds, exception_seconds, 0)
+
+    def record_miss(
+        self,
+        function: str,
+        depth: int,  # noqa: ARG002
+        error: str,  # noqa: ARG002
+        accessors: tuple,
+        seconds: float,
+        exception_seconds: float,
+    ) -> None:
+        """Add a call that failed to find its value."""
+        self._record(function, accessors, seconds, exception_seconds, 1)
+
+    def record_attribute_fallback(self, found: bool) -> None:
+        """Count a lookup for an object attribute, after accessing by key or index failed."""
+        with self._lock:
+            self._attribute_fallbacks[found] += 1
+
+    def entries(self, sort_by: str = "seconds") -> List[PathProfile]:
+        """The profile of each path, the costliest first.
+
+        Parameters:
+          sort_by: 'seconds', 'exception_seconds', 'calls', 'misses' or 'mean_seconds'
+        """
+        if sort_by not in _SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {_SORT_KEYS!r}, got {sort_by!r}")  # noqa: TRY003
+        with self._lock:
+            entries = list(starmap(PathProfile, self._entries.values()))
+        return sorted(entries, key=lambda entry: getattr(entry, sort_by), reverse=True)
+
+    def report(self, sort_by: str = "seconds", limit: Optional[int] = 20) -> str:
+        """Render the costliest paths as a text table.
+
+        Examples:
+        .. code-block:: python
+          print(profiled.report(limit=2))
+          >>>  calls  misses  total ms  mean us  exc ms  function  path
+          >>>   1000     500     1.734    1.734   0.612  dig       machines -> 5 -> engine
+          >>>   1000       0     0.402    0.402   0.000  seek      machines -> 0
+        """
+        lines = [f"{'calls':>7} {'misses':>7} {'total ms':>9} {'mean us':>8} {'exc ms':>8}  function  path"]
+        for entry in self.entries(sort_by)[:limit]:
+            path = " -> ".join(map(str, entry.path))
+            if entry.call_site is not None:
+                path = f"{path}  ({entry.call_site})"
+            lines.append(
+                f"{entry.calls:>7} {entry.misses:>7} {entry.seconds * 1e3:>9.3f} "
+                f"{entry.mean_seconds * 1e6:>8.3f} {entry.exception_seconds * 1e3:>8.3f}  "
+                f"{entry.function:<8}  {path}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self, sort_by: str = "seconds", indent: Optional[int] = None) -> str:
+        """Dump the profile of every path, and the attribute lookups, as JSON.
+
+        Accessors that aren't JSON types are written as their repr.
+        """
+        with self._lock:
+            attribute_fallbacks = {
+                "hit": self._attribute_fallbacks[True],
+                "miss": self._attribute_fallbacks[False],
+            }
+        entries = [
+            {**asdict(entry), "path": list(entry.path), "mean_seconds": entry.mean_seconds}
+            for entry in self.entries(sort_by)
+        ]
+        document = {"paths": entries, "attribute_fallbacks": attribute_fallbacks}
+        return json.dumps(document, indent=indent, default=repr)
+
+    def write_json(self, path: str, sort_by: str = "seconds") -> None:
+        """Write the JSON dump to a file, replaced at once so it's never read half written."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:  # noqa: FURB103
+            file.write(self.to_json(sort_by, indent=2))
+        os.replace(temporary_path, path)
+
+    def reset(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._entries.clear()
+            self._attribute_fallbacks = {True: 0, False: 0}
+
+    def _record(
+        self, function: str, accessors: tuple, seconds: float, exception_seconds: float, miss: int
+    ) -> None:
+        call_site = _call_site() if self.call_sites else None
+        key = _key(function, accessors, call_site)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [function, accessors, call_site, 0, 0, 0.0, 0.0]
+            entry[3] += 1
+            entry[4] += miss
+            entry[5] += seconds
+            entry[6] += exception_seconds
+
+
+def _key(function: str, accessors: tuple, call_site: Optional[str]) -> Tuple:
+    try:
+        hash(accessors)
+    except TypeError:
+        # Like lists used as accessors, which are told apart by their repr
+        return function, repr(accessors), call_site
+    # Types are kept along with the accessors, since 1, 1.0 and True are equal keys
+    return function, accessors, tuple(map(type, accessors)), call_site
+
+
+def _call_site() -> str:
+    # The first frame outside of this package, so calls through DigView or dig_many count too
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIRECTORY):
+        frame = frame.f_back
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+@contextmanager
+def profile(call_sites: bool = False) -> Iterator[DigProfile]:
+    """Time every seek and dig call, by path, while the block runs.
+
+    Records, for each path, the calls, the misses, the time spent and the part of it spent
+    raising and handling exceptions, like KeyErrors of missing keys or AttributeErrors of
+    object attributes. Calls are timed through the same code they run unprofiled: dig probes
+    dicts, lists, tuples and strings without raising, so only its failed subscripts of other
+    types count as exception time. Compiled paths, dig_many, dig_paths and DigView are
+    recorded as the seek and dig calls they stand for. Calls from every thread are recorded.
+    Profiles can be nested, and used along with metrics. Once the block ends, seek and dig are
+    back to their usual speed.
+
+    Parameters:
+      call_sites: If call_sites is True, calls are also told apart by the file and line of the
+      code calling seek or dig. Finding it costs some time per call.
+
+    Examples:
+    .. code-block:: python
+      with profile() as profiled:
+          for record in records:
+              dig(record, 'machines', 0, 'engine', 'name')
+
+      print(profiled.report())
+      profiled.write_json('dig_profile.json')
+    """
+    profiler = DigProfile(call_sites)
+    main._add_observer(profiler)
+    try:
+        yield profiler
+    finally:
+        main._remove_observer(profiler)
@@ -0,0 +1,244 @@
+from functools import lru_cache
+from itertools import count
+from keyword import iskeyword
+from types import FunctionType
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from py_data_digger.main import _LOOKUP_ERRORS, _MISSING, dig
+from py_data_digger.paths import PathTrie, _Node, _trie_root
+
+_OUTPUTS = ("dict", "tuple", "slots")
+_SCHEMA_CACHE_SIZE = 256
+
+
+class SchemaRecord:
+    """Base of the records made by schemas compiled with output='slots'."""
+
+    __slots__ = ()
+
+    def _asdict(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompiledSchema:
+    """A record extractor generated for a schema. Use `compile_schema` to build it.
+
+    Attributes:
+      fields: The field names, in the order of the schema
+      output: How records are returned: 'dict', 'tuple' or 'slots'
+      source: The Python source of the generated extractor, to be inspected
+      record_type: The generated SchemaRecord subclass when output is 'slots', else None
+      extract: The generated function itself, spares a call when used in hot loops
+    """
+
+    __slots__ = ("extract", "fields", "output", "record_type", "source")
+
+    def __init__(
+        self,
+        fields: Tuple[Hashable, ...],
+        output: str,
+        source: str,
+        record_type: Optional[type],
+        extract: Callable[[object], object],
+    ) -> None:
+        self.fields = fields
+        self.output = output
+        self.source = source
+        self.record_type = record_type
+        self.extract = extract
+
+    def __call__(self, record: object) -> object:
+        """Extract a record from the data."""
+        return self.extract(record)
+
+    def extract_many(self, records: Iterable) -> Iterator[object]:
+        """Lazily extract every record."""
+        return map(self.extract, records)
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema(fields={self.fields!r}, output={self.output!r})"
+
+
+def _literal(accessor: object, constants: List[object]) -> str:
+    # Strings and ints are written in the source, anything else is read from the globals
+    if type(accessor) is str or type(accessor) is int:
+        return repr(accessor)
+    constants.append(accessor)
+    return f"_c{len(constants) - 1}"
+
+
+def _generate_steps(root: _Node, lines: List[str], constants: List[object]) -> Dict[int, str]:
+    # One local per node of the trie, so shared prefixes are subscripted once.
+    # Statements are kept flat, since nested try blocks are limited to 20 levels.
+    variables = {}
+    names = count(1)
+
+    def visit(node: _Node, variable: str) -> None:
+        for field_index in node.names:
+            variables[field_index] = variable
+        for accessor, child in node.children:
+            child_variable = f"n{next(names)}"
+            lines.append(f"    {child_variable} = _MISSING")
+            indent = "    "
+            if variable != "record":
+                lines.append(f"    if {variable} is not _MISSING:")
+                indent = "        "
+            lines.extend(
+                (
+                    f"{indent}try:",
+                    f"{indent}    {child_variable} = {variable}[{_literal(accessor, constants)}]",
+                    f"{indent}except _LOOKUP_ERRORS:",
+                    f"{indent}    pass",
+                )
+            )
+            visit(child, child_variable)
+
+    visit(root, "record")
+    return variables
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _generate(structure: tuple, output: str, objects: bool) -> tuple:
+    names = [name for name, _ in structure]
+    paths = [tuple(accessor for _, accessor in typed_path) for _, typed_path in structure]
+    root = _trie_root(PathTrie(dict(enumerate(paths))))
+    constants: List[object] = []
+    lines = ["def extract(record):"]
+    variables = _generate_steps(root, lines, constants)
+
+    values = []
+    for index, variable in enumerate(variables[i] for i in range(len(paths))):
+        if variable == "record":
+            values.append("record")
+        elif objects:
+            values.append(
+                f"{variable} if {variable} is not _MISSING "
+                f"else _dig(record, *_p{index}, dig_objects=True, default=_d{index})"
+            )
+        else:
+            values.append(f"{variable} if {variable} is not _MISSING else _d{index}")
+
+    if output == "dict":
+        keys = [_literal(name, constants) for name in names]
+        items = ", ".join(f"{key}: {value}" for key, value in zip(keys, values))
+        lines.append(f"    return {{{items}}}")
+    elif output == "tuple":
+        lines.append(f"    return ({''.join(f'{value}, ' for value in values)})")
+    else:
+        lines.append(f"    return _Record({', '.join(values)})")
+        # The instance is named __self, which field names starting with __ can't clash with
+        arguments = "".join(f", {name}" for name in names)
+        assignments = [f"        __self.{name} = {name}" for name in names] or ["        pass"]
+        lines[:0] = [
+            "class Record(_SchemaRecord):",
+            f"    __slots__ = {tuple(names)!r}",
+            "",
+            f"    def __init__(__self{arguments}):",
+            *assignments,
+            "",
+            "",
+        ]
+
+    source = "\n".join(lines) + "\n"
+    namespace = {"_SchemaRecord": SchemaRecord}
+    exec(compile(source, "<py_data_digger schema>", "exec"), namespace)  # noqa: S102
+    return source, namespace["extract"].__code__, namespace.get("Record"), tuple(constants)
+
+
+def _structure(schema: Mapping[Hashable, tuple], output: str) -> tuple:
+    structure = []
+    for name, field in schema.items():
+        if not isinstance(field, tuple) or len(field) != 2 or isinstance(field[0], (str, bytes)):
+            raise TypeError(  # noqa: TRY003
+                f"Field {name!r} must be a pair of a sequence of accessors and a default value"
+            )
+        # Names starting with __ would be mangled by the generated class
+        is_attribute = (
+            isinstance(name, str)
+            and name.isidentifier()
+            and not iskeyword(name)
+            and not name.startswith("__")
+        )
+        if output == "slots" and not is_attribute:
+            raise ValueError(f"Field {name!r} can't be an attribute of a slots record")  # noqa: TRY003
+        # Types are kept along with the accessors, since 1, 1.0 and True are equal keys
+        structure.append((name, tuple((type(accessor), accessor) for accessor in field[0])))
+    return tuple(structure)
+
+
+def compile_schema(
+    schema: Mapping[Hashable, tuple],
+    output: str = "dict",
+    dig_objects: bool = False,
+) -> CompiledSchema:
+    """Generate a function extracting a flat record of many fields from nested data.
+
+    The generated function subscripts straight through the data, keeping each shared prefix
+    of the paths in a local variable, so it's visited once. Whatever the output, each field
+    gets exactly what `dig(data, *accessors, dig_objects=dig_objects, default=default)` would
+    give. Generated code is cached by the structure of the schema (names, accessors and
+    output), so compiling the same schema again is cheap.
+
+    Parameters:
+      schema: A mapping of field names to pairs of a sequence of accessors and a default value
+      output: 'dict' for dicts, 'tuple' for tuples in the order of the schema, or 'slots' for
+      instances of a generated SchemaRecord class with __slots__, which take less memory.
+      dig_objects: If dig_objects is True, fields whose subscripts fail are dug with
+      dig_objects=True, also trying attributes of objects.
+
+    Raises:
+      TypeError: if a field isn't a pair of accessors and a default.
+      ValueError: if the output is unknown, or a field name can't be a slots attribute.
+
+    Examples:
+    .. code-block:: python
+      extract = compile_schema({
+          'machine': (('machines', 0, 'machine_id'), None),
+          'engine': (('machines', 0, 'engine', 'name'), 'unknown'),
+      })
+
+      extract(nasty_dict)
+      >>> {'machine': 1234, 'engine': 'V8'}
+
+      print(extract.source)
+      >>> def extract(record):
+      >>>     n1 = _MISSING
+      >>>     try:
+      >>>         n1 = record['machines']
+      >>>     ...
+    """
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS!r}, got {output!r}")  # noqa: TRY003
+    structure = _structure(schema, output)
+    try:
+        hash(structure)
+    except TypeError:
+        # Unhashable accessors can't be cached
+        generated = _generate.__wrapped__(structure, output, dig_objects)
+    else:
+        generated = _generate(structure, output, dig_objects)
+    source, code, record_type, constants = generated
+
+    namespace = {
+        "_MISSING": _MISSING,
+        "_LOOKUP_ERRORS": _LOOKUP_ERRORS,
+        "_dig": dig,
+        "_Record": record_type,
+    }
+    namespace.update((f"_c{index}", constant) for index, constant in enumerate(constants))
+    for index, (accessors, default) in enumerate(schema.values()):
+        namespace[f"_d{index}"] = default
+        namespace[f"_p{index}"] = tuple(accessors)
+    extract = FunctionType(code, namespace, "extract")
+    return CompiledSchema(tuple(schema), output, source, record_type, extract)
@@ -0,0 +1,131 @@
+from collections.abc import Mapping
+from itertools import chain
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from py_data_digger.main import _MISSING, _strategy
+
+
+def _children(node: object, objects: bool) -> Optional[Tuple[Iterator[tuple], bool]]:
+    # The accessors and values under a node, and whether the accessors are names (dict keys or
+    # attribute names) rather than indexes
+    if isinstance(node, Mapping):
+        return iter(node.items()), True
+    if isinstance(node, (list, tuple)):
+        return enumerate(node), False
+    if not objects or isinstance(node, (str, bytes, bytearray)) or _strategy(type(node))[0]:
+        # Subscriptable objects would be sought by subscript rather than by attribute
+        return None
+    return iter(_attributes(node)), True
+
+
+def _attributes(node: object) -> List[Tuple[str, object]]:
+    attributes = list(getattr(node, "__dict__", {}).items())
+    for klass in type(node).__mro__:
+        slots = vars(klass).get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name.startswith("__") and name.endswith("__"):
+                # Like __dict__, __weakref__ or the internals of Pydantic models
+                continue
+            value = getattr(node, name, _MISSING)
+            if value is not _MISSING:
+                attributes.append((name, value))
+    return attributes
+
+
+def _equals(found: object, value: object) -> bool:
+    try:
+        return found is value or bool(found == value)
+    except (TypeError, ValueError):
+        # Like NumPy arrays, whose comparisons have no single truth value
+        return False
+
+
+def _walk(
+    data: object, max_depth: Optional[int], objects: bool
+) -> Iterator[Tuple[tuple, object, bool]]:
+    # Yields the path, value and whether the last accessor is a name, for every node under data.
+    # The walk keeps one frame per container of the current path, and their ids to spot cycles.
+    children = _children(data, objects)
+    if children is None or max_depth == 0:
+        return
+    stack = [(id(data), *children)]
+    ancestors = {id(data)}
+    path: List[object] = []
+    while stack:
+        node_id, items, are_names = stack[-1]
+        child = next(items, _MISSING)
+        if child is _MISSING:
+            stack.pop()
+            ancestors.discard(node_id)
+            if path:
+                path.pop()
+            continue
+
+        accessor, found = child
+        found_path = (*path, accessor)
+        yield found_path, found, are_names
+
+        if (max_depth is not None and len(found_path) >= max_depth) or id(found) in ancestors:
+            continue
+        children = _children(found, objects)
+        if children is not None:
+            stack.append((id(found), *children))
+            ancestors.add(id(found))
+            path.append(accessor)
+
+
+def find_paths(
+    data: Union[Sequence, Mapping],
+    key: object = _MISSING,
+    value: object = _MISSING,
+    predicate: Optional[Callable[[tuple, object], bool]] = None,
+    max_depth: Optional[int] = None,
+    max_results: Optional[int] = None,
+    objects: bool = False,
+) -> Iterator[tuple]:
+    """Look everywhere in the data for paths matching the given key, value and predicate.
+
+    Walks the data depth first, lazily: paths are yielded as they are found, and the walk
+    stops as soon as the consumer stops asking or max_results are found. Every criterion
+    given must match. Each path yielded can be given straight to `seek(data, *path)` (with
+    seek_objects=True if objects is True).
+
+    Containers that hold themselves, directly or not, are never walked twice on the same path,
+    so cyclic object graphs end. Strings are values, not walked into.
+
+    Parameters:
+      data: The list, tuple, dict to be searched
+      key: A dict key or attribute name to find. List and tuple indexes never match a key.
+      value: A value to find, compared with ==
+      predicate: A function taking a path and the value it leads to, telling if it matches
+      max_depth: Don't look at paths longer than this. By default there is no limit.
+      max_results: Stop after finding this many paths. By default there is no limit.
+      objects: If objects is True, also walks the attributes of objects that can't be
+      subscripted, like dataclasses and Pydantic models.
+
+    Examples:
+    .. code-block:: python
+      list(find_paths(nasty_dict, key='id'))
+      >>> [('machines', 0, 'engine', 'id'), ('machines', 0, 'engine', 'components', 0, 'id'), ...]
+
+      next(find_paths(nasty_dict, value='Cog'))
+      >>> ('machines', 0, 'engine', 'components', 0, 'name')
+
+      list(find_paths(nasty_dict, predicate=lambda path, value: isinstance(value, list), max_depth=4))
+      >>> [('machines',), ('machines', 0, 'engine', 'components')]
+    """
+    if max_results is not None and max_results <= 0:
+        return
+    results = 0
+    nodes = chain([((), data, False)], _walk(data, max_depth, objects))
+    for path, found, is_name in nodes:
+        if key is not _MISSING and not (is_name and _equals(path[-1], key)):
+            continue
+        if value is not _MISSING and not _equals(found, value):
+            continue
+        if predicate is not None and not predicate(path, found):
+            continue
+        yield path
+        results += 1
+        if results == max_results:
+            return
@@ -0,0 +1,230 @@
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from time import perf_counter
+from typing import List, Mapping, Sequence, Tuple, Union
+
+from py_data_digger.main import dig, seek
+
+PATH_CACHE_SIZE = 1024
+
+_INDEX = re.compile(r"(-?\d+)\]")
+_ESCAPABLE = frozenset(".[]\\")
+
+_parse_seconds = 0.0
+_parse_seconds_lock = threading.Lock()
+
+
+class PathSyntaxError(ValueError):
+    """Raised when a path string doesn't follow the path syntax.
+
+    Attributes:
+      path: The path string given
+      position: Where in the path string the problem was found
+      reason: What was expected there
+    """
+
+    def __init__(self, path: str, position: int, reason: str) -> None:
+        super().__init__(f"Invalid path {path!r} at position {position}: {reason}")
+        self.path = path
+        self.position = position
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class PathCacheInfo:
+    """How parsed path strings were served: from the cache (hits) or parsed (misses)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    parse_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of calls served from the cache, from 0 to 1."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def _parse_name(path: str, position: int) -> Tuple[str, int]:
+    characters = []
+    length = len(path)
+    while position < length:
+        character = path[position]
+        if character in ".[":
+            break
+        if character == "]":
+            raise PathSyntaxError(path, position, "unexpected ']'")
+        if character == "\\":
+            position += 1
+            if position == length or path[position] not in _ESCAPABLE:
+                raise PathSyntaxError(path, position, "only '.', '[', ']' and '\\' can be escaped")
+            character = path[position]
+        characters.append(character)
+        position += 1
+    if not characters:
+        raise PathSyntaxError(path, position, "expected a name")
+    return "".join(characters), position
+
+
+def _parse_quoted(path: str, position: int) -> Tuple[str, int]:
+    quote = path[position]
+    start = position
+    position += 1
+    characters = []
+    length = len(path)
+    while position < length:
+        character = path[position]
+        if character == quote:
+            if path[position + 1 : position + 2] != "]":
+                raise PathSyntaxError(path, position + 1, "expected ']' after the quoted key")
+            return "".join(characters), position + 2
+        if character == "\\":
+            position += 1
+            if position == length:
+                break
+            character = path[position]
+        characters.append(character)
+        position += 1
+    raise PathSyntaxError(path, start, "unclosed quote")
+
+
+def _parse_bracket(path: str, position: int) -> Tuple[Union[str, int], int]:
+    position += 1
+    if path[position : position + 1] in {'"', "'"}:
+        return _parse_quoted(path, position)
+    match = _INDEX.match(path, position)
+    if match is None:
+        raise PathSyntaxError(path, position, "expected an integer index or a quoted key")
+    return int(match.group(1)), match.end()
+
+
+def _parse(path: str) -> Tuple[Union[str, int], ...]:
+    if not isinstance(path, str):
+        raise TypeError(f"path must be a string, got {type(path).__name__}")  # noqa: TRY003
+    accessors: List[Union[str, int]] = []
+    position = 0
+    length = len(path)
+    while position < length:
+        character = path[position]
+        if character == "[":
+            accessor, position = _parse_bracket(path, position)
+        elif character == "." and accessors:
+            accessor, position = _parse_name(path, position + 1)
+        elif not accessors:
+            accessor, position = _parse_name(path, position)
+        else:
+            raise PathSyntaxError(path, position, "expected '.' or '['")
+        accessors.append(accessor)
+    return tuple(accessors)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    r"""Split a path string into its accessors.
+
+    Names are separated by dots, and brackets hold integer indexes (negative ones too) or
+    quoted keys. Parsed paths are kept in a LRU cache, so a path used over and over is only
+    parsed once.
+
+    Syntax:
+      - name: a dict key or attribute name. Dots, brackets and backslashes in it must be
+        escaped with a backslash, like `version\.major`.
+      - [0], [-1]: an integer index.
+      - ["any key"], ['any key']: a key holding any character, with backslash escapes.
+        Use it for keys made of digits, like ["0"].
+
+    Raises:
+      PathSyntaxError: if the path doesn't follow the syntax. The message tells where.
+
+    Examples:
+    .. code-block:: python
+      parse_path('machines[0].engine.components[-1].name')
+      >>> ('machines', 0, 'engine', 'components', -1, 'name')
+
+      parse_path('settings["log.level"]')
+      >>> ('settings', 'log.level')
+    """
+    global _parse_seconds
+    started = perf_counter()
+    try:
+        return _parse(path)
+    finally:
+        elapsed = perf_counter() - started
+        with _parse_seconds_lock:
+            _parse_seconds += elapsed
+
+
+def path_cache_info() -> PathCacheInfo:
+    """Tell how well the parsed paths cache is doing, and how long parsing took overall.
+
+    Examples:
+    .. code-block:: python
+      path_cache_info()
+      >>> PathCacheInfo(hits=9998, misses=2, maxsize=1024, currsize=2, parse_seconds=1.2e-05)
+    """
+    info = parse_path.cache_info()
+    return PathCacheInfo(info.hits, info.misses, info.maxsize, info.currsize, _parse_seconds)
+
+
+def clear_path_cache() -> None:
+    """Forget every parsed path, and reset the cache counters."""
+    global _parse_seconds
+    with _parse_seconds_lock:
+        parse_path.cache_clear()
+        _parse_seconds = 0.0
+
+
+def seek_path(data: Union[Sequence, Mapping], path: str, seek_objects: bool = False) -> object:
+    """Navigate through the data following a path string, just like `seek(data, *parse_path(path))`.
+
+    Parameters:
+      data: The list, tuple, dict to be searched
+      path: The accessors as a path string, see parse_path
+      seek_objects: If seek_objects is True, also tries to get an attribute of an object
+      with the given name
+
+    Raises:
+      PathSyntaxError: if the path doesn't follow the syntax.
+      SeekError: if there is no key, index or attribute with a given accessor.
+
+    Examples:
+    .. code-block:: python
+      seek_path(nasty_dict, 'machines[0].engine.components[-1].name')
+      >>> 'Cog'
+    """
+    return seek(data, *parse_path(path), seek_objects=seek_objects)
+
+
+def dig_path(
+    data: Union[Sequence, Mapping],
+    path: str,
+    dig_objects: bool = False,
+    default: object = None,
+) -> object:
+    """Safely navigate through the data following a path string, like `dig(data, *parse_path(path))`.
+
+    A path with a syntax error is a bug rather than missing data, so it still raises.
+
+    Parameters:
+      data: The list, tuple, dict to be searched
+      path: The accessors as a path string, see parse_path
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name.
+      default: The value returned when the search fails. By default it's None.
+
+    Raises:
+      PathSyntaxError: if the path doesn't follow the syntax.
+
+    Examples:
+    .. code-block:: python
+      dig_path(nasty_dict, 'machines[0].engine.components[-1].name')
+      >>> 'Cog'
+
+      dig_path(nasty_dict, 'machines[9].engine', default='no engine')
+      >>> 'no engine'
+    """
+    return dig(data, *parse_path(path), dig_objects=dig_objects, default=default)
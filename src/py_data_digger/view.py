@@ -0,0 +1,127 @@
+from time import perf_counter
+from typing import Iterator, Mapping, Optional, Sequence, Union
+
+from py_data_digger import main
+from py_data_digger.main import _MISSING, SeekError, _seek_from
+
+
+class DigView:
+    """A lazy path into the data, resolved only when its value is needed.
+
+    Subscripting a view, or reading an attribute of it, gives a new view one accessor deeper
+    without touching the data: `view['machines'][0].engine` is the path
+    ('machines', 0, 'engine'). The path is resolved by `.value()`, `.get()` or iterating the
+    view, with the same rules as `seek` and `dig`. Each view remembers the node it resolved to,
+    so views extended from it start from there instead of the root.
+
+    Attribute access can't reach the names of the view's own members (value, get and path)
+    nor names starting with an underscore: subscript those, like `view['path']`.
+
+    Resolved nodes are a snapshot: changes made to the data afterwards aren't seen by the view
+    nor by the views extended from it. Create a new DigView to see them.
+
+    While metrics or a profile are on, resolving a view is recorded as a seek (or a dig, for
+    `.get()`) of its whole path, timing only the accessors not yet resolved.
+
+    Parameters:
+      data: The list, tuple, dict (or any object if objects is True) to be navigated
+      objects: If objects is True, also tries to get an attribute of an object with the
+      given name, like `seek(data, *path, seek_objects=True)`
+
+    Examples:
+    .. code-block:: python
+      machine = DigView(nasty_dict)['machines'][0]
+      engine = machine.engine
+
+      engine['name'].value()
+      >>> 'V8'
+      engine.cylinders.get(default=0)
+      >>> 0
+      machine.engine_2.value()
+      >>> SeekError: Data digger can't go any further: KeyError
+      >>> Path traveled: dict -> machines -> 0 -> engine_2
+    """
+
+    __slots__ = ("_data", "_node", "_objects", "_parent", "path")
+
+    def __init__(self, data: Union[Sequence, Mapping], objects: bool = False) -> None:
+        self._data = data
+        self._objects = objects
+        self._parent: Optional[DigView] = None
+        self._node = data
+        self.path: tuple = ()
+
+    def value(self) -> object:
+        """Resolve the path, just like `seek(data, *path)`.
+
+        Raises:
+          SeekError: if there is no key, index or attribute with a given accessor.
+        """
+        observer = main._observer
+        if observer is not None:
+            return self._observed_value(observer, "seek")
+        return self._resolve()
+
+    def get(self, default: object = None) -> object:
+        """Safely resolve the path, just like `dig(data, *path, default=default)`."""
+        observer = main._observer
+        try:
+            if observer is not None:
+                return self._observed_value(observer, "dig")
+            return self._resolve()
+        except SeekError:
+            return default
+
+    def _resolve(self) -> object:
+        node = self._node
+        if node is not _MISSING:
+            return node
+        # The views up to the closest one already resolved, which at worst is the root
+        unresolved = []
+        view = self
+        while view._node is _MISSING:
+            unresolved.append(view)
+            view = view._parent
+        node = view._node
+        for view in reversed(unresolved):
+            try:
+                node = _seek_from(node, view.path, len(view.path) - 1, self._data, self._objects)
+            except SeekError as e:
+                # Reported for the whole path, like seek would
+                raise SeekError(e.index, self._data, self.path, e.original_error) from e.original_error
+            view._node = node
+        return node
+
+    def _observed_value(self, observer: object, function: str) -> object:
+        # The time of the exceptions raised on the way isn't told apart from the rest
+        started = perf_counter()
+        try:
+            node = self._resolve()
+        except SeekError as e:
+            error = type(e.original_error).__name__
+            seconds = perf_counter() - started
+            observer.record_miss(function, e.index, error, self.path, seconds, 0.0)
+            raise
+        observer.record_hit(function, self.path, perf_counter() - started, 0.0)
+        return node
+
+    def __getitem__(self, accessor: object) -> "DigView":
+        view = DigView.__new__(DigView)
+        view._data = self._data
+        view._objects = self._objects
+        view._parent = self
+        view._node = _MISSING
+        view.path = (*self.path, accessor)
+        return view
+
+    def __getattr__(self, name: str) -> "DigView":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.value())
+
+    def __repr__(self) -> str:
+        path = "".join(f" -> {accessor!r}" for accessor in self.path)
+        return f"DigView(<{type(self._data).__name__}>{path}, objects={self._objects!r})"
@@ -0,0 +1,217 @@
+import marshal
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Optional, Sequence, Union
+
+from py_data_digger.main import _MISSING, _access
+from py_data_digger.paths import PathTrie, _Node, _trie_root
+from py_data_digger.search import _attributes
+
+_SCALAR_TYPES = frozenset((str, int, bool, float, bytes, type(None)))
+_CYCLE_FINGERPRINT = hash("py_data_digger cycle")
+
+
+@dataclass(frozen=True)
+class PathChange:
+    """A watched path whose value changed.
+
+    Attributes:
+      path: The accessors of the path
+      old: The value dug when the path last changed, or the default
+      new: The value dug now, or the default if the path is missing
+    """
+
+    path: tuple
+    old: object
+    new: object
+
+
+def _equal(old: object, new: object) -> bool:
+    try:
+        if old == new:
+            return True
+    except (TypeError, ValueError):
+        # Like NumPy arrays, whose comparisons have no single truth value
+        return False
+    # NaN is never equal to itself, but it didn't change
+    return type(old) is float and type(new) is float and old != old and new != new
+
+
+def _fingerprint(value: object, objects: bool) -> Optional[int]:
+    # Only taken for values that could be changed in place, to tell later if they were.
+    # Marshal serializes plain containers in C; anything else is walked in Python.
+    if type(value) in _SCALAR_TYPES:
+        return None
+    try:
+        # Version 2 has no back references, which would depend on reference counts
+        return hash(marshal.dumps(value, 2))
+    except ValueError:
+        return _walk_fingerprint(value, objects, {})
+
+
+def _walk_fingerprint(value: object, objects: bool, memo: Dict[int, int]) -> int:
+    # A hash of the structure and the content of the value. Containers are memoized by id,
+    # which also cuts cycles.
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return hash((value_type, value if value == value else "nan"))
+    key = id(value)
+    fingerprint = memo.get(key)
+    if fingerprint is not None:
+        return fingerprint
+    memo[key] = _CYCLE_FINGERPRINT
+    if isinstance(value, Mapping):
+        items = sum(
+            hash((_walk_fingerprint(k, objects, memo), _walk_fingerprint(v, objects, memo)))
+            for k, v in value.items()
+        )
+        fingerprint = hash((value_type, len(value), items))
+    elif isinstance(value, (list, tuple)):
+        fingerprint = hash((value_type, tuple(_walk_fingerprint(item, objects, memo) for item in value)))
+    elif objects and (hasattr(value, "__dict__") or hasattr(value, "__slots__")):
+        attributes = sorted(
+            (name, _walk_fingerprint(attribute, objects, memo)) for name, attribute in _attributes(value)
+        )
+        fingerprint = hash((value_type, tuple(attributes)))
+    else:
+        try:
+            fingerprint = hash((value_type, value))
+        except TypeError:
+            # Opaque unhashable values only stay the same while they are the same object
+            fingerprint = hash((value_type, key))
+    memo[key] = fingerprint
+    return fingerprint
+
+
+class PathWatcher:
+    """Watch many named paths across versions of a document, reporting only what changed.
+
+    On each new version of the document, paths are dug through a prefix trie like `dig_paths`,
+    and a path changed when its value isn't equal (==) to the last one. When a watched value is
+    unchanged, the watched paths inside it are unchanged too, so they are skipped without being
+    dug or compared.
+
+    Values that could be changed in place, like dicts, lists and objects, are kept along with a
+    fingerprint: a hash of their whole structure and content, taken when they are stored. When
+    the same object is dug again, as when a document is changed in place and given again, the
+    fingerprints tell if it changed. With dig_objects, objects are fingerprinted by their
+    attributes; otherwise objects other than dicts, lists and tuples are fingerprinted with
+    hash(), or by identity when unhashable.
+
+    Parameters:
+      paths: A mapping of names to their sequences of accessors, or a PathTrie built by
+      compile_paths
+      dig_objects: If dig_objects is True, also tries to get an attribute of an object
+      with the given name, and fingerprints objects by their attributes.
+      default: The value of a path when it's missing. By default it's None.
+
+    Attributes:
+      last_skipped: How many watched paths the last update skipped, because a watched value
+      holding them was unchanged
+
+    Examples:
+    .. code-block:: python
+      watcher = PathWatcher({
+          'engine': ('machines', 0, 'engine'),
+          'engine_name': ('machines', 0, 'engine', 'name'),
+          'total': ('total',),
+      })
+
+      watcher.update(fetch_document())  # Everything is new the first time
+      >>> {'engine': PathChange(...), 'engine_name': PathChange(...), 'total': PathChange(...)}
+
+      watcher.update(fetch_document())
+      >>> {'total': PathChange(path=('total',), old=3, new=4)}
+    """
+
+    def __init__(
+        self,
+        paths: Union[Mapping[Hashable, Iterable[Any]], PathTrie],
+        dig_objects: bool = False,
+        default: object = None,
+    ) -> None:
+        if not isinstance(paths, PathTrie):
+            paths = PathTrie(paths)
+        self.dig_objects = dig_objects
+        self.default = default
+        self.last_skipped = 0
+        self._trie = paths
+        self._lock = threading.Lock()
+        # (value, fingerprint) by name, for the names already seen
+        self._state: Dict[Hashable, tuple] = {}
+        self._paths: Dict[Hashable, tuple] = {}
+        self._names_below: Dict[int, int] = {}
+        self._collect(_trie_root(paths), ())
+
+    @property
+    def values(self) -> Dict[Hashable, object]:
+        """The last value of each path, or the default before the first update."""
+        with self._lock:
+            return {
+                name: self._state[name][0] if name in self._state else self.default
+                for name in self._trie.names
+            }
+
+    def update(self, data: Union[Sequence, Mapping]) -> Dict[Hashable, PathChange]:
+        """Dig every path in the new version of the data, returning the changes by name.
+
+        On the first update, every path is reported, with the default as its old value.
+        """
+        changes: Dict[Hashable, PathChange] = {}
+        with self._lock:
+            self.last_skipped = 0
+            self._visit(_trie_root(self._trie), data, changes)
+        return changes
+
+    def reset(self) -> None:
+        """Forget the last values, so the next update reports every path."""
+        with self._lock:
+            self._state.clear()
+            self.last_skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def __repr__(self) -> str:
+        return f"PathWatcher(names={self._trie.names!r}, dig_objects={self.dig_objects!r})"
+
+    def _collect(self, node: _Node, path: tuple) -> int:
+        # Remembers the path of each name, and how many names each node holds below it
+        for name in node.names:
+            self._paths[name] = path
+        below = 0
+        for accessor, child in node.children:
+            below += len(child.names) + self._collect(child, (*path, accessor))
+        self._names_below[id(node)] = below
+        return below
+
+    def _changed(self, name: Hashable, new: object) -> bool:
+        last = self._state.get(name)
+        if last is None:
+            return True
+        old, fingerprint = last
+        if new is old:
+            # Compared with itself, only the fingerprint tells if it was changed in place
+            return fingerprint is not None and _fingerprint(new, self.dig_objects) != fingerprint
+        return not _equal(old, new)
+
+    def _visit(self, node: _Node, value: object, changes: dict) -> None:
+        if node.names:
+            new = self.default if value is _MISSING else value
+            unchanged = True
+            for name in node.names:
+                if not self._changed(name, new):
+                    continue
+                unchanged = False
+                old = self._state[name][0] if name in self._state else self.default
+                changes[name] = PathChange(self._paths[name], old, new)
+                self._state[name] = (new, _fingerprint(new, self.dig_objects))
+            if unchanged and node.children:
+                # Everything below is part of the unchanged value
+                self.last_skipped += self._names_below[id(node)]
+                return
+
+        for accessor, child in node.children:
+            found = _MISSING if value is _MISSING else _access(value, accessor, self.dig_objects)
+            self._visit(child, found, changes)
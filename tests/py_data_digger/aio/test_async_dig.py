@@ -0,0 +1,134 @@
+import asyncio
+import subprocess  # noqa: S404
+import sys
+from typing import Generator
+
+from pytest import raises
+
+from src.py_data_digger import SeekError, adig, adig_paths, aseek
+from tests.py_data_digger.conftest import SomeObject
+
+
+async def fetch(value: object, delay: float = 0) -> object:
+    await asyncio.sleep(delay)
+    return value
+
+
+class Lazy:
+    """Awaitable that only starts fetching its value when awaited."""
+
+    def __init__(self, value: object, delay: float = 0) -> None:
+        self.value = value
+        self.delay = delay
+
+    def __await__(self) -> Generator:
+        return fetch(self.value, self.delay).__await__()
+
+
+def lazy_document() -> dict:
+    return {
+        "machines": Lazy([{"engine": Lazy({"name": "Motor XPTO", "components": ["Cog"]})}]),
+        "owner": Lazy(SomeObject()),
+        "ready": "plain value",
+    }
+
+
+class TestAseek:
+    """Test seeking through data holding awaitables."""
+
+    @staticmethod
+    def test_awaits_along_the_path() -> None:
+        assert asyncio.run(aseek(lazy_document(), "machines", 0, "engine", "name")) == "Motor XPTO"
+        assert asyncio.run(aseek(fetch({"a": fetch(1)}), "a")) == 1
+        assert asyncio.run(aseek(lazy_document(), "ready")) == "plain value"
+
+    @staticmethod
+    def test_seek_objects() -> None:
+        result = asyncio.run(aseek(lazy_document(), "owner", "nested_string", seek_objects=True))
+
+        assert result == "This is a string inside object"
+
+    @staticmethod
+    def test_raises_seek_error() -> None:
+        with raises(SeekError) as ex_info:
+            asyncio.run(aseek(lazy_document(), "machines", 0, "engine_2"))
+
+        assert type(ex_info.value.__cause__) is KeyError
+        assert "Path traveled: dict -> machines -> 0 -> engine_2" in ex_info.value.message
+
+
+class TestAdig:
+    """Test digging through data holding awaitables."""
+
+    @staticmethod
+    def test_dig_and_default() -> None:
+        assert asyncio.run(adig(lazy_document(), "machines", 0, "engine", "components", 0)) == "Cog"
+        assert asyncio.run(adig(lazy_document(), "machines", 1, default="none")) == "none"
+        assert asyncio.run(adig(lazy_document(), "owner", "nested_string")) is None
+
+    @staticmethod
+    def test_errors_from_awaitables_are_not_caught() -> None:
+        async def broken() -> None:
+            await asyncio.sleep(0)
+            raise ConnectionError
+
+        with raises(ConnectionError):
+            asyncio.run(adig({"a": broken()}, "a", "b"))
+
+
+class TestAdigPaths:
+    """Test digging many paths of data holding awaitables."""
+
+    @staticmethod
+    def test_shared_prefixes_are_awaited_once() -> None:
+        results = asyncio.run(
+            adig_paths(
+                lazy_document(),
+                {
+                    "name": ("machines", 0, "engine", "name"),
+                    "component": ("machines", 0, "engine", "components", 0),
+                    "owner": ("owner", "nested_string"),
+                    "missing": ("machines", 0, "wheels"),
+                },
+                dig_objects=True,
+                default="n/a",
+            )
+        )
+
+        assert results == {
+            "name": "Motor XPTO",
+            "component": "Cog",
+            "owner": "This is a string inside object",
+            "missing": "n/a",
+        }
+
+    @staticmethod
+    def test_branches_are_awaited_concurrently() -> None:
+        async def scenario(concurrency: object) -> float:
+            document = {f"field_{n}": Lazy(n, delay=0.05) for n in range(10)}
+            loop = asyncio.get_running_loop()
+            began = loop.time()
+            results = await adig_paths(
+                document, {n: (f"field_{n}",) for n in range(10)}, concurrency=concurrency
+            )
+            assert results == {n: n for n in range(10)}
+            return loop.time() - began
+
+        assert asyncio.run(scenario(None)) < 0.3
+        assert asyncio.run(scenario(2)) >= 0.25
+
+    @staticmethod
+    def test_concurrency_must_be_positive() -> None:
+        for concurrency in (0, -1):
+            with raises(ValueError, match="concurrency"):
+                asyncio.run(adig_paths({"a": Lazy(1)}, {"a": ("a",)}, concurrency=concurrency))
+
+    @staticmethod
+    def test_asyncio_is_not_imported_by_the_package() -> None:
+        code = "import sys, src.py_data_digger; print('asyncio' in sys.modules)"
+
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
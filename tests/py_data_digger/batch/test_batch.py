@@ -0,0 +1,95 @@
+from itertools import count
+from typing import Iterator
+
+from pytest import raises
+
+from src.py_data_digger import SeekError, dig_many, seek_many
+from tests.py_data_digger.conftest import dict_example
+
+
+def records_generator(total: int) -> Iterator[dict]:
+    for number in range(total):
+        yield {"machines": [{"id": number}]} if number % 2 == 0 else {"machines": []}
+
+
+class TestDigMany:
+    """Test digging through iterables of records."""
+
+    @staticmethod
+    def test_dig_each_record() -> None:
+        assert list(dig_many(records_generator(4), "machines", 0, "id")) == [0, None, 2, None]
+        assert list(dig_many(records_generator(3), "machines", 0, "id", default=-1)) == [0, -1, 2]
+
+    @staticmethod
+    def test_dig_objects() -> None:
+        records = [dict_example(), {}]
+
+        assert list(dig_many(records, "object_item", "nested_string", dig_objects=True)) == [
+            "This is a string inside object",
+            None,
+        ]
+
+    @staticmethod
+    def test_chunks_and_indexes() -> None:
+        chunks = dig_many(records_generator(5), "machines", 0, "id", chunk_size=2, with_index=True)
+
+        assert list(chunks) == [[(0, 0), (1, None)], [(2, 2), (3, None)], [(4, 4)]]
+
+    @staticmethod
+    def test_is_lazy_with_infinite_iterables() -> None:
+        results = dig_many(({"id": number} for number in count()), "id", chunk_size=3)
+
+        assert next(results) == [0, 1, 2]
+        assert next(results) == [3, 4, 5]
+
+    @staticmethod
+    def test_invalid_chunk_size() -> None:
+        with raises(ValueError, match="chunk_size"):
+            dig_many([], "id", chunk_size=0)
+
+
+class TestSeekMany:
+    """Test seeking through iterables of records."""
+
+    @staticmethod
+    def test_seek_each_record() -> None:
+        records = [{"id": 1}, {"id": 2}]
+
+        assert list(seek_many(records, "id")) == [1, 2]
+        assert list(seek_many(records, "id", with_index=True)) == [(0, 1), (1, 2)]
+
+    @staticmethod
+    def test_raises_on_first_failure() -> None:
+        results = seek_many(records_generator(3), "machines", 0, "id")
+
+        assert next(results) == 0
+        with raises(SeekError) as ex_info:
+            next(results)
+
+        assert type(ex_info.value.__cause__) is IndexError
+        assert "Path traveled: dict -> machines -> 0" in ex_info.value.message
+
+
+class TestThreadWorkers:
+    """Test the batch functions running on a thread pool."""
+
+    @staticmethod
+    def test_dig_many_with_workers_keeps_order() -> None:
+        results = dig_many(records_generator(5000), "machines", 0, "id", default=-1, workers=4)
+
+        assert list(results) == [number if number % 2 == 0 else -1 for number in range(5000)]
+
+    @staticmethod
+    def test_seek_many_with_workers_raises_in_order() -> None:
+        records = [{"id": number} for number in range(3000)] + [{}]
+
+        results = seek_many(records, "id", workers=3, with_index=True)
+
+        assert [next(results) for _ in range(3000)][-1] == (2999, 2999)
+        with raises(SeekError):
+            next(results)
+
+    @staticmethod
+    def test_invalid_workers() -> None:
+        with raises(ValueError, match="workers"):
+            dig_many([], "id", workers=0)
@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from pytest import raises
+
+from src.py_data_digger import BuryError, SeekError, bury, bury_paths, seek
+from tests.py_data_digger.conftest import CountingDict, SomeObject, dict_example
+
+
+@dataclass
+class Settings:
+    level: str = "info"
+
+
+class TestBury:
+    """Writing values deep into the data."""
+
+    @staticmethod
+    def test_write_existing_paths() -> None:
+        test_dict = dict_example()
+        bury(test_dict, 42, "nested_dict", "sub_item_array", -1)
+        bury(test_dict, "new", "nested_dict", "sub_item_dict", "c")
+        assert seek(test_dict, "nested_dict", "sub_item_array") == [1, 2, 42]
+        assert seek(test_dict, "nested_dict", "sub_item_dict") == {"a": 0, "b": 1, "c": "new"}
+
+    @staticmethod
+    def test_create_missing_containers() -> None:
+        data = {}
+        bury(data, 1, "a", "b", "c")
+        assert data == {"a": {"b": {"c": 1}}}
+
+        bury(data, 2, "x", "y", container_factory=OrderedDict)
+        assert type(data["x"]) is OrderedDict
+
+        with raises(BuryError) as error:
+            bury(data, 3, "d", "e", create_missing=False)
+        assert isinstance(error.value.original_error, KeyError)
+        assert error.value.path == ("d",)
+        assert error.value.accessors == ("d", "e")
+        assert error.value.to_dict()["accessors"] == ["d", "e"]
+
+    @staticmethod
+    def test_missing_indexes_are_not_created() -> None:
+        data = {"list": [1]}
+        with raises(BuryError) as error:
+            bury(data, 3, "list", 5)
+        assert isinstance(error.value.original_error, IndexError)
+        with raises(BuryError):
+            bury(data, 3, "list", 5, "key")
+
+    @staticmethod
+    def test_error_message() -> None:
+        data = {"tuple": (1, 2)}
+        with raises(SeekError) as error:
+            bury(data, 3, "tuple", 0)
+        assert isinstance(error.value, BuryError)
+        assert str(error.value) == (
+            "Data digger can't bury any further: TypeError\nPath traveled: dict -> tuple -> 0"
+        )
+        assert error.value.index == 1
+
+    @staticmethod
+    def test_objects() -> None:
+        test_dict = dict_example()
+        with raises(BuryError):
+            bury(test_dict, [1], "object_item", "nested_dict", "nested_array")
+
+        bury(test_dict, [1], "object_item", "nested_dict", "nested_array", bury_objects=True)
+        bury(test_dict, "debug", "settings", "level", bury_objects=True)
+        bury(test_dict, Settings(), "settings", "object")
+        bury(test_dict, "warning", "settings", "object", "level", bury_objects=True)
+
+        assert test_dict["object_item"].nested_dict["nested_array"] == [1]
+        assert test_dict["settings"]["object"].level == "warning"
+
+    @staticmethod
+    def test_objects_attributes_are_not_created() -> None:
+        data = {"object": SomeObject()}
+        with raises(BuryError) as error:
+            bury(data, 1, "object", "missing", "key", bury_objects=True)
+        assert isinstance(error.value.original_error, TypeError)
+
+    @staticmethod
+    def test_needs_accessors() -> None:
+        with raises(ValueError):
+            bury({}, 1)
+
+
+class TestBuryPaths:
+    """Writing many values in a single traversal."""
+
+    @staticmethod
+    def test_write_many_paths() -> None:
+        data = {"machines": [{"id": 1}, {"id": 2}]}
+        bury_paths(
+            data,
+            {
+                ("summary", "count"): 2,
+                ("summary", "ids", "first"): 1,
+                ("machines", 0, "checked"): True,
+                ("machines", 1, "checked"): False,
+            },
+        )
+        assert data == {
+            "machines": [{"id": 1, "checked": True}, {"id": 2, "checked": False}],
+            "summary": {"count": 2, "ids": {"first": 1}},
+        }
+
+    @staticmethod
+    def test_shared_containers_are_visited_once() -> None:
+        data = CountingDict({"nested": {}})
+        bury_paths(data, {("nested", str(i)): i for i in range(10)})
+        assert data.reads == 1
+        assert data["nested"] == {str(i): i for i in range(10)}
+
+    @staticmethod
+    def test_shorter_paths_are_written_first() -> None:
+        data = {}
+        bury_paths(data, {("a", "b"): 1, ("a",): {"old": True}})
+        assert data == {"a": {"old": True, "b": 1}}
+
+    @staticmethod
+    def test_failures_keep_the_writes_before() -> None:
+        data = {"a": {}, "b": (0,)}
+        with raises(BuryError) as error:
+            bury_paths(data, {("a", "x"): 1, ("b", 0): 2})
+        assert error.value.path == ("b", 0)
+        assert data["a"] == {"x": 1}
+
+        with raises(BuryError) as error:
+            bury_paths(data, {("a", "x"): 1, ("b", 1, "c", "d"): 2})
+        assert error.value.path == ("b", 1)
+        assert error.value.accessors == ("b", 1, "c", "d")
+
+    @staticmethod
+    def test_invalid_paths() -> None:
+        with raises(ValueError):
+            bury_paths({}, {(): 1})
+        with raises(TypeError):
+            bury_paths({}, {"a.b": 1})
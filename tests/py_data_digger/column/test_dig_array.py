@@ -0,0 +1,130 @@
+import sys
+
+from pytest import approx, importorskip, mark, raises
+
+from src.py_data_digger import Column, dig, dig_array
+from tests.py_data_digger.conftest import SomeObject
+
+numpy = importorskip("numpy")
+
+READINGS = numpy.array(
+    [(1, (20.5, 3), (1.0, 2.0)), (2, (21.0, 4), (3.0, 4.0)), (3, (19.5, 0), (5.0, 6.0))],
+    dtype=[("id", "i8"), ("sensor", [("temp", "f8"), ("hits", "i4")]), ("position", "f8", (2,))],
+)
+EVENTS = numpy.array(
+    [
+        {"user": {"id": 7, "tags": ["a", "b"]}},
+        {"user": None},
+        {"user": {"id": 9, "tags": []}},
+        {},
+        {"user": {"id": "x", "tags": ["c"]}},
+    ],
+    dtype=object,
+)
+
+
+class TestDigArray:
+    """Test digging a path from every row of a NumPy array."""
+
+    @staticmethod
+    @mark.parametrize(
+        ("path", "expected"),
+        [
+            (("id",), [1, 2, 3]),
+            (("sensor", "temp"), [20.5, 21.0, 19.5]),
+            (("position", 1), [2.0, 4.0, 6.0]),
+            (("position", -2), [1.0, 3.0, 5.0]),
+        ],
+        ids=repr,
+    )
+    def test_structured_fields_are_views(path: tuple, expected: list) -> None:
+        column = dig_array(READINGS, *path)
+
+        assert isinstance(column, Column)
+        assert column.values.tolist() == expected
+        assert numpy.shares_memory(column.values, READINGS)
+        assert not column.mask.any()
+        assert column.mask.dtype == numpy.bool_
+        assert column.missing == 0
+
+    @staticmethod
+    def test_view_follows_the_array() -> None:
+        readings = READINGS.copy()
+        temps = dig_array(readings, "sensor", "temp").values
+
+        readings["sensor"]["temp"][0] = 99.0
+        assert temps[0] == approx(99.0)
+
+    @staticmethod
+    @mark.parametrize("path", [("missing",), ("sensor", "missing"), ("position", 2), ("id", "x")], ids=repr)
+    def test_structured_misses(path: tuple) -> None:
+        column = dig_array(READINGS, *path, default=-1)
+        expected = [dig(row, *path, default=-1) for row in READINGS]
+
+        assert column.values.tolist() == expected
+        assert column.mask.all()
+        assert column.missing == 3
+
+    @staticmethod
+    def test_object_arrays_of_dicts() -> None:
+        column = dig_array(EVENTS, "user", "id")
+
+        assert column.values.dtype == object
+        assert column.values.tolist() == [7, None, 9, None, "x"]
+        assert column.mask.tolist() == [False, True, False, True, False]
+        assert column.missing == 2
+
+    @staticmethod
+    @mark.parametrize("path", [("user",), ("user", "tags"), ("user", "tags", 0), ("user", "tags", -1)], ids=repr)
+    def test_object_arrays_same_as_dig(path: tuple) -> None:
+        column = dig_array(EVENTS, *path, default="default", workers=2)
+
+        assert column.values.tolist() == [dig(event, *path, default="default") for event in EVENTS]
+
+    @staticmethod
+    def test_lists_are_kept_as_values() -> None:
+        column = dig_array(EVENTS, "user", "tags", default=[])
+
+        assert column.values.shape == (5,)
+        assert column.values[0] == ["a", "b"]
+        assert column.values[1] == []
+
+    @staticmethod
+    def test_dtype() -> None:
+        column = dig_array(EVENTS[:4], "user", "id", default=-1, dtype="i8")
+
+        assert column.values.dtype == numpy.int64
+        assert column.values.tolist() == [7, -1, 9, -1]
+        assert dig_array(READINGS, "sensor", "hits", dtype="f8").values.tolist() == [3.0, 4.0, 0.0]
+
+    @staticmethod
+    def test_structured_fields_then_objects() -> None:
+        records = numpy.array(
+            [(1, SomeObject()), (2, {"nested_string": "in a dict"})],
+            dtype=[("id", "i8"), ("payload", object)],
+        )
+
+        column = dig_array(records, "payload", "nested_string", dig_objects=True)
+        assert column.values.tolist() == ["This is a string inside object", "in a dict"]
+        assert dig_array(records, "payload", "nested_string").mask.tolist() == [True, False]
+
+    @staticmethod
+    def test_no_accessors() -> None:
+        column = dig_array(EVENTS)
+
+        assert column.values is EVENTS
+        assert column.missing == 0
+
+    @staticmethod
+    def test_needs_an_array() -> None:
+        with raises(ValueError, match="NumPy array"):
+            dig_array([{"a": 1}], "a")
+        with raises(ValueError, match="NumPy array"):
+            dig_array(numpy.array(1), "a")
+
+    @staticmethod
+    def test_numpy_missing(monkeypatch: object) -> None:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        with raises(ImportError, match="dig_array requires NumPy"):
+            dig_array(EVENTS, "user")
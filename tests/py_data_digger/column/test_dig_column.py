@@ -0,0 +1,97 @@
+import subprocess  # noqa: S404
+import sys
+from array import array
+from decimal import Decimal
+from math import isnan
+
+from pytest import importorskip, raises
+
+from src.py_data_digger import Column, dig_column
+from tests.py_data_digger.conftest import SomeObject
+
+RECORDS = [
+    {"item": {"price": 1.5}},
+    {"item": {"price": "2.25"}},
+    {"item": {"price": "n/a"}},
+    {"item": {}},
+    {"item": {"price": None}},
+    {"item": {"price": 3}},
+]
+
+
+class TestDigColumn:
+    """Test digging fields straight into typed arrays."""
+
+    @staticmethod
+    def test_float_column() -> None:
+        column = dig_column(iter(RECORDS), "item", "price")
+
+        assert isinstance(column, Column)
+        assert isinstance(column.values, array)
+        assert column.values.typecode == "d"
+        assert len(column) == len(RECORDS)
+        assert list(column.values[:2]) == [1.5, 2.25]
+        assert all(isnan(value) for value in column.values[2:5])
+        assert column.values.tolist()[5:] == [3]
+        assert list(column.mask) == [0, 0, 1, 1, 1, 0]
+        assert column.missing == 1
+        assert column.errors == 2
+
+    @staticmethod
+    def test_integer_column_with_overflow() -> None:
+        records = [{"n": 1}, {"n": 300}, {"n": "7"}, {}]
+
+        column = dig_column(records, "n", dtype="B", default=0)
+
+        assert column.values == array("B", [1, 0, 7, 0])
+        assert list(column.mask) == [0, 1, 0, 1]
+        assert (column.missing, column.errors) == (1, 1)
+
+    @staticmethod
+    def test_integer_column_never_truncates() -> None:
+        records = [{"n": 2.0}, {"n": 1.9}, {"n": Decimal(3)}, {"n": Decimal("3.5")}, {"n": "4.5"}]
+
+        column = dig_column(records, "n", dtype="q", default=-1)
+
+        assert column.values == array("q", [2, -1, 3, -1, -1])
+        assert (column.missing, column.errors) == (0, 3)
+        with raises(ValueError):
+            dig_column([], "n", dtype="q", default=0.5)
+
+    @staticmethod
+    def test_dig_objects() -> None:
+        column = dig_column([SomeObject()], "nested_dict", "nested_array", 0, dtype="q", default=-1)
+        assert column.values == array("q", [-1])
+
+        column = dig_column(
+            [SomeObject()], "nested_dict", "nested_array", 0, dtype="q", default=-1, dig_objects=True
+        )
+        assert column.values == array("q", [9])
+
+    @staticmethod
+    def test_invalid_dtype_or_default() -> None:
+        with raises(ValueError, match="dtype"):
+            dig_column([], "n", dtype="u")
+        with raises(ValueError, match="default nan"):
+            dig_column([], "n", dtype="q")
+
+    @staticmethod
+    def test_numpy_arrays_share_memory() -> None:
+        numpy = importorskip("numpy")
+
+        column = dig_column(RECORDS, "item", "price", as_numpy=True)
+
+        assert isinstance(column.values, numpy.ndarray)
+        assert column.values.dtype == numpy.float64
+        assert column.mask.tolist() == [False, False, True, True, True, False]
+        assert numpy.isnan(column.values[column.mask]).all()
+
+    @staticmethod
+    def test_numpy_is_not_imported_by_the_package() -> None:
+        code = "import sys, src.py_data_digger; print('numpy' in sys.modules)"
+
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
@@ -0,0 +1,88 @@
+import pickle  # noqa: S403
+
+from pytest import raises
+
+from src.py_data_digger import CompiledPath, SeekError, compile_path, dig, seek
+from tests.py_data_digger.conftest import dict_example, tuple_example
+
+
+class TestCompilePathSuccess:
+    """Test the compiled path's happy path."""
+
+    @staticmethod
+    def test_same_results_as_seek_and_dig() -> None:
+        test_dict = dict_example()
+        accessors = ("nested_dict", "sub_item_tuple", -1)
+        path = compile_path(*accessors)
+
+        assert isinstance(path, CompiledPath)
+        assert path.seek(test_dict) == seek(test_dict, *accessors) == "z"
+        assert path.dig(test_dict) == dig(test_dict, *accessors) == "z"
+
+    @staticmethod
+    def test_path_is_reusable_across_data() -> None:
+        path = compile_path(1, 0)
+
+        assert path.seek(tuple_example()) == "a"
+        assert path.seek([None, "xyz"]) == "x"
+        assert path.dig({1: {0: "zero"}}) == "zero"
+
+    @staticmethod
+    def test_empty_path_returns_data() -> None:
+        test_dict = dict_example()
+
+        assert compile_path().seek(test_dict) is test_dict
+
+    @staticmethod
+    def test_objects() -> None:
+        test_dict = dict_example()
+        path = compile_path(
+            "nested_dict", "sub_item_object", "nested_dict", "nested_array", 0, objects=True
+        )
+
+        assert path.seek(test_dict) == 9
+        assert path.dig(test_dict) == 9
+        assert compile_path("object_item", "nested_string").dig(test_dict) is None
+
+    @staticmethod
+    def test_pickle_round_trip() -> None:
+        path = compile_path("nested_dict", "sub_item_array", 0, objects=True)
+
+        loaded = pickle.loads(pickle.dumps(path))  # noqa: S301
+
+        assert loaded.accessors == path.accessors
+        assert loaded.objects is True
+        assert loaded.seek(dict_example()) == 1
+
+
+class TestCompilePathFailure:
+    """Test the compiled path's sad path."""
+
+    @staticmethod
+    def test_same_seek_error_message_as_seek() -> None:
+        test_dict = dict_example()
+        accessors = ("nested_dict", "sub_item_dict", "unknow_key")
+
+        with raises(SeekError) as expected_info:
+            seek(test_dict, *accessors)
+        with raises(SeekError) as ex_info:
+            compile_path(*accessors).seek(test_dict)
+
+        assert type(ex_info.value.__cause__) is KeyError
+        assert ex_info.value.message == expected_info.value.message
+
+    @staticmethod
+    def test_seek_error_with_objects() -> None:
+        with raises(SeekError) as ex_info:
+            compile_path("object_item", "unknow_attribute", objects=True).seek(dict_example())
+
+        assert type(ex_info.value.__cause__) is AttributeError
+        assert "Path traveled: dict -> object_item -> unknow_attribute" in ex_info.value.message
+
+    @staticmethod
+    def test_dig_default() -> None:
+        path = compile_path("tree", "nested", "bird")
+
+        assert path.dig({"tree": {"nested": {}}}) is None
+        assert path.dig({"tree": {"nested": {}}}, default=[]) == []
+        assert path.dig("not a dict", default=0) == 0
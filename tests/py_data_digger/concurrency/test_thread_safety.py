@@ -0,0 +1,69 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from src.py_data_digger import SeekError, dig, seek
+from tests.py_data_digger.conftest import dict_example
+
+THREADS = 8
+CALLS = 2000
+# Fresh types per thread, so together they fill the strategy cache past its size
+TYPES_PER_THREAD = 200
+
+
+def dig_and_seek(thread: int) -> list:
+    test_dict = dict_example()
+    results = []
+    for call in range(CALLS):
+        key = f"key_{thread}_{call}"
+        results.append(dig(test_dict, "nested_dict", "sub_item_array", call % 4, default=key))
+        try:
+            seek(test_dict, "nested_dict", key)
+        except SeekError as e:
+            results.append(e.path)
+    return results
+
+
+def seek_fresh_objects(thread: int) -> list:
+    results = []
+    for number in range(TYPES_PER_THREAD):
+        item = type(f"Fresh_{thread}_{number}", (), {"name": (thread, number)})()
+        results.append(seek({"item": item}, "item", "name", seek_objects=True))
+        try:
+            seek({"item": item}, "item", f"missing_{thread}", seek_objects=True)
+        except SeekError as e:
+            results.append(e.path)
+    return results
+
+
+class TestThreadSafety:
+    """seek, dig and SeekError only share the type strategy cache, written under a lock.
+
+    Threads never see each other's results or errors, even while the cache is being filled.
+    """
+
+    @staticmethod
+    def test_concurrent_calls_get_their_own_results() -> None:
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(pool.map(dig_and_seek, range(THREADS)))
+
+        for thread, thread_results in enumerate(results):
+            expected = []
+            for call in range(CALLS):
+                key = f"key_{thread}_{call}"
+                expected.extend(([1, 2, 3, key][call % 4], ("nested_dict", key)))
+            assert thread_results == expected
+
+    @staticmethod
+    def test_concurrent_calls_while_the_cache_evicts() -> None:
+        main = sys.modules[dig.__module__]
+        assert THREADS * TYPES_PER_THREAD > main._STRATEGY_CACHE_SIZE
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(pool.map(seek_fresh_objects, range(THREADS)))
+
+        for thread, thread_results in enumerate(results):
+            expected = []
+            for number in range(TYPES_PER_THREAD):
+                expected.extend(((thread, number), ("item", f"missing_{thread}")))
+            assert thread_results == expected
+        assert len(main._strategies) <= main._STRATEGY_CACHE_SIZE
@@ -8,6 +8,18 @@ class PydanticModel(BaseModel):
     nested_dict: Optional[dict] = Field(default_factory=lambda: {"a": 1})
 
 
+class CountingDict(dict):
+    """Dict that counts how many times it was subscripted."""
+
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+        self.reads = 0
+
+    def __getitem__(self, key: object) -> object:
+        self.reads += 1
+        return super().__getitem__(key)
+
+
 class SomeObject:
     def __init__(self) -> None:
         self.nested_dict = {"nested_array": [9, 8, 7]}
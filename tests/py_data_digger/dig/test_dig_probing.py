@@ -0,0 +1,64 @@
+from collections import OrderedDict, defaultdict
+from itertools import product
+
+from src.py_data_digger import SeekError, dig, seek
+from tests.py_data_digger.conftest import PydanticModel, SomeObject
+
+MISSING = object()
+
+DATA = [
+    {"a": 1, 0: "zero", "keys": "key value"},
+    defaultdict(list, {"a": 1}),
+    OrderedDict(a=1),
+    [10, 20, 30],
+    ("x", "y"),
+    "string",
+    "",
+    b"bytes",
+    range(3),
+    SomeObject(),
+    PydanticModel(),
+    None,
+    42,
+]
+ACCESSORS = ["a", "keys", "items", "nested_dict", "name", 0, 1, -1, -3, 5, True, 1.0, slice(0, 2), None]
+
+
+def seek_or_missing(data: object, accessor: object, objects: bool) -> object:
+    """Reference behavior: seek wrapped by an except, like dig used to be."""
+    try:
+        return seek(data, accessor, seek_objects=objects)
+    except SeekError:
+        return MISSING
+
+
+class TestDigProbing:
+    """Test dig gives the very same results as seek on every kind of container and accessor."""
+
+    @staticmethod
+    def test_same_results_as_seek() -> None:
+        for data, accessor, objects in product(DATA, ACCESSORS, (False, True)):
+            if objects and not isinstance(accessor, str):
+                continue  # getattr only takes strings, both functions let its TypeError through
+
+            expected = seek_or_missing(data, accessor, objects)
+            result = dig(data, accessor, dig_objects=objects, default=MISSING)
+
+            assert result == expected or (result is MISSING and expected is MISSING), (
+                data,
+                accessor,
+                objects,
+            )
+
+    @staticmethod
+    def test_defaultdict_still_creates_missing_keys() -> None:
+        test_dict = defaultdict(list)
+
+        assert dig(test_dict, "new_key") == []
+        assert "new_key" in test_dict
+
+    @staticmethod
+    def test_dict_attribute_on_missing_key_when_dig_objects_is_on() -> None:
+        assert dig({}, "keys", dig_objects=True) is not None
+        assert dig({}, "keys") is None
+        assert dig([1], "count", dig_objects=True)(1) == 1
@@ -0,0 +1,152 @@
+import sys
+from xml.etree import ElementTree
+
+from pytest import mark, raises
+
+from src.py_data_digger import SeekError, clear_xml_index, dig_xml, seek_xml
+
+XML = """
+<catalog xmlns:x="urn:extra" version="2">
+  <machine id="1234">
+    <engine name="Motor XPTO">
+      <component id="0942323">Cog</component>
+      <component id="1642723">Piston</component>
+      <!-- a comment -->
+      <component id="8412321">Bar</component>
+    </engine>
+  </machine>
+  <machine id="5678"/>
+  <x:note>Namespaced</x:note>
+</catalog>
+"""
+
+
+def etree_module() -> object:
+    return sys.modules[seek_xml.__module__]
+
+
+class TestSeekXml:
+    """Navigating ElementTree elements by tag, (tag, n) pairs, attributes and positions."""
+
+    @staticmethod
+    @mark.parametrize(
+        ("path", "expected"),
+        [
+            (("@version",), "2"),
+            (("machine", "@id"), "1234"),
+            ((("machine", 1), "@id"), "5678"),
+            ((("machine", -1), "@id"), "5678"),
+            (("machine", "engine", "@name"), "Motor XPTO"),
+            (("machine", "engine", ("component", 2), "@id"), "8412321"),
+            (("machine", "engine", "@name", 0), "M"),
+            (("machine", "engine", 1, "@id"), "1642723"),
+            (("{urn:extra}note", "@missing"), None),
+        ],
+        ids=repr,
+    )
+    def test_seek(path: tuple, expected: object) -> None:
+        root = ElementTree.fromstring(XML)
+        if expected is None:
+            with raises(SeekError):
+                seek_xml(root, *path)
+        else:
+            assert seek_xml(root, *path) == expected
+
+    @staticmethod
+    def test_elements_and_trees() -> None:
+        tree = ElementTree.ElementTree(ElementTree.fromstring(XML))
+
+        assert seek_xml(tree, "machine", "engine", ("component", 1)).text == "Piston"
+        assert seek_xml(tree, "{urn:extra}note").text == "Namespaced"
+        assert seek_xml(tree).tag == "catalog"
+        assert [c.text for c in seek_xml(tree, "machine", "engine", slice(0, 2))] == ["Cog", "Piston"]
+
+    @staticmethod
+    @mark.parametrize(
+        ("path", "error", "traveled"),
+        [
+            (("wheel",), KeyError, "Element -> wheel"),
+            (("@missing",), KeyError, "Element -> @missing"),
+            ((("machine", 2),), IndexError, "Element -> ('machine', 2)"),
+            ((("wheel", 0),), KeyError, "Element -> ('wheel', 0)"),
+            ((("machine", "first"),), TypeError, "Element -> ('machine', 'first')"),
+            (("machine", 5), IndexError, "Element -> machine -> 5"),
+            (("machine", "@id", 10), IndexError, "Element -> machine -> @id -> 10"),
+        ],
+        ids=repr,
+    )
+    def test_misses(path: tuple, error: type, traveled: str) -> None:
+        root = ElementTree.fromstring(XML)
+
+        with raises(SeekError) as ex_info:
+            seek_xml(root, *path)
+        assert type(ex_info.value.original_error) is error
+        assert ex_info.value.message.endswith(f"Path traveled: {traveled}")
+        assert dig_xml(root, *path) is None
+        assert dig_xml(root, *path, default="default") == "default"
+
+    @staticmethod
+    def test_same_errors_as_dicts() -> None:
+        with raises(SeekError) as from_xml:
+            seek_xml(ElementTree.fromstring("<a><b/></a>"), "b", "c")
+        assert type(from_xml.value.original_error) is KeyError
+        assert from_xml.value.path == ("b", "c")
+        assert from_xml.value.index == 1
+
+
+class TestTagIndex:
+    """The children by tag are indexed once per element and cached."""
+
+    @staticmethod
+    def test_index_is_cached() -> None:
+        root = ElementTree.fromstring(XML)
+        indexes = etree_module()._tag_indexes
+
+        seek_xml(root, "machine")
+        cached = indexes[root]
+        seek_xml(root, ("machine", 1))
+        assert indexes[root] is cached
+        assert [child.get("id") for child in cached[1]["machine"]] == ["1234", "5678"]
+
+    @staticmethod
+    def test_index_follows_added_and_removed_children() -> None:
+        root = ElementTree.fromstring("<a><b id='1'/></a>")
+        assert dig_xml(root, "c") is None
+
+        ElementTree.SubElement(root, "c", id="2")
+        assert seek_xml(root, "c", "@id") == "2"
+        root.remove(root[0])
+        assert dig_xml(root, "b") is None
+
+    @staticmethod
+    def test_index_follows_changed_tags() -> None:
+        root = ElementTree.fromstring("<r><a id='1'/><a id='2'/><a id='3'/></r>")
+        assert seek_xml(root, ("a", 1), "@id") == "2"
+
+        root[0].tag = "c"
+        assert seek_xml(root, "a", "@id") == "2"
+        assert seek_xml(root, "c", "@id") == "1"
+        assert seek_xml(root, ("a", 1), "@id") == "3"
+        root[1].tag = "d"
+        assert seek_xml(root, "d", "@id") == "2"
+        assert dig_xml(root, ("a", 1)) is None
+
+    @staticmethod
+    def test_clear_xml_index() -> None:
+        root = ElementTree.fromstring("<a><b id='1'/></a>")
+        seek_xml(root, "b")
+
+        root[0] = ElementTree.Element("b", id="2")
+        clear_xml_index()
+        assert seek_xml(root, "b", "@id") == "2"
+
+    @staticmethod
+    def test_index_goes_away_with_the_element() -> None:
+        indexes = etree_module()._tag_indexes
+        clear_xml_index()
+        root = ElementTree.fromstring(XML)
+        seek_xml(root, "machine")
+        assert len(indexes) == 1
+
+        del root
+        assert len(indexes) == 0
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+from pytest import mark, raises
+
+from src.py_data_digger import DigIndex, SeekError, dig, seek
+from tests.py_data_digger.conftest import dict_example
+
+ACCESSORS = ["nested_dict", "sub_item_array", "sub_item_tuple", "keys", 0, 2, -1, 1.0, True, "a", "missing"]
+
+
+def all_paths(max_length: int) -> list:
+    paths = [()]
+    for length in range(1, max_length + 1):
+        paths.extend(product(ACCESSORS, repeat=length))
+    return paths
+
+
+def seek_outcome(seek_function: object, *accessors: object) -> object:
+    try:
+        return ("found", seek_function(*accessors))
+    except SeekError as e:
+        return ("error", e.message, e.index)
+
+
+class TestDigIndex:
+    """Seeking and digging through a flat index of the paths, like the module level functions."""
+
+    @staticmethod
+    @mark.parametrize(("max_depth", "lazy"), [(None, False), (None, True), (2, False), (1, True), (0, False)])
+    def test_same_results_as_seek_and_dig(max_depth: object, lazy: bool) -> None:
+        data = dict_example()
+        index = DigIndex(data, max_depth=max_depth, lazy=lazy)
+        for path in all_paths(3):
+            assert seek_outcome(index.seek, *path) == seek_outcome(
+                lambda *a: seek(data, *a), *path
+            ), path
+            assert index.dig(*path, default="default") == dig(data, *path, default="default"), path
+
+    @staticmethod
+    def test_indexed_paths() -> None:
+        index = DigIndex({"a": [{"b": 1}, "text"], 1: (2,), 1.5: "float key"})
+        assert set(index._paths) == {
+            (),
+            ("a",),
+            ("a", 0),
+            ("a", 0, "b"),
+            ("a", 1),
+            (1,),
+            (1, 0),
+        }
+        assert len(index) == 7
+        assert ("a", 0, "b") in index
+        assert ("a", 0, "c") not in index
+        assert index.seek(1.5) == "float key"
+
+    @staticmethod
+    def test_max_depth() -> None:
+        data = {"a": {"b": {"c": {"d": 1}}}}
+        index = DigIndex(data, max_depth=2)
+        assert len(index) == 3
+        assert index.seek("a", "b", "c", "d") == 1
+        with raises(SeekError) as error:
+            index.seek("a", "b", "x", "d")
+        assert error.value.path == ("a", "b", "x")
+        assert error.value.data_type is dict
+
+    @staticmethod
+    def test_lazy_indexes_subtrees_when_needed() -> None:
+        data = {"a": {"b": [1, 2]}, "c": {"d": 3}}
+        index = DigIndex(data, lazy=True)
+        assert len(index) == 3
+        assert index.seek("a", "b", 1) == 2
+        assert len(index) == 6
+        assert index.dig("c", "missing") is None
+        assert len(index) == 7
+
+    @staticmethod
+    def test_cycles_are_left_to_seek() -> None:
+        data = {"a": []}
+        data["a"].append(data)
+        index = DigIndex(data)
+        assert index.seek("a", 0, "a", 0, "a") is data["a"]
+
+    @staticmethod
+    def test_deeper_than_the_recursion_limit() -> None:
+        depth = 3000
+        data: dict = {"leaf": "bottom"}
+        for _ in range(depth):
+            data = {"next": data}
+        path = ("next",) * depth
+
+        index = DigIndex(data)
+        assert len(index) == depth + 2
+        assert index.seek(*path, "leaf") == seek(data, *path, "leaf") == "bottom"
+
+    @staticmethod
+    def test_memory_footprint() -> None:
+        small = DigIndex({"a": 1})
+        large = DigIndex({f"key_{i}": list(range(10)) for i in range(100)})
+        assert 0 < small.memory_footprint() < large.memory_footprint()
+
+    @staticmethod
+    def test_unhashable_accessors() -> None:
+        index = DigIndex({"a": 1})
+        assert index.dig(["a"]) is None
+        with raises(SeekError):
+            index.seek(["a"])
+
+    @staticmethod
+    def test_negative_max_depth() -> None:
+        with raises(ValueError):
+            DigIndex({}, max_depth=-1)
+
+    @staticmethod
+    def test_concurrent_lazy_lookups() -> None:
+        data = {f"key_{i}": {"values": list(range(i, i + 10))} for i in range(200)}
+        index = DigIndex(data, lazy=True)
+
+        def dig_all(offset: int) -> list:
+            return [index.dig(f"key_{(i + offset) % 200}", "values", 9) for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(dig_all, range(0, 200, 25)))
+        for offset, values in zip(range(0, 200, 25), results):
+            assert values == [(i + offset) % 200 + 9 for i in range(200)]
@@ -0,0 +1,177 @@
+import io
+import json
+import re
+import sys
+from math import inf, isnan, nan
+from pathlib import Path
+
+from pytest import MonkeyPatch, mark, raises
+
+from src.py_data_digger import SeekError, dig_json, seek, seek_json
+
+DOCUMENT = {
+    "machines": [
+        {
+            "machine_id": "1234567890",
+            "engine": {
+                "id": "321abcde",
+                "name": "Motor XPTO ção ☃",
+                "components": [
+                    {"id": "0942323", "name": "Cog", "weight": -1.5e3},
+                    {"id": "1642723", "name": "Piston \"quoted\" \\ back", "active": True},
+                    {"id": "8412321", "name": "Bar", "extras": ["Foo", None, False]},
+                ],
+            },
+        },
+        [],
+        {},
+    ],
+    "total": 3,
+    "empty": "",
+}
+TEXT = json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+
+PATHS = [
+    (),
+    ("machines",),
+    ("machines", 0, "engine", "name"),
+    ("machines", 0, "engine", "components", 1, "name"),
+    ("machines", 0, "engine", "components", 2, "extras", 1),
+    ("machines", 0, "engine", "components", -1, "extras", -1),
+    ("machines", 0, "engine", "name", 0),
+    ("machines", 0, "engine", "components", 0, "weight"),
+    ("machines", slice(1, 3)),
+    ("total",),
+    ("machines", 1),
+    ("machines", 3),
+    ("machines", 1, 0),
+    ("machines", 2, "engine"),
+    ("machines", 0, "engine_2", "components"),
+    ("machines", "engine"),
+    ("total", 0),
+    ("empty", 0),
+    ("machines", 0, "engine", "name", 100),
+    (1,),
+    (["unhashable"],),
+]
+
+
+def expected_seek(*accessors: object) -> object:
+    try:
+        return seek(DOCUMENT, *accessors)
+    except SeekError as e:
+        return e
+
+
+class ReadCountingFile(io.BytesIO):
+    """File object that remembers how many bytes were read."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestSeekJson:
+    """Test the incremental JSON seek against seeking the fully loaded document."""
+
+    @staticmethod
+    @mark.parametrize("chunk_size", [1, 7, 65536])
+    @mark.parametrize("path", PATHS, ids=repr)
+    def test_same_results_as_seek(path: tuple, chunk_size: int) -> None:
+        expected = expected_seek(*path)
+
+        for source in (io.StringIO(TEXT), io.BytesIO(TEXT.encode())):
+            if isinstance(expected, SeekError):
+                with raises(SeekError) as ex_info:
+                    seek_json(source, *path, chunk_size=chunk_size)
+                assert ex_info.value.message == expected.message
+                assert type(ex_info.value.__cause__) is type(expected.__cause__)
+            else:
+                assert seek_json(source, *path, chunk_size=chunk_size) == expected
+
+    @staticmethod
+    def test_path_source(tmp_path: Path) -> None:
+        file_path = tmp_path / "document.json"
+        file_path.write_text(TEXT, encoding="utf-8")
+
+        assert seek_json(file_path, "total") == 3
+        assert seek_json(str(file_path), "machines", 0, "engine", "id") == "321abcde"
+
+    @staticmethod
+    def test_stops_reading_when_the_value_is_found() -> None:
+        text = json.dumps({"head": {"id": 1}, "tail": ["x" * 1000] * 1000}).encode()
+        source = ReadCountingFile(text)
+
+        assert seek_json(source, "head", "id", chunk_size=64) == 1
+        assert source.bytes_read < 200
+
+    @staticmethod
+    @mark.parametrize("chunk_size", [1, 2, 3, 7])
+    def test_strings_cut_by_chunks(chunk_size: int) -> None:
+        text = json.dumps({"a": 'x\\"y\u2603\n' * 5, "b": ["\\" * 9, {"c": 1}], "d": 2})
+
+        assert seek_json(io.StringIO(text), "d", chunk_size=chunk_size) == 2
+        assert seek_json(io.StringIO(text), "b", 1, "c", chunk_size=chunk_size) == 1
+        assert seek_json(io.StringIO(text), "a", chunk_size=chunk_size) == 'x\\"y\u2603\n' * 5
+
+    @staticmethod
+    def test_long_strings_are_scanned_once(monkeypatch: MonkeyPatch) -> None:
+        module = sys.modules[seek_json.__module__]
+        pattern = module._STRING_CHARS
+        scanned = []
+
+        class CountingPattern:
+            @staticmethod
+            def match(text: str, position: int) -> re.Match:
+                match = pattern.match(text, position)
+                scanned.append(match.end() - position)
+                return match
+
+        monkeypatch.setattr(module, "_STRING_CHARS", CountingPattern)
+        blob = "x" * 100_000 + "\\" * 1000
+        text = json.dumps({"blob": blob, "nested": [blob], "k": 1})
+
+        assert seek_json(io.StringIO(text), "k", chunk_size=64) == 1
+        assert sum(scanned) <= len(text)
+
+    @staticmethod
+    def test_scalar_root() -> None:
+        assert seek_json(io.StringIO('"text"'), 1) == "e"
+        with raises(SeekError) as ex_info:
+            seek_json(io.StringIO("42"), 0)
+        assert "Path traveled: int -> 0" in ex_info.value.message
+
+    @staticmethod
+    @mark.parametrize("chunk_size", [1, 2, 65536])
+    def test_nan_and_infinity(chunk_size: int) -> None:
+        text = json.dumps({"a": nan, "b": [-inf, inf, -1], "c": "after"})
+
+        assert isnan(seek_json(io.StringIO(text), "a", chunk_size=chunk_size))
+        assert seek_json(io.StringIO(text), "b", chunk_size=chunk_size) == [-inf, inf, -1]
+        assert seek_json(io.StringIO(text), "b", 0, chunk_size=chunk_size) == -inf
+        assert seek_json(io.StringIO(text), "b", 2, chunk_size=chunk_size) == -1
+        assert seek_json(io.StringIO(text), "c", chunk_size=chunk_size) == "after"
+        with raises(json.JSONDecodeError):
+            seek_json(io.StringIO('{"a": -Inf, "b": 1}'), "b", chunk_size=chunk_size)
+
+    @staticmethod
+    def test_invalid_json() -> None:
+        with raises(json.JSONDecodeError):
+            seek_json(io.StringIO('{"a" 1}'), "a")
+        with raises(json.JSONDecodeError):
+            seek_json(io.StringIO('{"a": [1, 2'), "a", 5)
+
+
+class TestDigJson:
+    """Test the safe incremental JSON dig."""
+
+    @staticmethod
+    def test_dig_json() -> None:
+        assert dig_json(io.StringIO(TEXT), "machines", 0, "machine_id") == "1234567890"
+        assert dig_json(io.StringIO(TEXT), "machines", 0, "engine_2") is None
+        assert dig_json(io.StringIO(TEXT), "machines", 5, default={}) == {}
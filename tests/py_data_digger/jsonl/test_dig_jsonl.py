@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from src.py_data_digger import ChunkReport, dig, dig_jsonl
+
+RECORDS = [
+    {"machine": {"id": number, "tags": ["even" if number % 2 == 0 else "odd"]}}
+    if number % 3
+    else {"machine": None}
+    for number in range(500)
+]
+
+
+@fixture
+def jsonl_file(tmp_path: Path) -> Path:
+    path = tmp_path / "records.jsonl"
+    lines = [json.dumps(record) for record in RECORDS]
+    lines.insert(10, "")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestDigJsonl:
+    """Test digging JSONL files, in the current process and in a process pool."""
+
+    @staticmethod
+    def test_single_process(jsonl_file: Path) -> None:
+        reports = []
+
+        results = list(dig_jsonl(jsonl_file, "machine", "id", default=-1, report=reports.append))
+
+        assert results == [dig(record, "machine", "id", default=-1) for record in RECORDS]
+        assert {report.worker for report in reports} == {os.getpid()}
+        assert sum(report.records for report in reports) == len(RECORDS)
+
+    @staticmethod
+    def test_process_pool_in_order(jsonl_file: Path) -> None:
+        reports = []
+
+        results = dig_jsonl(
+            jsonl_file,
+            "machine",
+            "tags",
+            0,
+            workers=2,
+            chunk_bytes=1024,
+            min_parallel_bytes=0,
+            report=reports.append,
+        )
+
+        assert list(results) == [dig(record, "machine", "tags", 0) for record in RECORDS]
+        assert len(reports) > 2
+        assert os.getpid() not in {report.worker for report in reports}
+        assert all(isinstance(report, ChunkReport) for report in reports)
+        assert all(report.records_per_second > 0 for report in reports)
+        assert reports[0].start == 0
+        assert reports[-1].end == jsonl_file.stat().st_size
+
+    @staticmethod
+    def test_process_pool_as_completed(jsonl_file: Path) -> None:
+        results = dig_jsonl(
+            jsonl_file, "machine", "id", workers=2, ordered=False, chunk_bytes=1024, min_parallel_bytes=0
+        )
+
+        expected = [dig(record, "machine", "id") for record in RECORDS]
+        assert sorted(results, key=str) == sorted(expected, key=str)
+
+    @staticmethod
+    def test_empty_file(tmp_path: Path) -> None:
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        assert list(dig_jsonl(path, "id")) == []
+
+    @staticmethod
+    def test_invalid_workers(jsonl_file: Path) -> None:
+        with raises(ValueError, match="workers"):
+            dig_jsonl(jsonl_file, "id", workers=-1)
+
+    @staticmethod
+    def test_process_pools_are_not_imported_by_the_package() -> None:
+        code = "import sys, src.py_data_digger; print('multiprocessing' in sys.modules)"
+
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
@@ -0,0 +1,154 @@
+import gc
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import approx, raises
+
+from src.py_data_digger import DigMemo, dig
+from tests.py_data_digger.conftest import PydanticModel, SomeObject, dict_example
+
+
+class TestDigMemo:
+    """Remembering dig results by data identity."""
+
+    @staticmethod
+    def test_same_results_as_dig() -> None:
+        memo = DigMemo()
+        test_dict = dict_example()
+        paths = [
+            ("nested_dict", "sub_item_array", 0),
+            ("nested_dict", "missing"),
+            ("keys", -1),
+            ("object_item", "nested_string"),
+        ]
+        for _ in range(2):
+            for path in paths:
+                assert memo.dig(test_dict, *path) == dig(test_dict, *path)
+                assert memo.dig(test_dict, *path, dig_objects=True) == dig(
+                    test_dict, *path, dig_objects=True
+                )
+
+        stats = memo.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (8, 8, 8)
+        assert stats.hit_rate == approx(0.5)
+
+    @staticmethod
+    def test_remembered_misses_give_each_default() -> None:
+        memo = DigMemo()
+        test_dict = dict_example()
+        assert memo.dig(test_dict, "missing", default=1) == 1
+        assert memo.dig(test_dict, "missing", default=2) == 2
+        assert memo.stats().hits == 1
+
+    @staticmethod
+    def test_keyed_by_identity() -> None:
+        memo = DigMemo()
+        first, second = {"a": 1}, {"a": 1}
+        memo.dig(first, "a")
+        memo.dig(second, "a")
+        assert memo.stats().misses == 2
+
+    @staticmethod
+    def test_equal_accessors_of_other_types() -> None:
+        memo = DigMemo()
+        data = ["a", "b"]
+        assert memo.dig(data, 1) == "b"
+        assert memo.dig(data, 1.0) is None
+        assert memo.dig(data, True) == "b"
+        assert memo.stats().hits == 0
+
+    @staticmethod
+    def test_invalidate() -> None:
+        memo = DigMemo()
+        data = {"a": 1}
+        other = {"a": 1}
+        assert memo.dig(data, "a") == 1
+        memo.dig(other, "a")
+        data["a"] = 2
+        assert memo.dig(data, "a") == 1
+
+        memo.invalidate(data)
+        assert memo.dig(data, "a") == 2
+        assert memo.stats().invalidations == 1
+        assert len(memo) == 2
+
+        memo.clear()
+        assert len(memo) == 0
+        assert memo.stats().bytes == 0
+
+    @staticmethod
+    def test_weakly_referenced_roots_are_not_kept_alive() -> None:
+        memo = DigMemo()
+        for data_class in (SomeObject, PydanticModel):
+            data = data_class()
+            memo.dig(data, "nested_dict", dig_objects=True)
+            assert len(memo) == 1
+            del data
+            gc.collect()
+            assert memo.stats().entries == 0
+        assert memo.stats().invalidations == 2
+        assert memo.stats().bytes == 0
+
+    @staticmethod
+    def test_other_roots_are_kept_until_evicted() -> None:
+        memo = DigMemo(maxsize=2)
+        data = {"a": {"b": 1}}
+        memo.dig(data, "a")
+        memo.dig(data, "a", "b")
+        assert memo.stats().bytes >= sys.getsizeof(data)
+
+        memo.dig({"c": 1}, "c")
+        memo.dig({"d": 1}, "d")
+        stats = memo.stats()
+        assert (stats.entries, stats.evictions) == (2, 2)
+        assert memo.dig(data, "a", "b") == 1
+        assert memo.stats().misses == 5
+
+    @staticmethod
+    def test_max_bytes_is_a_hard_cap() -> None:
+        data = {f"key_{i}": "x" * 100 for i in range(100)}
+        # The root and about ten entries fit, whatever dicts weigh on this Python
+        entry_size = sys.getsizeof(("key_0",)) + sys.getsizeof(data["key_0"])
+        max_bytes = sys.getsizeof(data) + 10 * entry_size
+        memo = DigMemo(max_bytes=max_bytes)
+        for key in data:
+            memo.dig(data, key)
+            assert memo.stats().bytes <= max_bytes
+        assert 0 < len(memo) < 100
+        assert memo.stats().evictions > 0
+
+    @staticmethod
+    def test_too_large_values_are_not_remembered() -> None:
+        memo = DigMemo(max_bytes=1024)
+        data = {"big": "x" * 2048}
+        assert memo.dig(data, "big") == data["big"]
+        assert memo.stats().entries == 0
+        assert memo.stats().bytes == 0
+
+    @staticmethod
+    def test_unhashable_accessors_are_just_dug() -> None:
+        memo = DigMemo()
+        assert memo.dig({"a": 1}, ["a"], default=0) == 0
+        assert len(memo) == 0
+
+    @staticmethod
+    def test_bounds_must_be_positive() -> None:
+        with raises(ValueError):
+            DigMemo(maxsize=0)
+        with raises(ValueError):
+            DigMemo(max_bytes=0)
+
+    @staticmethod
+    def test_concurrent_calls() -> None:
+        memo = DigMemo(maxsize=50)
+        documents = [{"id": i, "nested": {"value": i * 2}} for i in range(200)]
+
+        def dig_all(offset: int) -> list:
+            ordered = documents[offset:] + documents[:offset]
+            return [memo.dig(document, "nested", "value") for document in ordered]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(dig_all, range(0, 200, 25)))
+        for offset, values in zip(range(0, 200, 25), results):
+            assert values == [document["id"] * 2 for document in documents[offset:] + documents[:offset]]
+        assert memo.stats().entries <= 50
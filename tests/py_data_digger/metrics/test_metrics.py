@@ -0,0 +1,141 @@
+from threading import Thread
+
+from pytest import fixture, raises
+
+from src.py_data_digger import (
+    MetricsRegistry,
+    SeekError,
+    dig,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    seek,
+)
+from tests.py_data_digger.conftest import dict_example
+
+
+@fixture
+def registry() -> MetricsRegistry:
+    yield enable_metrics()
+    disable_metrics()
+
+
+class TestMetrics:
+    """Counting seek and dig calls, hits, misses and attribute lookups while metrics are enabled."""
+
+    @staticmethod
+    def test_disabled_by_default() -> None:
+        assert get_metrics() is None
+        assert dig(dict_example(), "nested_dict", "sub_item_array", 0) == 1
+
+    @staticmethod
+    def test_enable_and_disable(registry: MetricsRegistry) -> None:
+        assert get_metrics() is registry
+        disable_metrics()
+        assert get_metrics() is None
+        dig(dict_example(), "nested_dict")
+        assert registry.snapshot()["calls"] == {}
+
+    @staticmethod
+    def test_enable_with_own_registry() -> None:
+        own = MetricsRegistry()
+        try:
+            assert enable_metrics(own) is own
+            seek(dict_example(), "keys", 0)
+        finally:
+            disable_metrics()
+        assert own.snapshot()["hits"] == {"seek": 1}
+
+    @staticmethod
+    def test_counts_hits_and_misses(registry: MetricsRegistry) -> None:
+        test_dict = dict_example()
+        assert dig(test_dict, "nested_dict", "sub_item_array", 0) == 1
+        assert dig(test_dict, "nested_dict", "missing", default="x") == "x"
+        assert dig(test_dict, "keys", 10) is None
+        assert dig(test_dict, "keys", "a") is None
+        with raises(SeekError):
+            seek(test_dict, "missing")
+
+        snapshot = registry.snapshot()
+        assert snapshot["calls"] == {"dig": 4, "seek": 1}
+        assert snapshot["hits"] == {"dig": 1}
+        assert snapshot["misses"] == {
+            ("dig", 1, "KeyError"): 1,
+            ("dig", 1, "IndexError"): 1,
+            ("dig", 1, "TypeError"): 1,
+            ("seek", 0, "KeyError"): 1,
+        }
+
+    @staticmethod
+    def test_counts_attribute_fallbacks(registry: MetricsRegistry) -> None:
+        test_dict = dict_example()
+        assert dig(test_dict, "object_item", "nested_string", dig_objects=True)
+        assert dig(test_dict, "object_item", "missing", dig_objects=True) is None
+
+        snapshot = registry.snapshot()
+        assert snapshot["attribute_fallbacks"] == {"hit": 1, "miss": 1}
+        assert snapshot["misses"] == {("dig", 1, "AttributeError"): 1}
+
+    @staticmethod
+    def test_reset(registry: MetricsRegistry) -> None:
+        dig(dict_example(), "missing")
+        registry.reset()
+        assert registry.snapshot() == {
+            "calls": {},
+            "hits": {},
+            "misses": {},
+            "attribute_fallbacks": {"hit": 0, "miss": 0},
+        }
+
+    @staticmethod
+    def test_counts_from_many_threads(registry: MetricsRegistry) -> None:
+        test_dict = dict_example()
+
+        def work() -> None:
+            for _ in range(1000):
+                dig(test_dict, "keys", 0)
+
+        threads = [Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.snapshot()["hits"] == {"dig": 8000}
+
+
+class TestPrometheus:
+    """Rendering the counters in the Prometheus text exposition format."""
+
+    @staticmethod
+    def test_to_prometheus(registry: MetricsRegistry) -> None:
+        test_dict = dict_example()
+        dig(test_dict, "keys", 0)
+        dig(test_dict, "keys", 5)
+
+        text = registry.to_prometheus()
+        assert text.endswith("\n")
+        lines = text.splitlines()
+        assert "# TYPE py_data_digger_calls_total counter" in lines
+        assert 'py_data_digger_calls_total{function="dig"} 2' in lines
+        assert 'py_data_digger_hits_total{function="dig"} 1' in lines
+        assert (
+            'py_data_digger_misses_total{function="dig",depth="1",error="IndexError"} 1' in lines
+        )
+        assert 'py_data_digger_attribute_fallbacks_total{result="hit"} 0' in lines
+
+    @staticmethod
+    def test_label_values_are_escaped() -> None:
+        registry = MetricsRegistry()
+        registry.record_hit('we"ird\\name\n')
+        assert 'py_data_digger_hits_total{function="we\\"ird\\\\name\\n"} 1' in (
+            registry.to_prometheus().splitlines()
+        )
+
+    @staticmethod
+    def test_write_prometheus(registry: MetricsRegistry, tmp_path: object) -> None:
+        dig(dict_example(), "keys", 0)
+        path = tmp_path / "digger.prom"
+        registry.write_prometheus(str(path))
+        assert path.read_text(encoding="utf-8") == registry.to_prometheus()
+        assert list(tmp_path.iterdir()) == [path]
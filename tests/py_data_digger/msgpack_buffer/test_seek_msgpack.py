@@ -0,0 +1,222 @@
+import struct
+
+from pytest import approx, mark, raises
+
+from src.py_data_digger import MsgpackExt, SeekError, dig_msgpack, seek, seek_msgpack
+
+DOCUMENT = {
+    "machines": [
+        {
+            "machine_id": 1234567890,
+            "engine": {
+                "id": "321abcde",
+                "name": "Motor XPTO ção ☃",
+                "components": [
+                    {"id": -7, "name": "Cog", "weight": -1.5e3, "blob": b"\x00\x01"},
+                    {"id": 2**40, "name": "x" * 40, "active": True},
+                    {"id": -(2**33), "name": "Bar", "extras": ["Foo", None, False]},
+                ],
+            },
+            "serials": list(range(20)),
+            "tags": {str(n): n * 300 for n in range(20)},
+        },
+        [],
+        {},
+    ],
+    "total": 3,
+    "empty": "",
+    "huge": "y" * 70000,
+    1: "int key",
+    (1, 2): "array key",
+}
+
+PATHS = [
+    (),
+    ("machines",),
+    ("machines", 0, "engine", "name"),
+    ("machines", 0, "engine", "components", 1, "name"),
+    ("machines", 0, "engine", "components", 1, "id"),
+    ("machines", 0, "engine", "components", 2, "extras", 1),
+    ("machines", 0, "engine", "components", -1, "extras", -1),
+    ("machines", 0, "engine", "components", 0, "blob", 1),
+    ("machines", 0, "engine", "name", 0),
+    ("machines", 0, "engine", "components", 0, "weight"),
+    ("machines", 0, "serials", 19),
+    ("machines", 0, "tags", "19"),
+    ("machines", slice(1, 3)),
+    ("total",),
+    ("huge", 69999),
+    (1,),
+    (1.0,),
+    ((1, 2),),
+    ("machines", 1),
+    ("machines", 3),
+    ("machines", 1, 0),
+    ("machines", 2, "engine"),
+    ("machines", 0, "engine_2", "components"),
+    ("machines", "engine"),
+    ("machines", 0, "serials", 20),
+    ("total", 0),
+    ("empty", 0),
+    ("machines", 0, "engine", "name", 100),
+    (2,),
+    (["unhashable"],),
+]
+
+
+def packb(value: object) -> bytes:
+    """Reference MessagePack encoder, picking the smallest format of each value."""
+    if value is None:
+        return b"\xc0"
+    if value is True or value is False:
+        return b"\xc3" if value else b"\xc2"
+    if isinstance(value, int):
+        return _pack_int(value)
+    if isinstance(value, float):
+        return b"\xcb" + struct.pack(">d", value)
+    if isinstance(value, str):
+        data = value.encode()
+        return _sized(len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB)) + data
+    if isinstance(value, bytes):
+        return _sized(len(value), None, 0, (0xC4, 0xC5, 0xC6)) + value
+    if isinstance(value, MsgpackExt):
+        fixed_byte = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}.get(len(value.data))
+        header = bytes([fixed_byte]) if fixed_byte else _sized(len(value.data), None, 0, (0xC7, 0xC8, 0xC9))
+        return header + struct.pack(">b", value.code) + value.data
+    if isinstance(value, (list, tuple)):
+        header = _sized(len(value), 0x90, 16, (None, 0xDC, 0xDD))
+        return header + b"".join(map(packb, value))
+    if isinstance(value, dict):
+        header = _sized(len(value), 0x80, 16, (None, 0xDE, 0xDF))
+        return header + b"".join(packb(k) + packb(v) for k, v in value.items())
+    raise TypeError(type(value))
+
+
+def _pack_int(value: int) -> bytes:
+    if 0 <= value < 0x80 or -32 <= value < 0:
+        return struct.pack(">b" if value < 0 else ">B", value)
+    if value >= 0:
+        formats = ((0xCC, ">B"), (0xCD, ">H"), (0xCE, ">I"), (0xCF, ">Q"))
+    else:
+        formats = ((0xD0, ">b"), (0xD1, ">h"), (0xD2, ">i"), (0xD3, ">q"))
+    for first_byte, fmt in formats:
+        try:
+            return bytes([first_byte]) + struct.pack(fmt, value)
+        except struct.error:
+            continue
+    raise ValueError(value)
+
+
+def _sized(size: int, fixed_byte: object, fixed_limit: int, first_bytes: tuple) -> bytes:
+    if fixed_byte is not None and size < fixed_limit:
+        return bytes([fixed_byte + size])
+    for first_byte, fmt in zip(first_bytes, (">B", ">H", ">I")):
+        if first_byte is not None and size < 2 ** (8 * struct.calcsize(fmt)):
+            return bytes([first_byte]) + struct.pack(fmt, size)
+    raise ValueError(size)
+
+
+BUFFER = packb(DOCUMENT)
+
+
+def expected_seek(*accessors: object) -> object:
+    try:
+        return seek(DOCUMENT, *accessors)
+    except SeekError as e:
+        return e
+
+
+class TestSeekMsgpack:
+    """Test seeking MessagePack buffers against seeking the decoded data."""
+
+    @staticmethod
+    @mark.parametrize("path", PATHS, ids=repr)
+    def test_same_results_as_seek(path: tuple) -> None:
+        expected = expected_seek(*path)
+
+        for buffer in (BUFFER, bytearray(BUFFER), memoryview(BUFFER)):
+            if isinstance(expected, SeekError):
+                with raises(SeekError) as ex_info:
+                    seek_msgpack(buffer, *path)
+                assert ex_info.value.message == expected.message
+                assert type(ex_info.value.__cause__) is type(expected.__cause__)
+            else:
+                assert seek_msgpack(buffer, *path) == expected
+
+    @staticmethod
+    @mark.parametrize(
+        "value",
+        [
+            None,
+            False,
+            0,
+            127,
+            -32,
+            -33,
+            255,
+            65535,
+            2**32 - 1,
+            2**64 - 1,
+            -(2**63),
+            0.5,
+            "",
+            "a" * 31,
+            "a" * 255,
+            "a" * 65536,
+            b"",
+            b"b" * 300,
+            MsgpackExt(-1, b"\x00\x00\x00\x01"),
+            MsgpackExt(5, b"abc"),
+            [None] * 16,
+            {str(n): n for n in range(16)},
+            {(1, (2, 3)): "nested array key"},
+        ],
+        ids=repr,
+    )
+    def test_decodes_and_skips_every_format(value: object) -> None:
+        assert seek_msgpack(packb(value)) == value
+        assert seek_msgpack(packb([value, "after"]), 1) == "after"
+        assert seek_msgpack(packb({"skip": value, "found": 1}), "found") == 1
+
+    @staticmethod
+    def test_float32() -> None:
+        assert seek_msgpack(b"\x91\xca" + struct.pack(">f", 0.25), 0) == approx(0.25)
+
+    @staticmethod
+    def test_only_decodes_the_value_found() -> None:
+        buffer = packb({"head": {"id": 1}, "tail": ["x" * 1000] * 1000})
+        truncated_tail = buffer[:200]
+
+        assert seek_msgpack(truncated_tail, "head", "id") == 1
+
+    @staticmethod
+    def test_scalar_root() -> None:
+        assert seek_msgpack(packb("text"), 1) == "e"
+        with raises(SeekError) as ex_info:
+            seek_msgpack(packb(42), 0)
+        assert "Path traveled: int -> 0" in ex_info.value.message
+
+    @staticmethod
+    def test_error_reports_the_path_traveled() -> None:
+        with raises(SeekError) as ex_info:
+            seek_msgpack(BUFFER, "machines", 0, "engine_2")
+        assert "Path traveled: dict -> machines -> 0 -> engine_2" in ex_info.value.message
+
+    @staticmethod
+    def test_invalid_msgpack() -> None:
+        with raises(ValueError, match="truncated"):
+            seek_msgpack(BUFFER[:50], "total")
+        with raises(ValueError, match="truncated"):
+            seek_msgpack(b"")
+        with raises(ValueError, match="0xc1"):
+            seek_msgpack(b"\x92\xc1\x01", 1)
+
+
+class TestDigMsgpack:
+    """Test the safe MessagePack dig."""
+
+    @staticmethod
+    def test_dig_msgpack() -> None:
+        assert dig_msgpack(BUFFER, "machines", 0, "machine_id") == 1234567890
+        assert dig_msgpack(BUFFER, "machines", 0, "engine_2") is None
+        assert dig_msgpack(BUFFER, "machines", 5, default={}) == {}
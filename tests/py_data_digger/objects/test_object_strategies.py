@@ -0,0 +1,184 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import product
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pytest import raises
+
+from src.py_data_digger import SeekError, dig, seek
+from tests.py_data_digger.conftest import PydanticModel, SomeObject
+
+# The module really running dig, where the strategy cache lives
+main = sys.modules[dig.__module__]
+
+
+@dataclass
+class DataclassItem:
+    name: str = "dataclass"
+    parts: list = field(default_factory=lambda: ["cog"])
+
+    @property
+    def title(self) -> str:
+        return self.name.title()
+
+
+class SlottedItem:
+    __slots__ = ("name", "unset")
+
+    def __init__(self) -> None:
+        self.name = "slotted"
+
+
+class ExtraModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    name: str = "extra"
+    _secret: str = PrivateAttr(default="private")
+
+    @property
+    def title(self) -> str:
+        return self.name.title()
+
+
+class VirtualModel(BaseModel):
+    name: str = "virtual model"
+
+    def __getattr__(self, name: str) -> object:
+        if name == "virtual":
+            return "V"
+        return super().__getattr__(name)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Subscriptable:
+    """Answers subscripts with the key itself, except for its only attribute."""
+
+    name = "attribute"
+    attribute_only = "attribute"
+
+    def __getitem__(self, key: object) -> object:
+        if key in {"missing", "attribute_only"}:
+            raise KeyError(key)
+        return f"item {key}"
+
+
+OBJECTS = [
+    DataclassItem(),
+    SlottedItem(),
+    ExtraModel(other="extra field"),
+    PydanticModel(),
+    VirtualModel(),
+    SomeObject(),
+    Color.RED,
+    Subscriptable(),
+    dict,
+]
+NAMES = [
+    "name",
+    "parts",
+    "title",
+    "unset",
+    "other",
+    "_secret",
+    "model_config",
+    "value",
+    "missing",
+    "attribute_only",
+    "__class__",
+    "nested_dict",
+    "virtual",
+]
+
+
+def reference_dig(data: object, *accessors: object) -> object:
+    # The plain rule: subscript first, then look for an attribute
+    result = data
+    for accessor in accessors:
+        try:
+            result = result[accessor]
+        except (TypeError, IndexError, KeyError, ValueError):
+            try:
+                result = getattr(result, accessor)
+            except AttributeError:
+                return "default"
+    return result
+
+
+class TestObjectStrategies:
+    """Objects are accessed the way their type allows, with the same results as the plain rule."""
+
+    @staticmethod
+    def test_same_results_as_the_plain_rule() -> None:
+        for data, name in product(OBJECTS, NAMES):
+            expected = reference_dig({"item": data}, "item", name)
+            assert dig({"item": data}, "item", name, dig_objects=True, default="default") == expected
+            if expected == "default":
+                with raises(SeekError) as error:
+                    seek({"item": data}, "item", name, seek_objects=True)
+                assert isinstance(error.value.original_error, AttributeError)
+                assert error.value.index == 1
+            else:
+                assert seek({"item": data}, "item", name, seek_objects=True) == expected
+
+    @staticmethod
+    def test_subscript_comes_before_attributes() -> None:
+        data = Subscriptable()
+        assert dig(data, "name", dig_objects=True) == "item name"
+        assert seek(data, "name", seek_objects=True) == "item name"
+        assert dig(data, "attribute_only", dig_objects=True) == "attribute"
+        assert seek(data, "attribute_only", seek_objects=True) == "attribute"
+
+    @staticmethod
+    def test_classes_may_be_subscripted() -> None:
+        assert seek({"type": list}, "type", int, seek_objects=True) == list[int]
+        assert dig({"type": Color}, "type", "RED", dig_objects=True) is Color.RED
+
+    @staticmethod
+    def test_without_objects_attributes_are_never_accessed() -> None:
+        assert dig({"item": DataclassItem()}, "item", "name") is None
+        with raises(SeekError) as error:
+            seek({"item": DataclassItem()}, "item", "name")
+        assert isinstance(error.value.original_error, TypeError)
+
+    @staticmethod
+    def test_pydantic_fields_extras_and_private_attributes() -> None:
+        model = ExtraModel(other="extra field")
+        assert dig(model, "name", dig_objects=True) == "extra"
+        assert dig(model, "other", dig_objects=True) == "extra field"
+        assert dig(model, "_secret", dig_objects=True) == "private"
+        assert dig(model, "title", dig_objects=True) == "Extra"
+        assert dig(model, "missing", dig_objects=True) is None
+
+    @staticmethod
+    def test_pydantic_models_overriding_getattr() -> None:
+        data = {"item": VirtualModel()}
+        assert dig(data, "item", "virtual", dig_objects=True) == "V"
+        assert seek(data, "item", "virtual", seek_objects=True) == "V"
+        assert dig(data, "item", "name", dig_objects=True) == "virtual model"
+        assert dig(data, "item", "missing", dig_objects=True) is None
+
+    @staticmethod
+    def test_cache_is_bounded() -> None:
+        types = [type(f"Generated{i}", (), {}) for i in range(main._STRATEGY_CACHE_SIZE + 10)]
+        for generated in types:
+            assert dig(generated(), "missing", dig_objects=True, default=0) == 0
+        assert len(main._strategies) <= main._STRATEGY_CACHE_SIZE
+        assert types[-1] in main._strategies
+
+    @staticmethod
+    def test_concurrent_lookups() -> None:
+        types = [type(f"Concurrent{i}", (), {"name": i}) for i in range(2000)]
+
+        def dig_all(offset: int) -> list:
+            return [dig(t(), "name", dig_objects=True) for t in types[offset:] + types[:offset]]
+
+        offsets = range(0, 2000, 250)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            all_results = list(pool.map(dig_all, offsets))
+        for offset, results in enumerate(all_results):
+            start = offsets[offset]
+            assert results == list(range(start, 2000)) + list(range(start))
@@ -0,0 +1,36 @@
+import subprocess  # noqa: S404
+import sys
+
+from pytest import raises
+
+import src.py_data_digger as package
+
+
+class TestLazyImports:
+    """Only seek and dig are imported with the package, the rest on first use."""
+
+    @staticmethod
+    def test_every_exported_name_is_found() -> None:
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+    @staticmethod
+    def test_unknown_names() -> None:
+        with raises(AttributeError, match="no_such_name"):
+            package.no_such_name  # noqa: B018
+
+    @staticmethod
+    def test_submodules_are_imported_on_first_use() -> None:
+        code = (
+            "import sys, src.py_data_digger as package\n"
+            "print('py_data_digger.watch' in sys.modules)\n"
+            "package.PathWatcher\n"
+            "print('py_data_digger.watch' in sys.modules)"
+        )
+
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.split() == ["False", "True"]
@@ -0,0 +1,69 @@
+from pytest import raises
+
+from src.py_data_digger import PathTrie, compile_paths, dig, dig_paths
+from tests.py_data_digger.conftest import CountingDict, dict_example
+
+PATHS = {
+    "array_head": ("nested_dict", "sub_item_array", 0),
+    "array_tail": ("nested_dict", "sub_item_array", -1),
+    "dict_b": ("nested_dict", "sub_item_dict", "b"),
+    "missing": ("nested_dict", "unknow_key", 0),
+    "object_string": ("nested_dict", "sub_item_object", "nested_string"),
+    "root": (),
+}
+
+
+class TestDigPaths:
+    """Test digging many paths at once."""
+
+    @staticmethod
+    def test_same_results_as_dig() -> None:
+        test_dict = dict_example()
+
+        results = dig_paths(test_dict, PATHS)
+
+        assert results == {name: dig(test_dict, *path) for name, path in PATHS.items()}
+        assert results["array_head"] == 1
+        assert results["array_tail"] == 3
+        assert results["object_string"] is None
+        assert results["root"] is test_dict
+
+    @staticmethod
+    def test_dig_objects_and_default() -> None:
+        results = dig_paths(dict_example(), PATHS, dig_objects=True, default="n/a")
+
+        assert results["object_string"] == "This is a string inside object"
+        assert results["missing"] == "n/a"
+
+    @staticmethod
+    def test_compiled_trie_is_reusable() -> None:
+        trie = compile_paths(PATHS)
+
+        assert isinstance(trie, PathTrie)
+        assert len(trie) == len(PATHS)
+        assert dig_paths(dict_example(), trie)["dict_b"] == 1
+        assert trie.dig({"nested_dict": {"sub_item_dict": {"b": 2}}})["dict_b"] == 2
+
+    @staticmethod
+    def test_shared_prefix_is_walked_once() -> None:
+        nested = CountingDict({"a": 1, "b": 2, "c": 3})
+        data = CountingDict({"nested": nested})
+
+        results = dig_paths(data, {"a": ("nested", "a"), "b": ("nested", "b"), "c": ("nested", "c")})
+
+        assert results == {"a": 1, "b": 2, "c": 3}
+        assert (data.reads, nested.reads) == (1, 3)
+
+    @staticmethod
+    def test_missing_shared_prefix_is_not_probed_further() -> None:
+        data = CountingDict()
+
+        results = dig_paths(data, {"a": ("nested", "a"), "b": ("nested", "b")}, default=0)
+
+        assert results == {"a": 0, "b": 0}
+        assert data.reads == 1
+
+    @staticmethod
+    def test_path_must_be_a_sequence_of_accessors() -> None:
+        with raises(TypeError, match="sequence of accessors"):
+            compile_paths({"name": "nested_dict"})
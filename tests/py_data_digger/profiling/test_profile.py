@@ -0,0 +1,213 @@
+import json
+import sys
+
+from pytest import raises
+
+from src.py_data_digger import (
+    DigProfile,
+    DigView,
+    SeekError,
+    compile_path,
+    dig,
+    dig_many,
+    dig_path,
+    dig_paths,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    profile,
+    seek,
+)
+from tests.py_data_digger.conftest import SomeObject, dict_example
+
+
+def main_module() -> object:
+    return sys.modules[dig.__module__]
+
+
+class TestProfile:
+    """Timing seek and dig calls by path while a profile block is active."""
+
+    @staticmethod
+    def test_records_calls_misses_and_times_by_path() -> None:
+        test_dict = dict_example()
+        with profile() as profiled:
+            for _ in range(3):
+                dig(test_dict, "nested_dict", "sub_item_array", 0)
+            dig(test_dict, "keys", 10)
+            with raises(SeekError):
+                seek(test_dict, "missing")
+            seek(test_dict, "keys", 1)
+
+        entries = {(entry.function, entry.path): entry for entry in profiled.entries()}
+        assert set(entries) == {
+            ("dig", ("nested_dict", "sub_item_array", 0)),
+            ("dig", ("keys", 10)),
+            ("seek", ("missing",)),
+            ("seek", ("keys", 1)),
+        }
+        hit = entries["dig", ("nested_dict", "sub_item_array", 0)]
+        assert (hit.calls, hit.misses, hit.call_site) == (3, 0, None)
+        assert hit.seconds > 0
+        assert not hit.exception_seconds
+        miss = entries["dig", ("keys", 10)]
+        assert (miss.calls, miss.misses) == (1, 1)
+        assert miss.seconds > 0
+        seek_miss = entries["seek", ("missing",)]
+        assert seek_miss.misses == 1
+        assert 0 < seek_miss.exception_seconds <= seek_miss.seconds
+
+    @staticmethod
+    def test_object_attribute_lookups() -> None:
+        test_dict = dict_example()
+        with profile() as profiled:
+            dig(test_dict, "object_item", "nested_string", dig_objects=True)
+            dig(test_dict, "object_item", "missing", dig_objects=True)
+
+        document = json.loads(profiled.to_json())
+        assert document["attribute_fallbacks"] == {"hit": 1, "miss": 1}
+        missing = next(e for e in document["paths"] if e["path"] == ["object_item", "missing"])
+        assert missing["misses"] == 1
+
+    @staticmethod
+    def test_dig_is_timed_through_its_probing() -> None:
+        class Catalog:
+            def __getitem__(self, key: object) -> object:
+                raise KeyError(key)
+
+        with profile() as profiled:
+            dig({"keys": [1]}, "keys", 10)
+            dig({"catalog": Catalog()}, "catalog", "missing")
+
+        entries = {entry.path: entry for entry in profiled.entries()}
+        # Built-in containers are probed without raising, unlike in seek
+        assert not entries["keys", 10].exception_seconds
+        custom = entries["catalog", "missing"]
+        assert 0 < custom.exception_seconds <= custom.seconds
+
+    @staticmethod
+    def test_helpers_built_on_seek_and_dig() -> None:
+        records = [{"a": SomeObject()} for _ in range(5)] + [{}, {"a": 1}]
+        view = DigView({"keys": [1, 2]})
+        with profile() as profiled:
+            list(dig_many(records, "a", "nested_string", dig_objects=True))
+            compile_path("a").seek(records[0])
+            dig_paths({"keys": [1]}, {"first": ("keys", 0), "tenth": ("keys", 10)})
+            view["keys"][1].value()
+            view["keys"][10].get()
+
+        entries = {(entry.function, entry.path): entry for entry in profiled.entries()}
+        assert {key: (entry.calls, entry.misses) for key, entry in entries.items()} == {
+            ("dig", ("a", "nested_string")): (7, 2),
+            ("seek", ("a",)): (1, 0),
+            ("dig", ("keys", 0)): (1, 0),
+            ("dig", ("keys", 10)): (2, 2),
+            ("seek", ("keys", 1)): (1, 0),
+        }
+
+    @staticmethod
+    def test_sorted_report() -> None:
+        test_dict = dict_example()
+        with profile() as profiled:
+            for _ in range(5):
+                dig(test_dict, "keys", 0)
+            dig(test_dict, "nested_dict")
+
+        assert [entry.calls for entry in profiled.entries("calls")] == [5, 1]
+        lines = profiled.report(sort_by="calls").splitlines()
+        assert lines[0].split() == ["calls", "misses", "total", "ms", "mean", "us", "exc", "ms", "function", "path"]
+        assert lines[1].split()[0] == "5"
+        assert lines[1].endswith("keys -> 0")
+        assert len(profiled.report(limit=1).splitlines()) == 2
+        with raises(ValueError, match="sort_by"):
+            profiled.entries("name")
+
+    @staticmethod
+    def test_call_sites() -> None:
+        test_dict = dict_example()
+        with profile(call_sites=True) as profiled:
+            dig(test_dict, "keys", 0)
+            dig_path(test_dict, "keys[1]")
+            dig(test_dict, "keys", 0)
+
+        sites = [entry.call_site for entry in profiled.entries()]
+        assert len(sites) == 3
+        # Calls through the package, like dig_path, are told apart by the caller's line
+        assert all(site.startswith(__file__) for site in sites)
+        assert "test_profile.py" in profiled.report()
+
+    @staticmethod
+    def test_unhashable_and_equal_accessors_are_told_apart() -> None:
+        with profile() as profiled:
+            dig({1: "a"}, 1)
+            dig({1: "a"}, True)
+            dig({1: "a"}, ["unhashable"])
+
+        assert sorted(repr(entry.path) for entry in profiled.entries()) == ["(1,)", "(True,)", "(['unhashable'],)"]
+        assert json.loads(profiled.to_json())["paths"][0]["path"] is not None
+
+    @staticmethod
+    def test_write_json(tmp_path: object) -> None:
+        with profile() as profiled:
+            dig(dict_example(), "keys", slice(0, 1))
+        path = tmp_path / "profile.json"
+        profiled.write_json(str(path))
+
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["paths"][0]["path"] == ["keys", "slice(0, 1, None)"]
+        assert list(tmp_path.iterdir()) == [path]
+
+    @staticmethod
+    def test_reset() -> None:
+        with profile() as profiled:
+            dig(dict_example(), "missing")
+        profiled.reset()
+        assert profiled.entries() == []
+
+    @staticmethod
+    def test_nested_profiles_and_metrics() -> None:
+        registry = enable_metrics()
+        try:
+            with profile() as outer:
+                dig(dict_example(), "keys")
+                with profile() as inner:
+                    dig(dict_example(), "missing")
+                dig(dict_example(), "keys")
+            assert get_metrics() is registry
+        finally:
+            disable_metrics()
+
+        assert [entry.calls for entry in outer.entries("calls")] == [2, 1]
+        assert [entry.path for entry in inner.entries()] == [("missing",)]
+        assert registry.snapshot()["calls"] == {"dig": 3}
+        assert main_module()._observer is None
+
+    @staticmethod
+    def test_stopped_even_on_errors() -> None:
+        with raises(KeyError), profile() as profiled:
+            raise KeyError
+        dig(dict_example(), "keys")
+        assert isinstance(profiled, DigProfile)
+        assert profiled.entries() == []
+
+
+class TestDisabledOverhead:
+    """Without an active profile, seek and dig take their untimed path."""
+
+    @staticmethod
+    def test_no_timing_when_disabled(monkeypatch: object) -> None:
+        with profile():
+            pass
+
+        def fail() -> float:
+            raise AssertionError("perf_counter called while profiling is disabled")  # noqa: TRY003
+
+        monkeypatch.setattr(main_module(), "perf_counter", fail)
+        test_dict = dict_example()
+        assert main_module()._observer is None
+        assert dig(test_dict, "keys", 0) == "The key 1"
+        assert dig(test_dict, "missing") is None
+        assert dig(test_dict, "object_item", "nested_string", dig_objects=True)
+        assert seek(test_dict, "keys", 1) == "The key 2"
+        with raises(SeekError):
+            seek(test_dict, "missing")
@@ -0,0 +1,110 @@
+from itertools import product
+
+from pytest import raises
+
+from src.py_data_digger import SchemaRecord, compile_schema, dig
+from tests.py_data_digger.conftest import array_example, dict_example, tuple_example
+
+ACCESSORS = ["nested_dict", "sub_item_array", "object_item", "nested_string", 0, 1, -1, 9, 1.0, True, "a"]
+
+
+def schema_of_all_paths() -> dict:
+    schema = {}
+    for length in range(4):
+        for index, path in enumerate(product(ACCESSORS, repeat=length)):
+            schema[f"field_{length}_{index}"] = (path, f"default {length} {index}")
+    return schema
+
+
+class TestCompileSchema:
+    """Extracting flat records from nested data with generated functions."""
+
+    @staticmethod
+    def test_same_results_as_dig() -> None:
+        schema = schema_of_all_paths()
+        for dig_objects, data in product(
+            (False, True), (dict_example(), tuple_example(), array_example(), "text", None)
+        ):
+            expected = {}
+            for name, (path, default) in schema.items():
+                try:
+                    expected[name] = dig(data, *path, dig_objects=dig_objects, default=default)
+                except TypeError:
+                    # getattr only takes strings, so integers can't be looked for in objects
+                    continue
+            valid_schema = {name: schema[name] for name in expected}
+            assert compile_schema(valid_schema, dig_objects=dig_objects)(data) == expected
+
+    @staticmethod
+    def test_outputs() -> None:
+        schema = {
+            "first": (("keys", 0), None),
+            "missing": (("keys", 5), "none"),
+            "array": (("nested_dict", "sub_item_array"), []),
+        }
+        test_dict = dict_example()
+        assert compile_schema(schema)(test_dict) == {
+            "first": "The key 1",
+            "missing": "none",
+            "array": [1, 2, 3],
+        }
+        assert compile_schema(schema, output="tuple")(test_dict) == ("The key 1", "none", [1, 2, 3])
+
+        record = compile_schema(schema, output="slots")(test_dict)
+        assert isinstance(record, SchemaRecord)
+        assert (record.first, record.missing, record.array) == ("The key 1", "none", [1, 2, 3])
+        assert record._asdict() == compile_schema(schema)(test_dict)
+        assert repr(record) == "Record(first='The key 1', missing='none', array=[1, 2, 3])"
+        assert not hasattr(record, "__dict__")
+
+    @staticmethod
+    def test_source_is_inspectable() -> None:
+        extract = compile_schema({"a": (("x", "y"), None), "b": (("x", "z"), None)})
+        assert extract.source.startswith("def extract(record):")
+        # The shared prefix is subscripted once
+        assert extract.source.count("record['x']") == 1
+        assert extract.fields == ("a", "b")
+        assert extract.output == "dict"
+        assert extract.record_type is None
+
+    @staticmethod
+    def test_generated_code_is_cached_by_structure() -> None:
+        first = compile_schema({"a": (("x", 1), None)}, output="slots")
+        second = compile_schema({"a": (("x", 1), "other default")}, output="slots")
+        other = compile_schema({"a": (("x", True), None)}, output="slots")
+
+        assert first.extract.__code__ is second.extract.__code__
+        assert first.record_type is second.record_type
+        assert first.extract.__code__ is not other.extract.__code__
+        assert second({"x": []}).a == "other default"
+        assert other({"x": [0, 1]}).a == 1
+
+    @staticmethod
+    def test_unusual_accessors_and_names() -> None:
+        key = ("tuple", "key")
+        data = {key: {None: "found"}, 2: "int key"}
+        extract = compile_schema({0: ((key, None), None), ("name",): ((2,), None), "list": (([],), "x")})
+        assert extract(data) == {0: "found", ("name",): "int key", "list": "x"}
+
+    @staticmethod
+    def test_extract_many() -> None:
+        extract = compile_schema({"id": (("id",), None)}, output="tuple")
+        assert list(extract.extract_many([{"id": 1}, {}, {"id": 3}])) == [(1,), (None,), (3,)]
+
+    @staticmethod
+    def test_slots_field_named_self() -> None:
+        extract = compile_schema({"self": (("a",), None), "other": (("b",), 0)}, output="slots")
+        record = extract({"a": 1})
+        assert (record.self, record.other) == (1, 0)
+
+    @staticmethod
+    def test_invalid_schemas() -> None:
+        with raises(ValueError):
+            compile_schema({}, output="list")
+        with raises(TypeError):
+            compile_schema({"a": ("a.b", None)})
+        with raises(TypeError):
+            compile_schema({"a": ["a", "b"]})
+        for name in ("not valid", "class", "__private", 1):
+            with raises(ValueError):
+                compile_schema({name: (("a",), None)}, output="slots")
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from itertools import islice
+
+from src.py_data_digger import find_paths, seek
+from tests.py_data_digger.conftest import PydanticModel, SomeObject, dict_example
+
+
+@dataclass
+class Node:
+    name: str
+    children: list
+
+
+class Slotted:
+    __slots__ = ("id", "unset")
+
+    def __init__(self) -> None:
+        self.id = "slotted"
+
+
+class TestFindPaths:
+    """Finding paths by key, value and predicate, anywhere in the data."""
+
+    @staticmethod
+    def test_find_by_key() -> None:
+        data = {"id": 1, "items": [{"id": 2}, {"name": "x", "sub": {"id": 3}}], "ids": [0]}
+        paths = list(find_paths(data, key="id"))
+        assert paths == [("id",), ("items", 0, "id"), ("items", 1, "sub", "id")]
+        assert [seek(data, *path) for path in paths] == [1, 2, 3]
+
+    @staticmethod
+    def test_indexes_never_match_a_key() -> None:
+        data = {0: "zero", "list": ["first"]}
+        assert list(find_paths(data, key=0)) == [(0,)]
+
+    @staticmethod
+    def test_find_by_value() -> None:
+        data = dict_example()
+        assert list(find_paths(data, value="y")) == [("nested_dict", "sub_item_tuple", 1)]
+        assert list(find_paths(data, value=data)) == [()]
+        assert list(find_paths(data, value="not there")) == []
+
+    @staticmethod
+    def test_find_by_predicate() -> None:
+        data = {"a": [1, 20, 3], "b": {"c": 30}}
+        paths = find_paths(data, predicate=lambda _, value: isinstance(value, int) and value > 10)
+        assert list(paths) == [("a", 1), ("b", "c")]
+
+    @staticmethod
+    def test_criteria_are_combined() -> None:
+        data = {"a": {"id": 1}, "b": {"id": 2}, "c": {"key": 2}}
+        assert list(find_paths(data, key="id", value=2)) == [("b", "id")]
+        assert list(find_paths(data, key="id", predicate=lambda path, _: path[0] == "a")) == [
+            ("a", "id")
+        ]
+
+    @staticmethod
+    def test_max_depth_and_max_results() -> None:
+        data = {"id": 0, "a": {"id": 1, "b": {"id": 2}}}
+        assert list(find_paths(data, key="id", max_depth=2)) == [("id",), ("a", "id")]
+        assert list(find_paths(data, key="id", max_results=1)) == [("id",)]
+        assert list(find_paths(data, key="id", max_results=0)) == []
+        assert list(find_paths(data, max_depth=0)) == [()]
+
+    @staticmethod
+    def test_stops_early() -> None:
+        visited = []
+
+        def predicate(path: tuple, value: object) -> bool:
+            visited.append(path)
+            return value == 1
+
+        data = {"a": 1, "b": list(range(1000))}
+        assert next(find_paths(data, predicate=predicate)) == ("a",)
+        assert visited == [(), ("a",)]
+
+    @staticmethod
+    def test_objects() -> None:
+        data = {"object": SomeObject(), "dataclass": Node("root", [Slotted()])}
+        assert list(find_paths(data, key="nested_array")) == []
+
+        paths = list(find_paths(data, key="nested_array", objects=True))
+        assert paths == [("object", "nested_dict", "nested_array")]
+        assert list(find_paths(data, key="id", objects=True)) == [("dataclass", "children", 0, "id")]
+        for path in find_paths(data, value="John Doe", objects=True):
+            assert seek(data, *path, seek_objects=True) == "John Doe"
+        assert list(find_paths(PydanticModel(), key="a", objects=True)) == [("nested_dict", "a")]
+
+    @staticmethod
+    def test_cycles() -> None:
+        root = Node("root", [])
+        child = Node("child", [root])
+        root.children.append(child)
+        data = {"list": []}
+        data["list"].append(data)
+
+        assert list(find_paths(root, key="name", objects=True)) == [
+            ("name",),
+            ("children", 0, "name"),
+        ]
+        assert list(find_paths(data, value=data)) == [(), ("list", 0)]
+
+    @staticmethod
+    def test_lazy() -> None:
+        data = [{"id": i} for i in range(10_000)]
+        assert list(islice(find_paths(data, key="id"), 3)) == [(0, "id"), (1, "id"), (2, "id")]
+
+    @staticmethod
+    def test_strings_are_values() -> None:
+        assert list(find_paths({"a": "xyz"}, value="x")) == []
+
+    @staticmethod
+    def test_comparisons_without_truth_value() -> None:
+        class Ambiguous:
+            def __eq__(self, other: object) -> bool:
+                raise ValueError
+
+            __hash__ = object.__hash__
+
+        assert list(find_paths({"a": Ambiguous(), "b": 1}, value=1)) == [("b",)]
@@ -0,0 +1,96 @@
+import pickle  # noqa: S403
+
+from pytest import raises
+
+from src.py_data_digger import SeekError, seek
+from tests.py_data_digger.conftest import dict_example
+
+
+class StrCountingKey:
+    """Accessor that counts how many times it is turned into a string."""
+
+    def __init__(self) -> None:
+        self.str_calls = 0
+
+    def __str__(self) -> str:
+        self.str_calls += 1
+        return "counting_key"
+
+
+class TestSeekErrorFields:
+    """Test the structured fields of SeekError."""
+
+    @staticmethod
+    def test_structured_fields() -> None:
+        with raises(SeekError) as ex_info:
+            seek(dict_example(), "nested_dict", "sub_item_array", 10, "foo")
+
+        error = ex_info.value
+        assert error.index == 2
+        assert error.data_type is dict
+        assert error.accessors == ("nested_dict", "sub_item_array", 10, "foo")
+        assert error.path == ("nested_dict", "sub_item_array", 10)
+        assert type(error.original_error) is IndexError
+        assert error.original_error is error.__cause__
+        assert error.to_dict() == {
+            "error": "IndexError",
+            "data_type": "dict",
+            "index": 2,
+            "path": ["nested_dict", "sub_item_array", 10],
+            "accessors": ["nested_dict", "sub_item_array", 10, "foo"],
+        }
+
+    @staticmethod
+    def test_message_is_formatted_only_when_read() -> None:
+        key = StrCountingKey()
+
+        with raises(SeekError) as ex_info:
+            seek({}, key)
+
+        assert key.str_calls == 0
+        assert str(ex_info.value) == (
+            "Data digger can't go any further: KeyError\nPath traveled: dict -> counting_key"
+        )
+        assert ex_info.value.args == (str(ex_info.value),)
+        assert key.str_calls == 3
+
+    @staticmethod
+    def test_does_not_keep_the_original_data() -> None:
+        test_dict = dict_example()
+
+        with raises(SeekError) as ex_info:
+            seek(test_dict, "unknow_key")
+
+        assert all(arg is not test_dict for arg in ex_info.value.args)
+        assert test_dict not in vars(ex_info.value).values()
+
+    @staticmethod
+    def test_pickle_round_trip() -> None:
+        with raises(SeekError) as ex_info:
+            seek(dict_example(), "nested_dict", "unknow_key")
+
+        loaded = pickle.loads(pickle.dumps(ex_info.value))  # noqa: S301
+
+        assert type(loaded) is SeekError
+        assert loaded.message == ex_info.value.message
+        assert loaded.path == ("nested_dict", "unknow_key")
+
+    @staticmethod
+    def test_args_and_message_can_be_set() -> None:
+        with raises(SeekError) as ex_info:
+            try:
+                seek(dict_example(), "unknow_key")
+            except SeekError as e:
+                e.args = (f"While reading the config: {e.args[0]}", *e.args[1:])
+                raise
+
+        error = ex_info.value
+        assert str(error).startswith("While reading the config: Data digger can't go any further")
+        assert error.message.startswith("Data digger can't go any further")
+        assert pickle.loads(pickle.dumps(error)).args == error.args  # noqa: S301
+
+        error.message = "Custom message"
+        assert error.message == "Custom message"
+        error.args = ("first", "second")
+        assert str(error) == "('first', 'second')"
+        assert repr(error) == "SeekError('first', 'second')"
@@ -0,0 +1,126 @@
+from pytest import approx, mark, raises
+
+from src.py_data_digger import (
+    PathSyntaxError,
+    SeekError,
+    clear_path_cache,
+    dig_path,
+    parse_path,
+    path_cache_info,
+    seek_path,
+)
+from tests.py_data_digger.conftest import dict_example
+
+
+class TestParsePath:
+    """Splitting path strings into accessors."""
+
+    @staticmethod
+    @mark.parametrize(
+        ("path", "accessors"),
+        [
+            ("", ()),
+            ("machines", ("machines",)),
+            ("machines[0].engine.components[-1].name", ("machines", 0, "engine", "components", -1, "name")),
+            ("[0][1]", (0, 1)),
+            ("a.0", ("a", "0")),
+            ('a["0"]', ("a", "0")),
+            ("settings['log.level']", ("settings", "log.level")),
+            (r'a["quote \" and \\ backslash"]', ("a", 'quote " and \\ backslash')),
+            (r"version\.major", ("version.major",)),
+            (r"a\[0\]\\b", ("a[0]\\b",)),
+            ("with spaces.and-dashes", ("with spaces", "and-dashes")),
+            ("ünïcode.ключ", ("ünïcode", "ключ")),
+        ],
+    )
+    def test_valid_paths(path: str, accessors: tuple) -> None:
+        assert parse_path(path) == accessors
+
+    @staticmethod
+    @mark.parametrize(
+        ("path", "position"),
+        [
+            (".a", 0),
+            ("a.", 2),
+            ("a..b", 2),
+            ("a.[0]", 2),
+            ("a[", 2),
+            ("a[x]", 2),
+            ("a[1.5]", 2),
+            ("a[0]b", 4),
+            ("a]", 1),
+            ("a['b'", 5),
+            ("a['b", 2),
+            ("a['b'x]", 5),
+            ("a\\b", 2),
+            ("a\\", 2),
+        ],
+    )
+    def test_invalid_paths(path: str, position: int) -> None:
+        with raises(PathSyntaxError) as error:
+            parse_path(path)
+        assert error.value.position == position
+        assert error.value.path == path
+        assert isinstance(error.value, ValueError)
+        assert f"at position {position}" in str(error.value)
+
+    @staticmethod
+    def test_path_must_be_a_string() -> None:
+        with raises(TypeError):
+            parse_path(b"a.b")
+
+
+class TestPathCache:
+    """Parsed paths are cached, with counters to look at."""
+
+    @staticmethod
+    def test_hits_and_misses() -> None:
+        clear_path_cache()
+        for _ in range(10):
+            parse_path("machines[0].engine")
+        parse_path("owner.name")
+
+        info = path_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (9, 2, 2)
+        assert info.hit_rate == approx(9 / 11)
+        assert info.parse_seconds > 0
+
+    @staticmethod
+    def test_clear() -> None:
+        parse_path("owner.name")
+        clear_path_cache()
+        info = path_cache_info()
+        assert (info.hits, info.misses, info.currsize, info.parse_seconds) == (0, 0, 0, 0.0)
+        assert not info.hit_rate
+
+    @staticmethod
+    def test_cache_is_bounded() -> None:
+        clear_path_cache()
+        for i in range(path_cache_info().maxsize + 10):
+            parse_path(f"key_{i}")
+        assert path_cache_info().currsize == path_cache_info().maxsize
+
+
+class TestSeekAndDigPath:
+    """Seeking and digging with path strings."""
+
+    @staticmethod
+    def test_seek_path() -> None:
+        test_dict = dict_example()
+        assert seek_path(test_dict, "nested_dict.sub_item_array[-1]") == 3
+        assert seek_path(test_dict, "object_item.nested_dict.nested_array[0]", seek_objects=True) == 9
+        with raises(SeekError) as error:
+            seek_path(test_dict, "nested_dict.missing[0]")
+        assert error.value.path == ("nested_dict", "missing")
+
+    @staticmethod
+    def test_dig_path() -> None:
+        test_dict = dict_example()
+        assert dig_path(test_dict, "nested_dict.sub_item_tuple[1]") == "y"
+        assert dig_path(test_dict, "keys[5]", default="none") == "none"
+        assert dig_path(test_dict, "object_item.nested_string", dig_objects=True).startswith("This")
+
+    @staticmethod
+    def test_syntax_errors_are_raised_by_dig() -> None:
+        with raises(PathSyntaxError):
+            dig_path(dict_example(), "keys[")
@@ -0,0 +1,109 @@
+from itertools import product
+
+from pytest import mark, raises
+
+from src.py_data_digger import DigView, SeekError, dig, seek
+from tests.py_data_digger.conftest import CountingDict, PydanticModel, dict_example
+
+ACCESSORS = ["nested_dict", "sub_item_array", "object_item", "nested_pydatic_model", "name", 0, -1, "missing"]
+
+
+def seek_outcome(seek_function: object, *accessors: object) -> object:
+    try:
+        return ("found", seek_function(*accessors))
+    except SeekError as e:
+        return ("error", e.message, e.index, e.accessors)
+    except TypeError:
+        # Like seek with objects, when an int accessor reaches an object
+        return ("type error",)
+
+
+def extend(view: DigView, path: tuple) -> DigView:
+    for accessor in path:
+        view = view[accessor]
+    return view
+
+
+class TestDigView:
+    """Lazy views of a path, resolved like seek and dig."""
+
+    @staticmethod
+    @mark.parametrize("objects", [False, True])
+    @mark.parametrize("length", [0, 1, 2, 3])
+    def test_same_results_as_seek_and_dig(objects: bool, length: int) -> None:
+        data = dict_example()
+        for path in product(ACCESSORS, repeat=length):
+            view = extend(DigView(data, objects=objects), path)
+            expected = seek_outcome(lambda *a: seek(data, *a, seek_objects=objects), *path)
+
+            assert seek_outcome(lambda *_: view.value(), *path) == expected, path  # noqa: B023
+            if expected == ("type error",):
+                continue
+            assert view.get(default="default") == dig(data, *path, dig_objects=objects, default="default")
+
+    @staticmethod
+    def test_attribute_access_records_accessors() -> None:
+        view = DigView(dict_example())
+
+        nested = view.nested_dict.sub_item_dict
+        assert nested.path == ("nested_dict", "sub_item_dict")
+        assert nested.b.value() == 1
+        assert view["nested_dict"].sub_item_array[2].value() == 3
+
+    @staticmethod
+    def test_member_names_are_subscripted() -> None:
+        view = DigView({"path": 1, "value": 2, "_private": 3})
+
+        assert view["path"].value() == 1
+        assert view["value"].value() == 2
+        assert view["_private"].value() == 3
+        with raises(AttributeError):
+            view._private  # noqa: B018
+
+    @staticmethod
+    def test_does_not_touch_the_data_until_resolved() -> None:
+        data = CountingDict({"a": CountingDict({"b": CountingDict({"c": 1, "d": 2})})})
+        view = DigView(data).a.b
+
+        c = view.c
+        d = view.d
+        assert data.reads == 0
+
+        assert c.value() == 1
+        assert data.reads == 1
+        assert d.value() == 2
+        assert data.reads == 1
+        assert c.value() == 1
+        assert data["a"]["b"].reads == 2
+
+    @staticmethod
+    def test_failed_resolution_reports_the_whole_path() -> None:
+        view = DigView({"machines": []}).machines[0].engine.name
+
+        with raises(SeekError) as ex_info:
+            view.value()
+        assert ex_info.value.message == (
+            "Data digger can't go any further: IndexError\nPath traveled: dict -> machines -> 0"
+        )
+        assert ex_info.value.accessors == ("machines", 0, "engine", "name")
+        assert view.get("default") == "default"
+
+    @staticmethod
+    def test_objects() -> None:
+        data = {"model": PydanticModel()}
+
+        assert DigView(data, objects=True).model.name.value() == "John Doe"
+        assert DigView(data).model.name.get() is None
+
+    @staticmethod
+    def test_iteration_resolves_the_value() -> None:
+        view = DigView(dict_example()).nested_dict
+
+        assert list(view.sub_item_array) == [1, 2, 3]
+        assert sorted(view.sub_item_dict) == ["a", "b"]
+        with raises(SeekError):
+            iter(view.missing)
+
+    @staticmethod
+    def test_repr() -> None:
+        assert repr(DigView({}).machines[0]) == "DigView(<dict> -> 'machines' -> 0, objects=False)"
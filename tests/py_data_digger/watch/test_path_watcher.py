@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from math import nan
+
+from pytest import fixture
+
+from src.py_data_digger import PathChange, PathWatcher, compile_paths, dig_paths
+
+PATHS = {
+    "engine": ("machines", 0, "engine"),
+    "engine_name": ("machines", 0, "engine", "name"),
+    "first_component": ("machines", 0, "engine", "components", 0, "id"),
+    "second_machine": ("machines", 1, "machine_id"),
+    "total": ("total",),
+    "missing": ("missing", "deep"),
+}
+
+
+def document() -> dict:
+    return {
+        "machines": [
+            {
+                "machine_id": "1234",
+                "engine": {
+                    "name": "Motor XPTO",
+                    "components": [{"id": "0942323", "weight": 1.5}, {"id": "1642723", "weight": nan}],
+                },
+            },
+            {"machine_id": "5678", "engine": None},
+        ],
+        "total": 2,
+        "noise": list(range(100)),
+    }
+
+
+@fixture
+def watcher() -> PathWatcher:
+    watcher = PathWatcher(PATHS)
+    watcher.update(document())
+    return watcher
+
+
+class Opaque:
+    """Object compared by identity."""
+
+
+@dataclass
+class Engine:
+    name: str
+    cylinders: int
+
+
+class TestPathWatcher:
+    """Reporting only the watched paths whose values changed between versions of a document."""
+
+    @staticmethod
+    def test_first_update_reports_every_path() -> None:
+        watcher = PathWatcher(PATHS, default="none")
+
+        changes = watcher.update(document())
+        assert set(changes) == set(PATHS)
+        assert changes["total"] == PathChange(("total",), "none", 2)
+        assert changes["missing"] == PathChange(("missing", "deep"), "none", "none")
+        assert watcher.values == dig_paths(document(), PATHS, default="none")
+
+    @staticmethod
+    def test_unchanged_document(watcher: PathWatcher) -> None:
+        assert watcher.update(document()) == {}
+        # Everything below the unchanged engine is skipped
+        assert watcher.last_skipped == 2
+
+    @staticmethod
+    def test_changed_scalar(watcher: PathWatcher) -> None:
+        data = document()
+        data["total"] = 3
+        data["noise"].append(100)
+
+        assert watcher.update(data) == {"total": PathChange(("total",), 2, 3)}
+        assert watcher.values["total"] == 3
+
+    @staticmethod
+    def test_change_deep_inside_a_watched_value(watcher: PathWatcher) -> None:
+        data = document()
+        data["machines"][0]["engine"]["components"][0]["id"] = "new"
+
+        changes = watcher.update(data)
+        assert set(changes) == {"engine", "first_component"}
+        assert changes["first_component"].old == "0942323"
+        assert changes["first_component"].new == "new"
+        assert watcher.last_skipped == 0
+
+    @staticmethod
+    def test_changes_made_in_place_are_seen() -> None:
+        data = document()
+        watcher = PathWatcher(PATHS)
+        watcher.update(data)
+
+        data["machines"][0]["engine"]["components"].append({"id": "3"})
+        assert set(watcher.update(data)) == {"engine"}
+
+    @staticmethod
+    def test_paths_appearing_and_disappearing(watcher: PathWatcher) -> None:
+        data = document()
+        del data["machines"][1]
+        data["missing"] = {"deep": 0}
+
+        changes = watcher.update(data)
+        assert changes == {
+            "second_machine": PathChange(("machines", 1, "machine_id"), "5678", None),
+            "missing": PathChange(("missing", "deep"), None, 0),
+        }
+
+    @staticmethod
+    def test_values_are_compared_with_equality() -> None:
+        watcher = PathWatcher({"value": ("value",), "nan": ("nan",)})
+        watcher.update({"value": {"a": 1, "b": [1, 2]}, "nan": nan})
+
+        assert watcher.update({"value": {"b": [1, 2], "a": 1}, "nan": float("nan")}) == {}
+        assert watcher.update({"value": {"b": [1, 2], "a": 1.0}, "nan": nan}) == {}
+        assert set(watcher.update({"value": {"b": (1, 2), "a": 1}, "nan": nan})) == {"value"}
+
+    @staticmethod
+    def test_in_place_key_changes() -> None:
+        data = {"value": {"a": 1}}
+        watcher = PathWatcher({"value": ("value",)})
+        watcher.update(data)
+
+        data["value"]["a"] = 2
+        assert set(watcher.update(data)) == {"value"}
+        assert watcher.update(data) == {}
+
+    @staticmethod
+    def test_cyclic_values() -> None:
+        data = {"loop": []}
+        data["loop"].append(data)
+        watcher = PathWatcher({"loop": ("loop",)})
+        watcher.update(data)
+
+        assert watcher.update(data) == {}
+        data["loop"].append(1)
+        assert set(watcher.update(data)) == {"loop"}
+
+    @staticmethod
+    def test_objects() -> None:
+        watcher = PathWatcher({"engine": ("engine",), "name": ("engine", "name")}, dig_objects=True)
+        watcher.update({"engine": Engine("V8", 8)})
+
+        assert watcher.update({"engine": Engine("V8", 8)}) == {}
+        assert watcher.last_skipped == 1
+        changes = watcher.update({"engine": Engine("V8", 12)})
+        assert set(changes) == {"engine"}
+        changes = watcher.update({"engine": Engine("V6", 12)})
+        assert changes["name"] == PathChange(("engine", "name"), "V8", "V6")
+
+    @staticmethod
+    def test_objects_changed_in_place() -> None:
+        engine = Engine("V8", 8)
+        watcher = PathWatcher({"engine": ("engine",)}, dig_objects=True)
+        watcher.update({"engine": engine})
+
+        assert watcher.update({"engine": engine}) == {}
+        engine.cylinders = 12
+        assert set(watcher.update({"engine": engine})) == {"engine"}
+
+    @staticmethod
+    def test_objects_without_dig_objects_are_compared_by_identity() -> None:
+        engine = Opaque()
+        watcher = PathWatcher({"engine": ("engine",)})
+        watcher.update({"engine": engine})
+
+        engine.name = "changed in place, unseen without dig_objects"
+        assert watcher.update({"engine": engine}) == {}
+        assert set(watcher.update({"engine": Opaque()})) == {"engine"}
+
+    @staticmethod
+    def test_reset_and_compiled_paths() -> None:
+        watcher = PathWatcher(compile_paths(PATHS))
+        watcher.update(document())
+        watcher.reset()
+
+        assert set(watcher.update(document())) == set(PATHS)
+        assert len(watcher) == len(PATHS)